@@ -0,0 +1,222 @@
+"""
+DevLog CLI
+워크플로우 단계를 하나의 프로세스에서 실행하는 진입점입니다.
+
+    python .github/scripts/devlog daily --date 2025-11-12 --use-gpt
+    python .github/scripts/devlog daily --date 2025-06-01 --until 2025-11-12
+    python .github/scripts/devlog weekly --date 2025-11-12 --use-gpt
+    python .github/scripts/devlog monthly --year 2025 --month 11
+    python .github/scripts/devlog summary
+    python .github/scripts/devlog notify --webhook-url URL --type daily --devlog-file FILE
+
+단계마다 인터프리터를 새로 띄우지 않으므로 jinja2/openai 임포트, 커밋 캐시 로드,
+git 범위 조회(commit_cache.load_commits), LLM 클라이언트(동시성 상한/응답 캐시)가
+모든 단계에서 공유됩니다. `daily --until`로 여러 날짜를 재생성하면 컴파일된
+템플릿(templates.py)도 한 번만 만들어 재사용합니다.
+"""
+
+import argparse
+import datetime
+import os
+import sys
+from pathlib import Path
+
+# generate_summary.py는 .github/scripts에 위치
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+DAILY_DIR = "Documents/DevLog/Daily"
+WEEKLY_DIR = "Documents/DevLog/Weekly"
+
+
+def set_output(name, value):
+    """GitHub Actions step output 기록 (로컬 실행 시 출력만)"""
+    print(f"{name}={value}")
+    output = os.environ.get("GITHUB_OUTPUT")
+    if output:
+        with open(output, "a", encoding="utf-8") as f:
+            f.write(f"{name}={value}\n")
+
+
+def run_summary(args=None):
+    import generate_summary
+
+    argv = []
+    if args is not None and getattr(args, "full", False):
+        argv.append("--full")
+    generate_summary.main(argv)
+    return 0
+
+
+def date_range(start, until=None):
+    """start부터 until까지(포함) YYYY-MM-DD 목록"""
+    first = datetime.datetime.strptime(start, "%Y-%m-%d").date()
+    last = datetime.datetime.strptime(until, "%Y-%m-%d").date() if until else first
+    return [(first + datetime.timedelta(days=i)).isoformat() for i in range((last - first).days + 1)]
+
+
+def run_daily(args):
+    import build_daily_log
+
+    options = ["--branch", args.branch]
+    if args.use_gpt:
+        options.append("--use-gpt")
+    if args.no_cache:
+        options.append("--no-cache")
+    if args.gpt_concurrency:
+        options += ["--gpt-concurrency", str(args.gpt_concurrency)]
+    dates = date_range(args.date, args.until)
+    if len(dates) > 1 and not args.use_gpt:
+        # GPT 없는 백필은 컴파일된 템플릿 하나로 일괄 렌더링
+        build_daily_log.build_many(dates, args.branch)
+    else:
+        for i, date in enumerate(dates, 1):
+            if len(dates) > 1:
+                print(f"[{i}/{len(dates)}] {date}")
+            build_daily_log.main(["--date", date] + options)
+
+    if not args.no_summary:
+        run_summary()
+
+    if args.webhook_url:
+        import send_discord
+
+        return send_discord.main([
+            "--webhook-url", args.webhook_url,
+            "--type", "daily",
+            "--devlog-file", f"{DAILY_DIR}/{args.date}.md",
+            "--date", args.date,
+        ] + (["--devlog-url", args.devlog_url] if args.devlog_url else []))
+    return 0
+
+
+def week_label_for(date_str):
+    day = datetime.datetime.strptime(date_str, "%Y-%m-%d").date() if date_str else datetime.date.today()
+    year, week, _ = day.isocalendar()
+    return f"{year}-W{week:02d}"
+
+
+def run_weekly(args):
+    import generate_weekly_gpt
+    import update_devlog
+
+    label = week_label_for(args.date)
+    set_output("week_label", label)
+    summary_file = Path(WEEKLY_DIR) / f"{label}-Summary.md"
+    cache_args = ["--no-cache"] if args.no_cache else []
+
+    argv = ["--devlog-dir", args.devlog_dir, "--out", str(summary_file)] + cache_args
+    if args.date:
+        argv += ["--date", args.date]
+    if args.coupling_weeks is not None:
+        argv += ["--coupling-weeks", str(args.coupling_weeks)]
+    code = generate_weekly_gpt.main(argv)
+    if code:
+        return code
+
+    if args.use_gpt:
+        import generate_weekly_feedback
+
+        feedback_file = Path(WEEKLY_DIR) / f"{label}-feedback.md"
+        generate_weekly_feedback.main([
+            "--weekly-file", str(summary_file),
+            "--devlog-dir", args.devlog_dir,
+            "--week-label", label,
+            "--output", str(feedback_file),
+        ] + cache_args)
+        if feedback_file.exists():
+            with summary_file.open("a", encoding="utf-8") as f:
+                f.write(feedback_file.read_text(encoding="utf-8"))
+            feedback_file.unlink()
+            print("✅ GPT weekly feedback merged")
+
+    if not args.no_summary:
+        run_summary()
+
+    try:
+        # 주간 요약/피드백은 위에서 이미 생성했으므로 메트릭/회의 연계 섹션만 GPT 없이 갱신
+        update_devlog.main(["--mode", "weekly", "--range", label, "--no-gpt"] + cache_args)
+    except FileNotFoundError as e:
+        print(f"⚠️ 주간 메트릭 갱신 건너뜀: {e}")
+    return 0
+
+
+def run_monthly(args):
+    import generate_monthly
+
+    argv = ["--devlog-dir", args.devlog_dir]
+    if args.year:
+        argv += ["--year", str(args.year)]
+    if args.month:
+        argv += ["--month", str(args.month)]
+    if args.out:
+        argv += ["--out", args.out]
+    if args.use_gpt:
+        argv.append("--use-gpt")
+    code = generate_monthly.main(argv)
+    if not code and not args.no_summary:
+        run_summary()
+    return code
+
+
+def run_notify(args):
+    import send_discord
+
+    return send_discord.main(args.extra)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(prog="devlog", description="DevLog pipeline CLI")
+    sub = ap.add_subparsers(dest="command", required=True)
+
+    daily = sub.add_parser("daily", help="Daily DevLog 생성 + SUMMARY.md 갱신 (+ Discord 알림)")
+    daily.add_argument("--date", required=True, help="기준 날짜 (YYYY-MM-DD)")
+    daily.add_argument("--until", default=None, help="지정 시 --date부터 이 날짜까지 일괄 재생성 (YYYY-MM-DD)")
+    daily.add_argument("--branch", default="main", help="브랜치 이름")
+    daily.add_argument("--use-gpt", action="store_true", help="GPT 분석 사용")
+    daily.add_argument("--no-cache", action="store_true", help="GPT 응답 캐시를 사용하지 않음")
+    daily.add_argument("--gpt-concurrency", type=int, default=None, help="동시 GPT 요청 수")
+    daily.add_argument("--no-summary", action="store_true", help="SUMMARY.md 갱신 생략")
+    daily.add_argument("--webhook-url", default=None, help="지정 시 Discord 알림 전송")
+    daily.add_argument("--devlog-url", default=None, help="Discord 알림에 넣을 DevLog URL")
+    daily.set_defaults(func=run_daily)
+
+    weekly = sub.add_parser("weekly", help="주간 요약 (+ GPT 피드백) + SUMMARY.md + 주간 메트릭 갱신")
+    weekly.add_argument("--date", default=None, help="기준 날짜 (YYYY-MM-DD, 비워두면 이번 주)")
+    weekly.add_argument("--devlog-dir", default=DAILY_DIR, help="Daily DevLog 디렉토리")
+    weekly.add_argument("--use-gpt", action="store_true", help="GPT 주간 피드백 추가")
+    weekly.add_argument("--no-cache", action="store_true", help="GPT 응답 캐시를 사용하지 않음")
+    weekly.add_argument("--no-summary", action="store_true", help="SUMMARY.md 갱신 생략")
+    weekly.add_argument("--coupling-weeks", type=int, default=None, help="모듈 결합도 분석 구간 (주, 0이면 생략)")
+    weekly.set_defaults(func=run_weekly)
+
+    monthly = sub.add_parser("monthly", help="월간 리포트 + SUMMARY.md 갱신")
+    monthly.add_argument("--year", type=int, default=None)
+    monthly.add_argument("--month", type=int, default=None)
+    monthly.add_argument("--out", default=None, help="출력 파일 경로")
+    monthly.add_argument("--devlog-dir", default=DAILY_DIR, help="Daily DevLog 디렉토리")
+    monthly.add_argument("--use-gpt", action="store_true", help="GPT 월간 요약 추가")
+    monthly.add_argument("--no-summary", action="store_true", help="SUMMARY.md 갱신 생략")
+    monthly.set_defaults(func=run_monthly)
+
+    summary = sub.add_parser("summary", help="SUMMARY.md 갱신")
+    summary.add_argument("--full", action="store_true", help="manifest를 무시하고 전체 재스캔")
+    summary.set_defaults(func=run_summary)
+
+    notify = sub.add_parser("notify", help="Discord 알림 전송 (send_discord.py 인자 그대로 전달)")
+    notify.set_defaults(func=run_notify)
+
+    # notify는 나머지 인자를 send_discord.py로 그대로 넘김
+    args, extra = ap.parse_known_args(argv)
+    if extra and args.command != "notify":
+        ap.error(f"unrecognized arguments: {' '.join(extra)}")
+    args.extra = extra
+    if args.command == "daily" and args.until:
+        if args.until < args.date:
+            ap.error("--until은 --date 이후 날짜여야 합니다")
+        if args.webhook_url:
+            ap.error("--webhook-url은 단일 날짜 생성에서만 사용할 수 있습니다")
+    return args.func(args) or 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -11,30 +11,31 @@ It performs all operations and writes the final .md and .metrics.json files once
 """
 
 import argparse
-import subprocess
 import json
 import re
-import os
 from pathlib import Path
 from datetime import datetime, timedelta, timezone
 from collections import Counter
 from typing import Dict, List, Optional, Tuple
 
-from jinja2 import Template
+from commit_cache import load_commits
+from git_commits import format_stat
+from llm_client import configure, get_client, run_concurrently
+from meeting_index import find_meeting
+from metrics_store import record as record_metrics
+from prompt_budget import Section, fit_sections
+from templates import render as render_template, render_many
+from tracing import span, traced
 
-
-def sh(cmd: str) -> str:
-    """Executes a shell command and returns its output."""
-    try:
-        return subprocess.check_output(cmd, shell=True, text=True, errors="ignore").strip()
-    except subprocess.CalledProcessError:
-        return ""
+# Token budget for the DevLog + commit sections of the growth feedback prompt
+FEEDBACK_PROMPT_BUDGET = 3000
 
 
+@traced("stats.git")
 def get_git_stats(since: str, until: str) -> Dict:
     """Collects detailed statistics for commits within a given time range."""
-    commits_hashes = sh(f'git log --since="{since}" --until="{until}" --pretty=format:"%H"').splitlines()
-    if not commits_hashes:
+    commits = load_commits(since, until)
+    if not commits:
         return {
             "count": 0, "details": [], "added": 0, "deleted": 0,
             "hotspot_files": [], "files_changed": 0, "authors": [], "commit_types": {}
@@ -46,19 +47,13 @@ def get_git_stats(since: str, until: str) -> Dict:
     commit_types = Counter()
     details = []
 
-    for h in commits_hashes:
-        meta = sh(f'git show --format="%s||%an" --no-patch {h}')
-        subject, author = (meta.split("||", 1) + ["Unknown"])[:2]
-        authors.add(author)
+    for c in commits:
+        subject = c["subject"]
+        authors.add(c["author"] or "Unknown")
 
-        numstat = sh(f'git show --numstat --format="" {h}')
-        for ln in numstat.splitlines():
-            m = re.match(r"(\d+|-)\s+(\d+|-)\s+(.+)", ln)
-            if m:
-                a, d, f = m.groups()
-                if a.isdigit(): added += int(a)
-                if d.isdigit(): deleted += int(d)
-                files_touched.add(f)
+        added += c["added"]
+        deleted += c["deleted"]
+        files_touched.update(f["path"] for f in c["files"])
 
         commit_type_match = re.match(r"^(feat|fix|docs|style|refactor|test|chore|perf)", subject.lower())
         commit_type = commit_type_match.group(1) if commit_type_match else "other"
@@ -66,7 +61,7 @@ def get_git_stats(since: str, until: str) -> Dict:
         details.append({"type": commit_type, "subject": subject})
 
     return {
-        "count": len(commits_hashes), "details": details, "added": added, "deleted": deleted,
+        "count": len(commits), "details": details, "added": added, "deleted": deleted,
         "files_changed": len(files_touched), "authors": sorted(list(authors)),
         "commit_types": dict(commit_types)
     }
@@ -92,42 +87,30 @@ def extract_top_changes(details: List[Dict], max_count: int = 3) -> List[Dict]:
 
 def get_commit_diffs_for_gpt(since: str) -> str:
     """Gets commit diff stats for GPT analysis."""
-    hashes = sh(f'git log --since="{since}" --pretty=format:"%H"').splitlines()
-    if not hashes:
+    commits = load_commits(since, rev_args=["-n", "5"])  # Limit to 5 commits for brevity
+    if not commits:
         return "분석할 커밋이 없습니다."
 
     summary = []
-    for h in hashes[:5]:  # Limit to 5 commits for brevity
-        subject = sh(f'git show --format="%s" --no-patch {h}')
-        diff_stat = sh(f'git show --stat {h}')
-        summary.append(f"**커밋 {h[:7]}**: {subject}\n{diff_stat[:300]}")
+    for c in commits:
+        summary.append(f"**커밋 {c['short']}**: {c['subject']}\n{format_stat(c)}")
     
     return "\n\n".join(summary)
 
 
 def call_gpt(system_prompt: str, user_prompt: str, model: str = "gpt-4o-mini") -> str:
-    """Calls OpenAI API and returns the response."""
-    api_key = os.getenv("OPENAI_API_KEY")
-    if not api_key:
+    """Calls OpenAI API through the shared client and returns the response."""
+    client = get_client()
+    if not client.available():
         return "GPT 분석을 건너뛰었습니다 (OPENAI_API_KEY가 설정되지 않음)."
-    
+
     try:
-        from openai import OpenAI
-        client = OpenAI(api_key=api_key)
-        response = client.chat.completions.create(
-            model=model,
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt},
-            ],
-            temperature=0.5,
-            max_tokens=2000
-        )
-        return response.choices[0].message.content.strip()
+        return client.complete(system_prompt, user_prompt, model=model, temperature=0.5, max_tokens=2000)
     except Exception as e:
         return f"GPT API 호출에 실패했습니다: {e}"
 
 
+@traced("gpt.growth_feedback")
 def generate_growth_feedback(base_devlog_content: str, since: str) -> str:
     """Generates developer growth feedback using GPT."""
     commit_diffs = get_commit_diffs_for_gpt(since)
@@ -135,9 +118,13 @@ def generate_growth_feedback(base_devlog_content: str, since: str) -> str:
     system_prompt = Path(__file__).parent / "prompt_templates" / "gpt_feedback_system.txt"
     user_prompt_template = Path(__file__).parent / "prompt_templates" / "gpt_feedback_user.txt"
 
+    sections = fit_sections([
+        Section("devlog", base_devlog_content, priority=2),
+        Section("commits", commit_diffs, priority=1, min_tokens=300),
+    ], FEEDBACK_PROMPT_BUDGET, model="gpt-4o")
     user_prompt = user_prompt_template.read_text(encoding="utf-8").format(
-        devlog_content=base_devlog_content[:3000],
-        commit_summary=commit_diffs
+        devlog_content=sections["devlog"],
+        commit_summary=sections["commits"]
     )
 
     feedback = call_gpt(system_prompt.read_text(encoding="utf-8"), user_prompt, model="gpt-4o")
@@ -155,23 +142,17 @@ def generate_growth_feedback(base_devlog_content: str, since: str) -> str:
 """
 
 
+@traced("gpt.meeting_analysis")
 def get_meeting_analysis(target_date: datetime, top_changes_formatted: str) -> str:
     """Generates meeting link analysis using GPT."""
     meeting_date = target_date - timedelta(days=1)
-    meeting_file = Path(f"Documents/Meeting/Daily/Meeting_{meeting_date.strftime('%y%m%d')}_Daily.md")
-    
-    if not meeting_file.exists():
-        # Fallback for different naming conventions if needed
-        matches = list(Path("Documents/Meeting/Daily").glob(f"Meeting_{meeting_date.strftime('%y%m%d')}*.md"))
-        if matches:
-            meeting_file = matches[0]
-        else:
-            return "이전 날짜의 회의록을 찾을 수 없습니다."
+    # Parsed once per note and shared through the meeting index sidecars
+    meeting = find_meeting(meeting_date.strftime("%Y-%m-%d"), kind="Daily")
+    if not meeting:
+        return "이전 날짜의 회의록을 찾을 수 없습니다."
 
-    meeting_content = meeting_file.read_text(encoding="utf-8")
-    keywords_match = re.search(r"- 키워드: (.+)", meeting_content)
-    keywords = keywords_match.group(1).strip() if keywords_match else "키워드 없음"
-    actions = "\n".join(re.findall(r"- \[ \] (.+)", meeting_content))
+    keywords = ", ".join(meeting["keywords"]) or "키워드 없음"
+    actions = "\n".join(meeting["open_actions"])
 
     prompt_template = Path(__file__).parent / "prompt_templates" / "meeting_link.txt"
     prompt = prompt_template.read_text(encoding="utf-8").format(
@@ -184,40 +165,75 @@ def get_meeting_analysis(target_date: datetime, top_changes_formatted: str) -> s
     return call_gpt("당신은 DevLog의 내용을 분석하고 한국어로 간결하게 요약하는 AI 어시스턴트입니다.", prompt)
 
 
-def main():
-    parser = argparse.ArgumentParser(description="Unified Daily DevLog Builder")
-    parser.add_argument("--date", required=True, help="Target date (YYYY-MM-DD)")
-    parser.add_argument("--branch", required=True, help="Current git branch")
-    parser.add_argument("--use-gpt", action="store_true", help="Enable GPT-based analysis")
-    args = parser.parse_args()
+def daily_path(date: str) -> Path:
+    return Path(f"Documents/DevLog/Daily/{date}.md")
 
-    target_date = datetime.strptime(args.date, "%Y-%m-%d")
-    since = f"{args.date} 00:00"
-    until = f"{args.date} 23:59"
 
-    # 1. Collect Data
+def collect_context(date: str, branch: str) -> Tuple[Dict, Dict]:
+    """Collects git stats for one day and builds the daily template context."""
+    target_date = datetime.strptime(date, "%Y-%m-%d")
     print("📊 Git 통계 수집 중...")
-    git_stats = get_git_stats(since, until)
+    git_stats = get_git_stats(f"{date} 00:00", f"{date} 23:59")
     top_changes = extract_top_changes(git_stats["details"])
 
-    # 2. Prepare context for Jinja2 template
     weekday_names = ["월", "화", "수", "목", "금", "토", "일"]
     context = {
-        "date": args.date,
+        "date": date,
         "weekday": weekday_names[target_date.weekday()],
-        "branch": args.branch,
+        "branch": branch,
         "commit_count": git_stats["count"],
         "added": git_stats["added"],
         "deleted": git_stats["deleted"],
         "top_changes": top_changes,
         "generation_time": datetime.now(timezone(timedelta(hours=9))).strftime("%Y-%m-%d %H:%M:%S KST")
     }
+    return context, git_stats
+
+
+def write_metrics(date: str, branch: str, git_stats: Dict, top_changes: List[Dict], output_md_path: Path) -> None:
+    """Writes the .metrics.json next to the daily DevLog and records it in the metrics store."""
+    metrics_data = {
+        "date": date,
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "period": {"since": f"{date} 00:00", "until": f"{date} 23:59"},
+        "branch": branch,
+        "commit_count": git_stats["count"],
+        "author_count": len(git_stats["authors"]),
+        "authors": git_stats["authors"],
+        "commit_types": git_stats["commit_types"],
+        "additions": git_stats["added"],
+        "deletions": git_stats["deleted"],
+        "files_changed": git_stats["files_changed"],
+        "top_changes": top_changes,
+    }
+    output_metrics_path = output_md_path.with_suffix(".metrics.json")
+    with span("write.metrics"):
+        output_metrics_path.write_text(json.dumps(metrics_data, ensure_ascii=False, indent=2), encoding="utf-8")
+        record_metrics(date, metrics_data, output_metrics_path)
+    print(f"✅ Metrics JSON 생성 완료: {output_metrics_path}")
+
+
+@traced("build_daily_log")
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Unified Daily DevLog Builder")
+    parser.add_argument("--date", required=True, help="Target date (YYYY-MM-DD)")
+    parser.add_argument("--branch", required=True, help="Current git branch")
+    parser.add_argument("--use-gpt", action="store_true", help="Enable GPT-based analysis")
+    parser.add_argument("--gpt-concurrency", type=int, default=None, help="Max concurrent GPT requests")
+    parser.add_argument("--no-cache", action="store_true", help="Bypass the GPT response cache")
+    args = parser.parse_args(argv)
+
+    target_date = datetime.strptime(args.date, "%Y-%m-%d")
+    since = f"{args.date} 00:00"
+
+    # 1-2. Collect data and prepare the template context
+    context, git_stats = collect_context(args.date, args.branch)
+    top_changes = context["top_changes"]
 
     # 3. Render base DevLog from template
     print("📝 기본 DevLog 템플릿 렌더링 중...")
-    template_path = Path(__file__).parent / "daily_template.md"
-    template = Template(template_path.read_text(encoding="utf-8"))
-    base_md_content = template.render(**context)
+    with span("render.daily"):
+        base_md_content = render_template("daily_template.md", context)
 
     # 4. (Optional) Generate GPT content
     growth_feedback_content = ""
@@ -226,12 +242,16 @@ def main():
     if args.use_gpt:
         print("🤖 GPT 분석 생성 중 (성장 피드백 및 회의록 연계)...")
         top_changes_str = "\n".join([f"- {c['summary']}" for c in top_changes])
-        
-        # Meeting analysis
-        meeting_analysis_content = get_meeting_analysis(target_date, top_changes_str)
-        
-        # Growth feedback
-        growth_feedback_content = generate_growth_feedback(base_md_content, since)
+        if args.gpt_concurrency or args.no_cache:
+            configure(concurrency=args.gpt_concurrency, cache=False if args.no_cache else None)
+
+        # Meeting analysis and growth feedback are independent, so run them concurrently
+        results = run_concurrently({
+            "meeting": lambda: get_meeting_analysis(target_date, top_changes_str),
+            "feedback": lambda: generate_growth_feedback(base_md_content, since),
+        })
+        meeting_analysis_content = results["meeting"]
+        growth_feedback_content = results["feedback"]
 
     # 5. Combine all parts
     final_md_content = base_md_content
@@ -240,9 +260,10 @@ def main():
     meeting_section_header = "## 3. 회의 연계 분석"
     if meeting_analysis_content:
         if meeting_section_header in final_md_content:
-             final_md_content = re.sub(
+            # Callable replacement: backslashes in GPT output are not read as group references
+            final_md_content = re.sub(
                 rf"({meeting_section_header}\n)[\s\S]*?(\n## |$)",
-                f"\\1{meeting_analysis_content}\n\n\\2",
+                lambda m: f"{m.group(1)}{meeting_analysis_content}\n\n{m.group(2)}",
                 final_md_content,
                 count=1
             )
@@ -254,29 +275,35 @@ def main():
         final_md_content += growth_feedback_content
 
     # 6. Write final .md file
-    output_md_path = Path(f"Documents/DevLog/Daily/{args.date}.md")
+    output_md_path = daily_path(args.date)
     output_md_path.parent.mkdir(parents=True, exist_ok=True)
-    output_md_path.write_text(final_md_content, encoding="utf-8")
+    with span("write.devlog"):
+        output_md_path.write_text(final_md_content, encoding="utf-8")
     print(f"✅ Daily DevLog 생성 완료: {output_md_path}")
 
     # 7. Generate and write .metrics.json file
-    metrics_data = {
-        "date": args.date,
-        "generated_at": datetime.now(timezone.utc).isoformat(),
-        "period": {"since": since, "until": until},
-        "branch": args.branch,
-        "commit_count": git_stats["count"],
-        "author_count": len(git_stats["authors"]),
-        "authors": git_stats["authors"],
-        "commit_types": git_stats["commit_types"],
-        "additions": git_stats["added"],
-        "deletions": git_stats["deleted"],
-        "files_changed": git_stats["files_changed"],
-        "top_changes": top_changes,
-    }
-    output_metrics_path = output_md_path.with_suffix(".metrics.json")
-    output_metrics_path.write_text(json.dumps(metrics_data, ensure_ascii=False, indent=2), encoding="utf-8")
-    print(f"✅ Metrics JSON 생성 완료: {output_metrics_path}")
+    write_metrics(args.date, args.branch, git_stats, top_changes, output_md_path)
+
+
+@traced("build_daily_log.batch")
+def build_many(dates: List[str], branch: str) -> int:
+    """Renders several dates (no GPT) from one compiled template; returns the number of files that changed."""
+    jobs = []
+    stats = []
+    for i, date in enumerate(dates, 1):
+        print(f"[{i}/{len(dates)}] {date}")
+        context, git_stats = collect_context(date, branch)
+        jobs.append((context, daily_path(date)))
+        stats.append((date, git_stats, context["top_changes"]))
+
+    print(f"📝 {len(jobs)}개 날짜 DevLog 일괄 렌더링 중...")
+    written = render_many("daily_template.md", jobs)
+    print(f"✅ Daily DevLog {len(jobs)}개 생성 완료 (변경 {written}개)")
+
+    for date, git_stats, top_changes in stats:
+        write_metrics(date, branch, git_stats, top_changes, daily_path(date))
+    return written
+
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,102 @@
+"""
+Commit Cache
+커밋 SHA를 키로 하는 append-only JSONL 캐시입니다.
+
+커밋은 불변이므로 한 번 파싱한 numstat/제목/작성자 정보를 재사용하고,
+캐시에 없는 커밋만 단일 `git log --stdin --no-walk` 호출로 채웁니다.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from git_commits import iter_commits, list_hashes
+from paths import STATE_DIR
+from tracing import traced
+
+DEFAULT_CACHE_PATH = STATE_DIR / "commit_cache.jsonl"
+
+
+class CommitCache:
+    def __init__(self, path: Optional[Path] = None, cwd: Optional[str] = None):
+        self.path = Path(path) if path else DEFAULT_CACHE_PATH
+        self.cwd = cwd
+        self.records: Dict[str, Dict] = {}
+        self._load()
+
+    def _load(self) -> None:
+        """캐시 파일 로드 (중단된 마지막 줄 등 손상된 줄은 무시)"""
+        if not self.path.exists():
+            return
+        with self.path.open(encoding="utf-8") as fh:
+            for line in fh:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if isinstance(record, dict) and record.get("hash"):
+                    self.records[record["hash"]] = record
+
+    def _append(self, commits: Sequence[Dict]) -> None:
+        if not commits:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a", encoding="utf-8") as fh:
+            for c in commits:
+                fh.write(json.dumps(c, ensure_ascii=False) + "\n")
+        for c in commits:
+            self.records[c["hash"]] = c
+
+    def fill(self, hashes: Sequence[str]) -> int:
+        """캐시에 없는 커밋만 조회하여 추가, 새로 추가된 수 반환"""
+        missing = [h for h in dict.fromkeys(hashes) if h not in self.records]
+        if not missing:
+            return 0
+        fetched = list(iter_commits(revisions=missing, cwd=self.cwd))
+        self._append(fetched)
+        return len(fetched)
+
+    def get_range(
+        self,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        rev_args: Sequence[str] = (),
+    ) -> List[Dict]:
+        """범위 내 커밋 레코드 반환 (git log 순서 유지)"""
+        hashes = list_hashes(since, until, rev_args=rev_args, cwd=self.cwd)
+        self.fill(hashes)
+        return [self.records[h] for h in hashes if h in self.records]
+
+
+# 한 프로세스에서 여러 단계가 실행될 때(devlog CLI) 캐시 로드와 범위 조회를 공유
+_shared_caches: Dict[Optional[str], CommitCache] = {}
+_range_results: Dict[Tuple, List[Dict]] = {}
+
+
+def shared_cache(cwd: Optional[str] = None) -> CommitCache:
+    """프로세스 전역 캐시 인스턴스 (JSONL은 한 번만 로드)"""
+    if cwd not in _shared_caches:
+        _shared_caches[cwd] = CommitCache(cwd=cwd)
+    return _shared_caches[cwd]
+
+
+def cache_enabled() -> bool:
+    """DEVLOG_COMMIT_CACHE=0 으로 캐시를 끌 수 있음"""
+    return os.environ.get("DEVLOG_COMMIT_CACHE", "1").lower() not in ("0", "false", "no")
+
+
+@traced("git.load_commits")
+def load_commits(
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    rev_args: Sequence[str] = (),
+    cwd: Optional[str] = None,
+) -> List[Dict]:
+    """캐시를 거쳐 범위 내 커밋 레코드 반환 (같은 프로세스의 동일 범위 조회는 재사용)"""
+    if not cache_enabled():
+        return list(iter_commits(since, until, rev_args=rev_args, cwd=cwd))
+    key = (cwd, since, until, tuple(rev_args))
+    if key not in _range_results:
+        _range_results[key] = shared_cache(cwd).get_range(since, until, rev_args=rev_args)
+    return list(_range_results[key])
@@ -0,0 +1,153 @@
+"""
+Change Coupling
+`gen_commit_msg.guess_scope` 규칙으로 커밋을 모듈(scope) 단위로 묶어, 함께 바뀌는 모듈 쌍을 찾습니다.
+
+- 커밋별 (날짜, {scope: churn})만 STATE_DIR에 누적하고, 마지막 tip 이후 커밋만 한 번의 `git log`로 추가합니다
+  (tip이 사라지거나 히스토리가 바뀌면 처음부터 다시 만듦, git_commits.sync_from_tips).
+- 구간 분석은 scope 쌍 Counter(희소 공변경 행렬)로 support(함께 바뀐 커밋 수)와
+  confidence(A가 바뀐 커밋 중 B도 바뀐 비율, 양방향 중 큰 값)를 계산합니다.
+
+    python .github/scripts/devlog/coupling.py --weeks 12
+"""
+
+import argparse
+import datetime
+import json
+import sys
+from collections import Counter
+from itertools import combinations
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from git_commits import sync_from_tips
+from paths import STATE_DIR
+from tracing import traced
+
+# Tools/CommitMessage/gen_commit_msg.py의 모듈 규칙을 그대로 사용
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "Tools" / "CommitMessage"))
+from gen_commit_msg import guess_scope  # noqa: E402
+
+INDEX_PATH = STATE_DIR / "coupling_index.json"
+INDEX_VERSION = 1
+DEFAULT_WEEKS = 12
+MIN_SUPPORT = 2
+# 한 번에 많은 모듈을 건드린 커밋(대규모 포맷/이동)은 결합도 잡음이므로 제외
+MAX_SCOPES_PER_COMMIT = 8
+
+
+class CouplingIndex:
+    def __init__(self, path: Optional[Path] = None, cwd: Optional[str] = None):
+        self.path = Path(path) if path else INDEX_PATH
+        self.cwd = cwd
+        self.tips: List[str] = []
+        self.scopes: List[str] = []
+        self.commits: List[List] = []  # [날짜, [[scope id, churn], ...]] 오래된 순
+        self._ids: Dict[str, int] = {}
+        self._load()
+
+    def reset(self) -> None:
+        self.scopes = []
+        self.commits = []
+        self._ids = {}
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return
+        if data.get("version") != INDEX_VERSION:
+            return
+        self.tips = data.get("tips", [])
+        self.scopes = data.get("scopes", [])
+        self.commits = data.get("commits", [])
+        self._ids = {name: i for i, name in enumerate(self.scopes)}
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        data = {"version": INDEX_VERSION, "tips": self.tips, "scopes": self.scopes, "commits": self.commits}
+        tmp.write_text(json.dumps(data, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+        tmp.replace(self.path)
+
+    def _scope_id(self, name: str) -> int:
+        if name not in self._ids:
+            self._ids[name] = len(self.scopes)
+            self.scopes.append(name)
+        return self._ids[name]
+
+    def apply(self, commit: Dict) -> None:
+        churn = Counter()
+        for f in commit["files"]:
+            churn[self._scope_id(guess_scope(f["path"]))] += (f["added"] or 0) + (f["deleted"] or 0)
+        if churn:
+            self.commits.append([commit["date"][:10], sorted(churn.items())])
+
+    @traced("index.coupling_update")
+    def update(self, rev_args: Sequence[str] = ("HEAD",)) -> int:
+        """마지막 tip 이후의 새 커밋만 반영하고 저장, 반영한 커밋 수 반환"""
+        return sync_from_tips(self, rev_args, ("--no-merges",))
+
+    def analyze(self, since: str, until: str, top: int = 10, min_support: int = MIN_SUPPORT) -> Dict:
+        """since ~ until (포함, YYYY-MM-DD) 모듈별 churn과 결합도 상위 쌍"""
+        changes = Counter()
+        churn = Counter()
+        pairs = Counter()
+        window = 0
+        for date, entries in self.commits:
+            if not since <= date <= until:
+                continue
+            window += 1
+            ids = [sid for sid, _ in entries]
+            for sid, lines in entries:
+                changes[sid] += 1
+                churn[sid] += lines
+            if 1 < len(ids) <= MAX_SCOPES_PER_COMMIT:
+                pairs.update(combinations(ids, 2))  # ids는 정렬되어 있어 (a, b) 순서가 일정
+
+        coupled = []
+        for (a, b), support in pairs.items():
+            if support < min_support:
+                continue
+            confidence = max(support / changes[a], support / changes[b])
+            coupled.append({
+                "a": self.scopes[a], "b": self.scopes[b],
+                "support": support, "confidence": round(confidence, 2),
+            })
+        coupled.sort(key=lambda p: (-p["support"], -p["confidence"], p["a"], p["b"]))
+
+        return {
+            "since": since, "until": until, "commits": window,
+            "modules": [
+                {"scope": self.scopes[sid], "commits": changes[sid], "churn": churn[sid]}
+                for sid in sorted(changes, key=lambda s: (-churn[s], self.scopes[s]))[:top]
+            ],
+            "pairs": coupled[:top],
+        }
+
+
+def analyze_window(until: datetime.date, weeks: int = DEFAULT_WEEKS, top: int = 10, cwd: Optional[str] = None) -> Dict:
+    """until 기준 최근 weeks 주 결합도 분석 (인덱스를 HEAD까지 갱신 후)"""
+    index = CouplingIndex(cwd=cwd)
+    index.update()
+    since = until - datetime.timedelta(weeks=weeks) + datetime.timedelta(days=1)
+    result = index.analyze(since.isoformat(), until.isoformat(), top=top)
+    result["weeks"] = weeks
+    return result
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Module change-coupling analysis")
+    ap.add_argument("--until", default=None, help="종료 날짜 (YYYY-MM-DD, 기본: 오늘)")
+    ap.add_argument("--weeks", type=int, default=DEFAULT_WEEKS, help="분석 구간 (주)")
+    ap.add_argument("--top", type=int, default=10, help="출력할 쌍 수")
+    args = ap.parse_args(argv)
+
+    until = datetime.date.fromisoformat(args.until) if args.until else datetime.date.today()
+    print(json.dumps(analyze_window(until, args.weeks, args.top), ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
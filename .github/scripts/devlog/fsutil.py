@@ -0,0 +1,23 @@
+"""
+File Utilities
+생성 산출물을 기록할 때 쓰는 공용 파일 헬퍼입니다.
+"""
+
+from pathlib import Path
+
+
+def write_if_changed(path: Path, content: str) -> bool:
+    """내용이 기존 파일과 바이트 단위로 다를 때만 기록하고 기록 여부 반환
+
+    변경 없는 재생성이 mtime을 갱신해 HonKit 재빌드나 불필요한 커밋을 유발하지 않도록 합니다.
+    """
+    path = Path(path)
+    data = content.encode("utf-8")
+    try:
+        if path.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return True
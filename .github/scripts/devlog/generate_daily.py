@@ -5,61 +5,44 @@ Daily DevLog Generator
 """
 
 import argparse
-import subprocess
 import json
 import re
 import datetime
 from collections import Counter
 from pathlib import Path
-from jinja2 import Template
 
-def sh(cmd):
-    """셸 명령 실행"""
-    try:
-        return subprocess.check_output(cmd, shell=True, text=True, errors="ignore").strip()
-    except subprocess.CalledProcessError:
-        return ""
+from commit_cache import load_commits
+from hotspot_index import rank_hotspots
+from metrics_store import record as record_metrics
+from templates import render as render_template
+from test_reports import analyze_tests
+from tracing import span, traced
+from ue_logs import empty_cook_stats, empty_ubt_stats, format_cook_summary, format_ubt_summary, parse_cook_log, parse_ubt_log
 
 def git_range_since(since, until=None):
-    """특정 시간 범위의 커밋 해시 목록 반환"""
-    cmd = f'git log --since="{since}"'
-    if until:
-        cmd += f' --until="{until}"'
-    cmd += ' --pretty=format:"%H"'
-    result = sh(cmd)
-    return result.splitlines() if result else []
+    """특정 시간 범위의 커밋 목록 반환 (SHA 캐시 경유)"""
+    return load_commits(since, until)
 
+@traced("stats.git")
 def git_stats(commits):
     """커밋 통계 수집"""
     added = deleted = 0
     details = []
-    hotspot_files = {}
     files_touched = set()
     authors = set()
     commit_types = Counter()
 
-    for h in commits:
-        # 커밋 메타데이터 가져오기
-        meta = sh(f'git show --format="%s||%h||%an" --no-patch {h}')
-        if not meta:
-            continue
-
-        subject, short, author = meta.split("||") if "||" in meta else (meta, h[:7], "Unknown")
+    for c in commits:
+        subject, short, author = c["subject"], c["short"], c["author"] or "Unknown"
         authors.add(author)
 
         # 변경 파일 통계
-        numstat = sh(f'git show --numstat --format="" {h}')
-        for ln in numstat.splitlines():
-            m = re.match(r"(\d+|-)\s+(\d+|-)\s+(.+)", ln)
-            if not m:
+        for f in c["files"]:
+            if f["added"] is None or f["deleted"] is None:
                 continue
-            a, d, f = m.groups()
-            if a != '-' and d != '-':
-                added += int(a)
-                deleted += int(d)
-                # Hotspot 파일 추적
-                hotspot_files[f] = hotspot_files.get(f, 0) + int(a) + int(d)
-                files_touched.add(f)
+            added += f["added"]
+            deleted += f["deleted"]
+            files_touched.add(f["path"])
 
         # Conventional Commits 파싱
         commit_type = parse_commit_type(subject)
@@ -72,9 +55,8 @@ def git_stats(commits):
             "type": commit_type
         })
 
-    # 상위 5개 hotspot 파일
-    top_hotspots = sorted(hotspot_files.items(), key=lambda x: x[1], reverse=True)[:5]
-    hotspot_list = [f for f, _ in top_hotspots]
+    # 상위 5개 hotspot 파일 (이름 변경/바이너리 인식, 변경 빈도 → churn 순)
+    hotspot_list = [h["path"] for h in rank_hotspots(commits, 5)] if commits else []
 
     return {
         "added": added,
@@ -95,65 +77,24 @@ def parse_commit_type(subject):
     return "other"
 
 def parse_ubt_summary(path):
-    """UnrealBuildTool 로그 파싱"""
-    d = {"success": None, "target": "", "errors": 0}
-    p = Path(path)
-    if not p.exists():
-        return d
-
+    """UnrealBuildTool 로그 파싱 (ue_logs 스트리밍 파서 사용, 읽지 못하면 빈 통계)"""
     try:
-        txt = p.read_text(errors="ignore", encoding="utf-8")
-        d["success"] = ("Error" not in txt and "BUILD FAILED" not in txt)
-        m = re.search(r"Building\s+(.+?)\s+-\s+(.+)", txt)
-        if m:
-            d["target"] = m.group(1).strip()
-        d["errors"] = len(re.findall(r": error:", txt))
-    except:
-        pass
-
-    return d
+        return parse_ubt_log(path)
+    except Exception:
+        return empty_ubt_stats()
 
 def parse_cook_summary(path):
-    """Cook 로그 파싱"""
-    d = {"cooked": 0, "skipped": 0, "errors": 0}
-    p = Path(path)
-    if not p.exists():
-        return d
-
+    """Cook 로그 파싱 (ue_logs 스트리밍 파서 사용, 읽지 못하면 빈 통계)"""
     try:
-        txt = p.read_text(errors="ignore", encoding="utf-8")
-        m = re.search(r"Cooked\s+(\d+)", txt)
-        d["cooked"] = int(m.group(1)) if m else 0
-        m = re.search(r"Skipped\s+(\d+)", txt)
-        d["skipped"] = int(m.group(1)) if m else 0
-        d["errors"] = len(re.findall(r"\bError\b", txt))
-    except:
-        pass
-
-    return d
-
-def parse_tests(junit_xml):
-    """JUnit XML 테스트 결과 파싱"""
-    p = Path(junit_xml)
-    if not p.exists():
-        return {"pass": None, "fail": None, "coverage": None}
+        return parse_cook_log(path)
+    except Exception:
+        return empty_cook_stats()
 
+def parse_tests(junit_xml, date=None):
+    """JUnit XML 테스트 결과 파싱 (iterparse 스트리밍 + 테스트별 소요 시간 이력)"""
     try:
-        from lxml import etree
-        root = etree.parse(str(p))
-        total_tests = int(root.xpath("sum(//testsuite/@tests)") or 0)
-        failures = int(root.xpath("sum(//testsuite/@failures)") or 0)
-        errors = int(root.xpath("sum(//testsuite/@errors)") or 0)
-        t_pass = total_tests - failures - errors
-        t_fail = failures + errors
-
-        cov = None
-        covnode = root.xpath("//properties/property[@name='coverage']/@value")
-        if covnode:
-            cov = float(covnode[0])
-
-        return {"pass": t_pass, "fail": t_fail, "coverage": cov}
-    except:
+        return analyze_tests(junit_xml, date or datetime.date.today().isoformat())
+    except Exception:
         return {"pass": None, "fail": None, "coverage": None}
 
 def parse_static(report_json):
@@ -217,15 +158,16 @@ def get_impact_brief(commit_type):
     }
     return impact_map.get(commit_type, "기타 변경")
 
+@traced("render.daily")
 def render(context, template_path, out_path):
-    """Jinja2 템플릿 렌더링"""
-    template_content = Path(template_path).read_text(encoding="utf-8")
-    md = Template(template_content).render(**context)
+    """Jinja2 템플릿 렌더링 (공용 환경의 컴파일 캐시 사용)"""
+    md = render_template(template_path, context)
 
     Path(out_path).parent.mkdir(parents=True, exist_ok=True)
     Path(out_path).write_text(md, encoding="utf-8")
 
-def main():
+@traced("generate_daily")
+def main(argv=None):
     ap = argparse.ArgumentParser(description="Daily DevLog Generator")
     ap.add_argument("--since", default="24 hours", help="Git log 시작 시간")
     ap.add_argument("--until", default=None, help="Git log 종료 시간 (선택)")
@@ -239,7 +181,7 @@ def main():
     ap.add_argument("--static_report", default="", help="정적분석 리포트 경로")
     ap.add_argument("--metrics", default="", help="메트릭 JSON 경로")
     ap.add_argument("--metrics-out", default="", help="메트릭 JSON 출력 경로")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     # 템플릿 경로 설정
     if not args.template:
@@ -251,7 +193,7 @@ def main():
     gstats = git_stats(commits)
     ubt = parse_ubt_summary(args.ubt_log) if args.ubt_log else {}
     cook = parse_cook_summary(args.cook_log) if args.cook_log else {}
-    tests = parse_tests(args.test_xml) if args.test_xml else {}
+    tests = parse_tests(args.test_xml, datetime.date.today().isoformat()) if args.test_xml else {}
     srep = parse_static(args.static_report) if args.static_report else {}
     met = load_metrics(args.metrics) if args.metrics else {}
 
@@ -294,7 +236,9 @@ def main():
 
     metrics_path = Path(args.metrics_out) if args.metrics_out else Path(args.out).with_suffix(".metrics.json")
     metrics_path.parent.mkdir(parents=True, exist_ok=True)
-    metrics_path.write_text(json.dumps(metrics_output, ensure_ascii=False, indent=2), encoding="utf-8")
+    with span("write.metrics"):
+        metrics_path.write_text(json.dumps(metrics_output, ensure_ascii=False, indent=2), encoding="utf-8")
+        record_metrics(today.isoformat(), metrics_output, metrics_path)
 
     # 컨텍스트 구성
     ctx = {
@@ -311,10 +255,16 @@ def main():
         "hotspot_files": gstats["hotspot_files"],
         "top_changes": top_changes,
         "ubt_target": ubt.get("target", ""),
-        "cook_summary": f'cooked {cook.get("cooked", 0)}, skipped {cook.get("skipped", 0)}, errors {cook.get("errors", 0)}',
+        "ubt_summary": format_ubt_summary(ubt),
+        "ubt_modules": ubt.get("modules", [])[:5],
+        "ubt_errors": ubt.get("error_records", [])[:5],
+        "cook_summary": format_cook_summary(cook),
+        "cook_slowest": cook.get("slowest_assets", [])[:5],
         "pass": tests.get("pass"),
         "fail": tests.get("fail"),
         "coverage": tests.get("coverage"),
+        "slowest_tests": tests.get("slowest", [])[:5],
+        "newly_slow_tests": tests.get("newly_slow", []),
         "warn_now": metrics_output.get("static_analysis", {}).get("warn_now"),
         "warn_prev": metrics_output.get("static_analysis", {}).get("warn_prev", 0),
         "high_new": metrics_output.get("static_analysis", {}).get("high_new", 0),
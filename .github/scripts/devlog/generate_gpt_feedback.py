@@ -5,60 +5,53 @@ GPT Feedback Generator for DevLog
 """
 
 import argparse
-import subprocess
-import os
 from pathlib import Path
-from openai import OpenAI
 
-def sh(cmd):
-    """셸 명령 실행"""
-    try:
-        return subprocess.check_output(cmd, shell=True, text=True, errors="ignore").strip()
-    except subprocess.CalledProcessError:
-        return ""
+from commit_cache import load_commits
+from git_commits import format_stat
+from llm_client import configure, get_client
+from prompt_budget import Section, fit_sections
+
+# DevLog + 커밋 섹션에 쓸 프롬프트 토큰 예산
+PROMPT_BUDGET = 3000
+# 프롬프트에 넣을 최근 커밋 수 상한 (예산이 부족하면 오래된 커밋부터 제외)
+MAX_COMMITS = 10
 
 def get_commit_details(since):
     """최근 커밋의 상세 정보 수집"""
     commits = []
 
-    # 커밋 해시 목록 가져오기
-    hashes = sh(f'git log --since="{since}" --pretty=format:"%H"')
-    if not hashes:
-        return commits
-
-    for h in hashes.splitlines():
-        # 커밋 메시지
-        subject = sh(f'git show --format="%s" --no-patch {h}')
-        body = sh(f'git show --format="%b" --no-patch {h}')
-        author = sh(f'git show --format="%an" --no-patch {h}')
-
-        # 변경된 파일 목록
-        files = sh(f'git show --name-only --format="" {h}')
-
-        # 변경 내용 diff (간략하게)
-        diff = sh(f'git show --stat {h}')
-
+    # 커밋 목록 가져오기 (SHA 캐시 경유)
+    for c in load_commits(since):
         commits.append({
-            "hash": h[:7],
-            "subject": subject,
-            "body": body,
-            "author": author,
-            "files": files.splitlines() if files else [],
-            "diff_stat": diff
+            "hash": c["short"],
+            "subject": c["subject"],
+            "body": c["body"],
+            "author": c["author"],
+            "files": [f["path"] for f in c["files"]],
+            "diff_stat": format_stat(c)
         })
 
     return commits
 
-def generate_gpt_feedback(devlog_content, commit_details, api_key):
+def build_prompt_sections(devlog_content, commit_details):
+    """DevLog와 커밋 요약을 PROMPT_BUDGET 안에 맞춰 (devlog, commit_summary) 반환
+
+    커밋(최신순, 최대 MAX_COMMITS개)은 DevLog보다 먼저 압축되고, 그래도 넘치면 오래된 커밋부터 빠집니다.
+    """
+    commit_sections = [
+        Section(f"commit_{i}", f"**커밋 {c['hash']}**: {c['subject']}\n파일: {', '.join(c['files'][:5])}\n{c['diff_stat']}",
+                priority=1, min_tokens=40)
+        for i, c in enumerate(commit_details[:MAX_COMMITS])
+    ]
+    sections = fit_sections([Section("devlog", devlog_content, priority=2)] + commit_sections, PROMPT_BUDGET)
+    commit_summary = "\n\n".join(sections[s.name] for s in commit_sections if sections[s.name])
+    return sections["devlog"], commit_summary
+
+def generate_gpt_feedback(devlog_content, commit_details):
     """GPT-4를 사용하여 개발자 성장 피드백 생성"""
 
-    client = OpenAI(api_key=api_key)
-
-    # 커밋 요약 생성
-    commit_summary = "\n\n".join([
-        f"**커밋 {c['hash']}**: {c['subject']}\n파일: {', '.join(c['files'][:5])}\n{c['diff_stat'][:300]}"
-        for c in commit_details[:5]  # 최대 5개 커밋만
-    ])
+    devlog, commit_summary = build_prompt_sections(devlog_content, commit_details)
 
     system_prompt = """당신은 시니어 소프트웨어 엔지니어이자 멘토입니다.
 개발자의 일일 개발 로그를 분석하여 성장을 돕는 건설적인 피드백을 제공합니다.
@@ -78,7 +71,7 @@ def generate_gpt_feedback(devlog_content, commit_details, api_key):
     user_prompt = f"""다음은 개발자의 오늘 작업 내용입니다:
 
 ## DevLog
-{devlog_content[:3000]}
+{devlog}
 
 ## 상세 커밋 정보
 {commit_summary}
@@ -109,33 +102,28 @@ def generate_gpt_feedback(devlog_content, commit_details, api_key):
 """
 
     try:
-        response = client.chat.completions.create(
-            model="gpt-4o",
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ],
-            temperature=0.7,
-            max_tokens=2000
+        feedback = get_client().complete(
+            system_prompt, user_prompt, model="gpt-4o", temperature=0.7, max_tokens=2000
         )
-
-        feedback = response.choices[0].message.content
         return feedback
 
     except Exception as e:
         print(f"❌ GPT API 호출 실패: {e}")
         return None
 
-def main():
+def main(argv=None):
     ap = argparse.ArgumentParser(description="Generate GPT-4 feedback for DevLog")
     ap.add_argument("--devlog-file", required=True, help="DevLog 파일 경로")
     ap.add_argument("--since", default="24 hours", help="Git log 시작 시간")
     ap.add_argument("--output", required=True, help="출력 파일 경로")
-    args = ap.parse_args()
+    ap.add_argument("--no-cache", action="store_true", help="GPT 응답 캐시를 사용하지 않음")
+    args = ap.parse_args(argv)
+
+    if args.no_cache:
+        configure(cache=False)
 
     # API 키 확인
-    api_key = os.getenv("OPENAI_API_KEY")
-    if not api_key:
+    if not get_client().available():
         print("❌ OPENAI_API_KEY 환경 변수가 설정되지 않았습니다.")
         return
 
@@ -159,7 +147,7 @@ def main():
 
     # GPT 피드백 생성
     print("🤖 GPT-4로 피드백 생성 중...")
-    feedback = generate_gpt_feedback(devlog_content, commit_details, api_key)
+    feedback = generate_gpt_feedback(devlog_content, commit_details)
 
     if not feedback:
         print("❌ 피드백 생성 실패")
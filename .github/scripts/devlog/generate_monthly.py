@@ -1,36 +1,50 @@
 #!/usr/bin/env python3
 """Monthly DevLog Generator - 월간 커밋 활동 분석"""
-import os, sys, subprocess
+import os, sys
 from datetime import datetime, timedelta
 from collections import Counter, defaultdict
 import re
 
-def run_git(args):
-    try:
-        result = subprocess.run(["git"] + args, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, encoding='utf-8', errors='replace')
-        return result.stdout if result.returncode == 0 else ""
-    except:
-        return ""
+from commit_cache import load_commits
+from llm_client import get_client
+from metrics_store import open_store
+from summarize import summarize_month
+from tracing import traced
 
 def get_commits_for_month(year, month):
     first_day = datetime(year, month, 1)
     last_day = datetime(year, month + 1, 1) - timedelta(seconds=1) if month < 12 else datetime(year + 1, 1, 1) - timedelta(seconds=1)
     
-    log = run_git(["log", "--all", "--no-merges", f"--since={first_day:%Y-%m-%d}", f"--until={last_day:%Y-%m-%d}", "--pretty=format:%H|%an|%ad|%s", "--date=iso"])
-    
-    commits = []
-    for line in log.strip().split('\n'):
-        if line:
-            parts = line.split('|', 3)
-            if len(parts) >= 4:
-                commits.append({'hash': parts[0][:7], 'author': parts[1], 'date': parts[2][:10], 'subject': parts[3]})
-    return commits
+    records = load_commits(f"{first_day:%Y-%m-%d}", f"{last_day:%Y-%m-%d}", rev_args=["--all", "--no-merges"])
+    return [{'hash': c['hash'][:7], 'author': c['author'], 'date': c['date'][:10], 'subject': c['subject']} for c in records]
 
 def parse_commit(subject):
     m = re.match(r'^(\w+)(?:\(([^)]+)\))?: (.+)$', subject)
     return {'type': m.group(1), 'scope': m.group(2) or '', 'desc': m.group(3)} if m else {'type': 'other', 'scope': '', 'desc': subject}
 
-def generate_monthly_report(year, month, output_path):
+@traced("metrics.month")
+def get_monthly_metrics(year, month):
+    """metrics store에서 월간 합계를 한 번의 쿼리로 조회 (데이터 없으면 None)"""
+    last = (datetime(year + (month == 12), month % 12 + 1, 1) - timedelta(days=1)).day
+    store = open_store()
+    totals = store.aggregate(f"{year}-{month:02d}-01", f"{year}-{month:02d}-{last:02d}")
+    store.close()
+    return totals if totals['days'] else None
+
+@traced("gpt.monthly_summary")
+def get_monthly_summary(devlog_dir, year, month):
+    """일일 → 주간 → 월간 map-reduce GPT 요약 (실패 시 None)"""
+    if not get_client().available():
+        print("⚠️ OPENAI_API_KEY가 없어 GPT 요약을 건너뜁니다.")
+        return None
+    try:
+        return summarize_month(devlog_dir, year, month)
+    except Exception as e:
+        print(f"⚠️ GPT 월간 요약 실패: {e}")
+        return None
+
+@traced("render.monthly")
+def generate_monthly_report(year, month, output_path, use_gpt=False, devlog_dir="Documents/DevLog/Daily"):
     print(f"Generating monthly report for {year}-{month:02d}...")
     commits = get_commits_for_month(year, month)
     
@@ -60,11 +74,24 @@ def generate_monthly_report(year, month, output_path):
         ""
     ]
     
+    totals = get_monthly_metrics(year, month)
+    if totals:
+        lines.insert(-1, f"- **변경 라인**: +{totals['additions']} / -{totals['deletions']} ({totals['days']}일 메트릭 기준)")
+        if totals['test_pass_rate'] is not None:
+            lines.insert(-1, f"- **테스트 통과율**: {totals['test_pass_rate']}%")
+        if totals['builds']:
+            lines.insert(-1, f"- **빌드 실패**: {totals['build_failures']}/{totals['builds']}일")
+    
     if scopes:
         top_scopes = ', '.join([f"{s} ({c}건)" for s, c in scopes.most_common(3)])
         lines.append(f"- **주요 스코프**: {top_scopes}")
         lines.append("")
     
+    if use_gpt:
+        summary = get_monthly_summary(devlog_dir, year, month)
+        if summary:
+            lines += ["## 월간 요약 (GPT)", "", summary.strip(), ""]
+
     lines.append("## 주간별 진행 현황")
     lines.append("")
     for week_num in sorted(weeks.keys()):
@@ -108,17 +135,23 @@ def generate_monthly_report(year, month, output_path):
     print(f"✅ Monthly report: {output_path}")
     return True
 
-if __name__ == '__main__':
+@traced("generate_monthly")
+def main(argv=None):
     import argparse
     parser = argparse.ArgumentParser(description='Generate monthly DevLog')
     parser.add_argument('--year', type=int, default=datetime.now().year)
     parser.add_argument('--month', type=int, default=(datetime.now().month - 1) or 12)
     parser.add_argument('--out', type=str, help='Output file path')
-    args = parser.parse_args()
+    parser.add_argument('--use-gpt', action='store_true', help='Add a GPT summary reduced from daily/weekly summaries')
+    parser.add_argument('--devlog-dir', type=str, default='Documents/DevLog/Daily', help='Daily DevLog directory')
+    args = parser.parse_args(argv)
     
     year, month = args.year, args.month
     if month == 0:
         month, year = 12, year - 1
     
     out = args.out or f"Documents/DevLog/Monthly/{year}-{month:02d}.md"
-    sys.exit(0 if generate_monthly_report(year, month, out) else 1)
+    return 0 if generate_monthly_report(year, month, out, args.use_gpt, args.devlog_dir) else 1
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -5,20 +5,17 @@ Weekly DevLog Generator
 """
 
 import argparse
-import subprocess
 import json
 import re
 import datetime
 from pathlib import Path
-from collections import defaultdict, Counter
-from jinja2 import Template
+from collections import Counter
 
-def sh(cmd):
-    """셸 명령 실행"""
-    try:
-        return subprocess.check_output(cmd, shell=True, text=True, errors="ignore").strip()
-    except subprocess.CalledProcessError:
-        return ""
+from commit_cache import load_commits
+from coupling import DEFAULT_WEEKS, analyze_window
+from hotspot_index import rank_hotspots
+from templates import render as render_template
+from tracing import span, traced
 
 def get_week_range(date_str=None):
     """주간 범위 계산 (월요일 ~ 일요일)"""
@@ -31,9 +28,8 @@ def get_week_range(date_str=None):
     monday = target - datetime.timedelta(days=target.weekday())
     sunday = monday + datetime.timedelta(days=6)
 
-    # ISO week number
-    week_num = monday.isocalendar()[1]
-    year = monday.year
+    # ISO week number (연도도 ISO 기준: 2024-12-30 → 2025-W01)
+    year, week_num, _ = monday.isocalendar()
 
     return {
         "monday": monday,
@@ -44,37 +40,26 @@ def get_week_range(date_str=None):
     }
 
 def git_log_range(since, until):
-    """특정 기간의 커밋 해시 목록"""
-    result = sh(f'git log --since="{since}" --until="{until}" --pretty=format:"%H"')
-    return result.splitlines() if result else []
+    """특정 기간의 커밋 목록 (SHA 캐시 경유)"""
+    return load_commits(since, until)
 
-def parse_commit(commit_hash):
+def parse_commit(commit):
     """커밋 정보 파싱"""
-    # 메타데이터
-    meta = sh(f'git show --format="%s||%h||%an||%ae||%ai" --no-patch {commit_hash}')
-    if not meta or "||" not in meta:
+    if not commit:
         return None
 
-    parts = meta.split("||")
-    if len(parts) < 5:
-        return None
-
-    subject, short, author, email, date = parts
+    subject = commit["subject"]
 
     # 변경 파일 통계
-    numstat = sh(f'git show --numstat --format="" {commit_hash}')
     added = deleted = 0
     files_changed = []
 
-    for ln in numstat.splitlines():
-        m = re.match(r"(\d+|-)\s+(\d+|-)\s+(.+)", ln)
-        if not m:
+    for f in commit["files"]:
+        if f["added"] is None or f["deleted"] is None:
             continue
-        a, d, f = m.groups()
-        if a != '-' and d != '-':
-            added += int(a)
-            deleted += int(d)
-            files_changed.append((f, int(a) + int(d)))
+        added += f["added"]
+        deleted += f["deleted"]
+        files_changed.append((f["path"], f["added"] + f["deleted"]))
 
     # Conventional Commits 파싱
     commit_type = parse_commit_type(subject)
@@ -84,12 +69,12 @@ def parse_commit(commit_hash):
     pr_number = pr_match.group(1) if pr_match else None
 
     return {
-        "hash": commit_hash,
-        "short": short,
+        "hash": commit["hash"],
+        "short": commit["short"],
         "subject": subject,
-        "author": author,
-        "email": email,
-        "date": date,
+        "author": commit["author"],
+        "email": commit["email"],
+        "date": commit["date"],
         "type": commit_type,
         "pr": pr_number,
         "added": added,
@@ -104,13 +89,13 @@ def parse_commit_type(subject):
         return match.group(1)
     return "other"
 
+@traced("stats.commits")
 def analyze_commits(commits):
     """커밋 분석"""
     total_added = 0
     total_deleted = 0
     commit_types = Counter()
     authors = Counter()
-    hotspot_files = defaultdict(lambda: {"lines": 0, "freq": 0})
 
     features = []
     fixes = []
@@ -132,11 +117,6 @@ def analyze_commits(commits):
         commit_date = commit["date"][:10]  # YYYY-MM-DD
         active_days.add(commit_date)
 
-        # Hotspot 파일
-        for f, lines in commit["files_changed"]:
-            hotspot_files[f]["lines"] += lines
-            hotspot_files[f]["freq"] += 1
-
         # 타입별 분류
         item = {
             "title": commit["subject"],
@@ -153,11 +133,6 @@ def analyze_commits(commits):
         elif commit["type"] == "perf":
             performance.append(item)
 
-    # Hotspot 파일 정렬
-    hotspot_list = []
-    for file, data in sorted(hotspot_files.items(), key=lambda x: x[1]["lines"], reverse=True)[:10]:
-        hotspot_list.append((file, data["lines"], data["freq"]))
-
     # 커밋 타입 통계
     total = sum(commit_types.values())
     commit_type_stats = []
@@ -172,13 +147,23 @@ def analyze_commits(commits):
         "active_days": len(active_days),
         "top_authors": [author for author, _ in authors.most_common(5)],
         "commit_type_stats": commit_type_stats,
-        "hotspot_files": hotspot_list,
         "features": features,
         "fixes": fixes,
         "refactors": refactors,
         "performance": performance
     }
 
+@traced("stats.hotspots")
+def weekly_hotspots(records, n=10):
+    """Hotspot 파일 (이름 변경 추적, 바이너리는 변경 빈도로 집계) → (파일, 변경 라인, 변경 빈도)"""
+    if not records:
+        return []
+    return [
+        (h["path"], "Bin" if h["binary"] and not h["churn"] else h["churn"], h["commits"])
+        for h in rank_hotspots(records, n)
+    ]
+
+@traced("io.daily_logs")
 def load_daily_logs(devlog_dir, date_from, date_to):
     """Daily DevLog 파일 로드"""
     devlog_path = Path(devlog_dir)
@@ -235,21 +220,23 @@ def generate_reflection_questions(commits_data):
 
     return questions
 
+@traced("render.weekly")
 def render(context, template_path, out_path):
-    """Jinja2 템플릿 렌더링"""
-    template_content = Path(template_path).read_text(encoding="utf-8")
-    md = Template(template_content).render(**context)
+    """Jinja2 템플릿 렌더링 (공용 환경의 컴파일 캐시 사용)"""
+    md = render_template(template_path, context)
 
     Path(out_path).parent.mkdir(parents=True, exist_ok=True)
     Path(out_path).write_text(md, encoding="utf-8")
 
-def main():
+@traced("generate_weekly")
+def main(argv=None):
     ap = argparse.ArgumentParser(description="Weekly DevLog Generator")
     ap.add_argument("--date", default=None, help="기준 날짜 (YYYY-MM-DD, 비워두면 이번 주)")
     ap.add_argument("--devlog-dir", default="Documents/DevLog", help="DevLog 디렉토리")
     ap.add_argument("--out", required=True, help="출력 파일 경로")
     ap.add_argument("--template", default=None, help="템플릿 파일 경로")
-    args = ap.parse_args()
+    ap.add_argument("--coupling-weeks", type=int, default=DEFAULT_WEEKS, help="모듈 결합도 분석 구간 (주, 0이면 생략)")
+    args = ap.parse_args(argv)
 
     # 템플릿 경로 설정
     if not args.template:
@@ -269,14 +256,17 @@ def main():
     since = monday.strftime("%Y-%m-%d 00:00:00")
     until = (sunday + datetime.timedelta(days=1)).strftime("%Y-%m-%d 00:00:00")
 
-    commit_hashes = git_log_range(since, until)
-    commits = [parse_commit(h) for h in commit_hashes]
+    records = git_log_range(since, until)
+    commits = [parse_commit(c) for c in records]
     commits = [c for c in commits if c]  # None 제거
 
     print(f"   Found {len(commits)} commits")
 
     # 커밋 분석
     commits_data = analyze_commits(commits)
+    commits_data["hotspot_files"] = weekly_hotspots(records)
+    with span("stats.coupling", weeks=args.coupling_weeks):
+        coupling = analyze_window(sunday, args.coupling_weeks) if args.coupling_weeks > 0 else None
 
     # Daily Logs 수집
     daily_log_files = load_daily_logs(args.devlog_dir, monday, sunday)
@@ -308,6 +298,7 @@ def main():
         "top_authors": commits_data["top_authors"],
         "commit_type_stats": commits_data["commit_type_stats"],
         "hotspot_files": commits_data["hotspot_files"],
+        "coupling": coupling,
         "features": commits_data["features"],
         "fixes": commits_data["fixes"],
         "refactors": commits_data["refactors"],
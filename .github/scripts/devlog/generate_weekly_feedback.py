@@ -5,18 +5,17 @@ GPT Weekly Feedback Generator
 """
 
 import argparse
-import subprocess
-import os
 import datetime
 from pathlib import Path
-from openai import OpenAI
 
-def sh(cmd):
-    """셸 명령 실행"""
-    try:
-        return subprocess.check_output(cmd, shell=True, text=True, errors="ignore").strip()
-    except subprocess.CalledProcessError:
-        return ""
+from commit_cache import load_commits
+from git_commits import format_stat
+from llm_client import configure, get_client
+from prompt_budget import Section, fit_sections
+from tracing import traced
+
+# 주간 리포트 + 커밋 + 일일 로그 섹션에 쓸 프롬프트 토큰 예산
+PROMPT_BUDGET = 5000
 
 def get_week_commits(week_label):
     """주차에 해당하는 커밋 수집"""
@@ -29,35 +28,22 @@ def get_week_commits(week_label):
     week = int(parts[1])
 
     # 해당 주의 월요일과 일요일 계산
-    jan1 = datetime.date(year, 1, 1)
-    week_start = jan1 + datetime.timedelta(weeks=week-1, days=-jan1.weekday())
+    week_start = datetime.date.fromisocalendar(year, week, 1)
     week_end = week_start + datetime.timedelta(days=6)
 
     since = week_start.strftime("%Y-%m-%d 00:00:00")
     until = (week_end + datetime.timedelta(days=1)).strftime("%Y-%m-%d 00:00:00")
 
-    # 커밋 수집
+    # 커밋 수집 (SHA 캐시 경유)
     commits = []
-    hashes = sh(f'git log --since="{since}" --until="{until}" --pretty=format:"%H"')
-
-    if not hashes:
-        return commits
-
-    for h in hashes.splitlines():
-        subject = sh(f'git show --format="%s" --no-patch {h}')
-        body = sh(f'git show --format="%b" --no-patch {h}')
-        author = sh(f'git show --format="%an" --no-patch {h}')
-        date = sh(f'git show --format="%ai" --no-patch {h}')
-
-        diff_stat = sh(f'git show --stat {h}')
-
+    for c in load_commits(since, until):
         commits.append({
-            "hash": h[:7],
-            "subject": subject,
-            "body": body,
-            "author": author,
-            "date": date[:10],
-            "diff_stat": diff_stat[:500]
+            "hash": c["short"],
+            "subject": c["subject"],
+            "body": c["body"],
+            "author": c["author"],
+            "date": c["date"][:10],
+            "diff_stat": format_stat(c)
         })
 
     return commits
@@ -72,8 +58,7 @@ def load_daily_logs(devlog_dir, week_label):
     year = int(parts[0])
     week = int(parts[1])
 
-    jan1 = datetime.date(year, 1, 1)
-    week_start = jan1 + datetime.timedelta(weeks=week-1, days=-jan1.weekday())
+    week_start = datetime.date.fromisocalendar(year, week, 1)
     week_end = week_start + datetime.timedelta(days=6)
 
     devlog_path = Path(devlog_dir)
@@ -89,7 +74,7 @@ def load_daily_logs(devlog_dir, week_label):
                 content = log_file.read_text(encoding="utf-8")
                 daily_contents.append({
                     "date": date_str,
-                    "content": content[:2000]  # 각 파일 최대 2000자
+                    "content": content
                 })
             except:
                 pass
@@ -98,22 +83,29 @@ def load_daily_logs(devlog_dir, week_label):
 
     return daily_contents
 
-def generate_weekly_feedback(weekly_report, commits, daily_logs, api_key):
+@traced("gpt.weekly_feedback")
+def generate_weekly_feedback(weekly_report, commits, daily_logs):
     """GPT-4로 주간 성장 피드백 생성"""
 
-    client = OpenAI(api_key=api_key)
+    # 예산 초과 시 커밋 → 일일 로그 → 주간 리포트 순으로 압축
+    commit_sections = [
+        Section(f"commit_{i}", f"**{c['date']} - {c['hash']}**: {c['subject']}\n{c['diff_stat']}", priority=1)
+        for i, c in enumerate(commits)
+    ]
+    daily_sections = [
+        Section(f"daily_{d['date']}", f"**{d['date']}**:\n{d['content']}", priority=2, min_tokens=80)
+        for d in daily_logs
+    ]
+    sections = fit_sections(
+        [Section("weekly", weekly_report, priority=3)] + commit_sections + daily_sections,
+        PROMPT_BUDGET,
+    )
 
     # 커밋 요약
-    commit_summary = "\n\n".join([
-        f"**{c['date']} - {c['hash']}**: {c['subject']}\n{c['diff_stat'][:200]}"
-        for c in commits[:10]  # 최대 10개
-    ])
+    commit_summary = "\n\n".join(sections[s.name] for s in commit_sections if sections[s.name])
 
     # Daily Log 요약
-    daily_summary = "\n\n".join([
-        f"**{d['date']}**:\n{d['content'][:800]}\n..."
-        for d in daily_logs[:5]  # 최대 5일
-    ])
+    daily_summary = "\n\n".join(sections[s.name] for s in daily_sections if sections[s.name])
 
     system_prompt = """당신은 경험 많은 소프트웨어 엔지니어링 멘토입니다.
 개발자의 주간 작업 내역을 분석하여 성장 중심의 회고와 피드백을 제공합니다.
@@ -133,7 +125,7 @@ def generate_weekly_feedback(weekly_report, commits, daily_logs, api_key):
     user_prompt = f"""다음은 개발자의 이번 주 작업 내역입니다:
 
 ## 주간 리포트
-{weekly_report[:3000]}
+{sections["weekly"]}
 
 ## 상세 커밋 내역
 {commit_summary}
@@ -185,34 +177,30 @@ def generate_weekly_feedback(weekly_report, commits, daily_logs, api_key):
 """
 
     try:
-        response = client.chat.completions.create(
-            model="gpt-4o",
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ],
-            temperature=0.7,
-            max_tokens=3000
+        feedback = get_client().complete(
+            system_prompt, user_prompt, model="gpt-4o", temperature=0.7, max_tokens=3000
         )
-
-        feedback = response.choices[0].message.content
         return feedback
 
     except Exception as e:
         print(f"❌ GPT API 호출 실패: {e}")
         return None
 
-def main():
+@traced("generate_weekly_feedback")
+def main(argv=None):
     ap = argparse.ArgumentParser(description="Generate GPT-4 weekly feedback")
     ap.add_argument("--weekly-file", required=True, help="주간 리포트 파일 경로")
     ap.add_argument("--devlog-dir", required=True, help="DevLog 디렉토리")
     ap.add_argument("--week-label", required=True, help="주차 라벨 (예: 2025-W01)")
     ap.add_argument("--output", required=True, help="출력 파일 경로")
-    args = ap.parse_args()
+    ap.add_argument("--no-cache", action="store_true", help="GPT 응답 캐시를 사용하지 않음")
+    args = ap.parse_args(argv)
+
+    if args.no_cache:
+        configure(cache=False)
 
     # API 키 확인
-    api_key = os.getenv("OPENAI_API_KEY")
-    if not api_key:
+    if not get_client().available():
         print("❌ OPENAI_API_KEY 환경 변수가 설정되지 않았습니다.")
         return
 
@@ -240,7 +228,7 @@ def main():
 
     # GPT 피드백 생성
     print("🤖 GPT-4로 주간 회고 피드백 생성 중...")
-    feedback = generate_weekly_feedback(weekly_content, commits, daily_logs, api_key)
+    feedback = generate_weekly_feedback(weekly_content, commits, daily_logs)
 
     if not feedback:
         print("❌ 피드백 생성 실패")
@@ -2,21 +2,25 @@
 """
 GPT 기반 Weekly DevLog Generator
 Daily DevLog를 분석하여 기존 형식의 주간 개발 요약을 생성합니다.
+
+일일 로그 원문 대신 summarize.py의 일일 요약(사이드카 캐시)을 모아 한 번에 축약합니다.
+GPT 요약 뒤에 coupling.py의 모듈 결합도 표를 붙입니다.
 """
 
 import argparse
-import subprocess
-import os
 import datetime
 from pathlib import Path
-from openai import OpenAI
 
-def sh(cmd):
-    """셸 명령 실행"""
-    try:
-        return subprocess.check_output(cmd, shell=True, text=True, errors="ignore").strip()
-    except subprocess.CalledProcessError:
-        return ""
+from commit_cache import load_commits
+from coupling import DEFAULT_WEEKS, analyze_window
+from llm_client import configure, get_client
+from metrics_store import open_store
+from prompt_budget import Section, fit_sections
+from summarize import summarize_days
+from tracing import span, traced
+
+# 일일 로그 + 커밋 통계 섹션에 쓸 프롬프트 토큰 예산
+PROMPT_BUDGET = 8000
 
 def get_week_range(date_str=None):
     """주간 범위 계산 (월요일 ~ 일요일)"""
@@ -29,9 +33,8 @@ def get_week_range(date_str=None):
     monday = target - datetime.timedelta(days=target.weekday())
     sunday = monday + datetime.timedelta(days=6)
 
-    # ISO week number
-    week_num = monday.isocalendar()[1]
-    year = monday.year
+    # ISO week number (연도도 ISO 기준: 2024-12-30 → 2025-W01)
+    year, week_num, _ = monday.isocalendar()
 
     return {
         "monday": monday,
@@ -42,6 +45,7 @@ def get_week_range(date_str=None):
         "date_range": f"{monday.strftime('%Y-%m-%d')} ~ {sunday.strftime('%Y-%m-%d')}"
     }
 
+@traced("io.daily_logs")
 def load_daily_logs(devlog_dir, week_info):
     """주간 Daily DevLog 파일 전체 내용 수집"""
     devlog_path = Path(devlog_dir)
@@ -67,48 +71,25 @@ def load_daily_logs(devlog_dir, week_info):
 
     return daily_logs
 
+@traced("stats.week_commits")
 def get_week_commits(week_info):
     """주간 커밋 통계"""
     since = week_info["monday"].strftime("%Y-%m-%d 00:00:00")
     until = (week_info["sunday"] + datetime.timedelta(days=1)).strftime("%Y-%m-%d 00:00:00")
 
-    # 커밋 수집
-    commits = []
-    hashes = sh(f'git log --since="{since}" --until="{until}" --pretty=format:"%H"')
-
-    if not hashes:
-        return {
-            "count": 0,
-            "added": 0,
-            "deleted": 0,
-            "details": []
-        }
-
-    for h in hashes.splitlines():
-        subject = sh(f'git show --format="%s" --no-patch {h}')
-        author = sh(f'git show --format="%an" --no-patch {h}')
-        date = sh(f'git show --format="%ai" --no-patch {h}')
-
-        commits.append({
-            "hash": h[:7],
-            "subject": subject,
-            "author": author,
-            "date": date[:10]
-        })
+    # 커밋 수집 (SHA 캐시 경유)
+    records = load_commits(since, until)
+
+    commits = [{
+        "hash": c["short"],
+        "subject": c["subject"],
+        "author": c["author"],
+        "date": c["date"][:10]
+    } for c in records]
 
     # 변경 라인 통계
-    stats = sh(f'git log --since="{since}" --until="{until}" --numstat --pretty=format:""')
-    added = deleted = 0
-    for line in stats.splitlines():
-        if not line.strip():
-            continue
-        parts = line.split()
-        if len(parts) >= 2:
-            try:
-                added += int(parts[0]) if parts[0] != '-' else 0
-                deleted += int(parts[1]) if parts[1] != '-' else 0
-            except:
-                pass
+    added = sum(c["added"] for c in records)
+    deleted = sum(c["deleted"] for c in records)
 
     return {
         "count": len(commits),
@@ -117,26 +98,58 @@ def get_week_commits(week_info):
         "details": commits[:20]  # 최대 20개
     }
 
-def generate_weekly_summary_with_gpt(daily_logs, commit_stats, week_info, api_key):
-    """GPT-4로 기존 형식의 주간 개발 요약 생성"""
+@traced("metrics.week")
+def get_week_metrics(week_info):
+    """metrics store에서 주간 빌드/테스트 합계 조회 (일일 메트릭 파일을 다시 열지 않음)"""
+    store = open_store()
+    totals = store.aggregate(week_info["monday"].isoformat(), week_info["sunday"].isoformat())
+    store.close()
+    return totals
+
+def format_coupling(coupling):
+    """모듈 결합도 분석 결과 → 마크다운 섹션 (weekly_template.md와 같은 표)"""
+    lines = [f"## 모듈 결합도 / Module Coupling (최근 {coupling['weeks']}주)", ""]
+    if coupling["pairs"]:
+        lines += ["| 모듈 A | 모듈 B | 동시 변경 | 신뢰도 |", "|--------|--------|-----------|--------|"]
+        lines += [f"| `{p['a']}` | `{p['b']}` | {p['support']}회 | {round(p['confidence'] * 100)}% |"
+                  for p in coupling["pairs"]]
+    else:
+        lines.append("- 함께 변경된 모듈 없음")
+    return "\n".join(lines) + "\n"
 
-    client = OpenAI(api_key=api_key)
+@traced("gpt.weekly_summary")
+def generate_weekly_summary_with_gpt(daily_logs, commit_stats, week_info):
+    """GPT-4로 기존 형식의 주간 개발 요약 생성"""
 
-    # Daily Logs 요약 (파일명과 주요 내용)
-    daily_summary = ""
-    for log in daily_logs:
-        # 각 Daily Log의 첫 100줄 정도만 (핵심 변경 사항 위주)
-        lines = log["content"].split("\n")
-        key_sections = "\n".join(lines[:100])
-        daily_summary += f"\n\n### {log['date']} ({log['filename']})\n{key_sections}\n"
+    # 섹션 구성: 통계(보존) > 일일 로그 > 커밋 목록 순으로 중요
+    metrics = f"총 커밋: {commit_stats['count']}개\n"
+    metrics += f"변경 라인: +{commit_stats['added']} / -{commit_stats['deleted']}\n"
+    totals = commit_stats.get("metrics") or {}
+    if totals.get("test_pass_rate") is not None:
+        metrics += f"테스트 통과율: {totals['test_pass_rate']}% ({totals['tests_pass']}/{totals['tests_pass'] + totals['tests_fail']})\n"
+    if totals.get("builds"):
+        metrics += f"빌드 실패: {totals['build_failures']}/{totals['builds']}일\n"
+    commit_list = ""
+    if commit_stats['details']:
+        commit_list = "주요 커밋:\n" + "".join(
+            f"- {c['date']} [{c['author']}] {c['subject']}\n" for c in commit_stats['details']
+        )
+    daily_sections = [
+        Section(f"daily_{log['date']}", f"### {log['date']} ({log['filename']})\n{log.get('summary') or log['content']}",
+                priority=2, min_tokens=150)
+        for log in daily_logs
+    ]
+    sections = fit_sections(
+        [Section("metrics", metrics, priority=3), Section("commits", commit_list, priority=1, min_tokens=200)]
+        + daily_sections,
+        PROMPT_BUDGET,
+    )
+
+    # Daily Logs 요약 (일일 요약, 실패한 날은 압축 원문)
+    daily_summary = "\n\n".join(sections[s.name] for s in daily_sections)
 
     # 커밋 요약
-    commit_summary = f"총 커밋: {commit_stats['count']}개\n"
-    commit_summary += f"변경 라인: +{commit_stats['added']} / -{commit_stats['deleted']}\n\n"
-    if commit_stats['details']:
-        commit_summary += "주요 커밋:\n"
-        for c in commit_stats['details'][:10]:
-            commit_summary += f"- {c['date']} [{c['author']}] {c['subject']}\n"
+    commit_summary = sections["metrics"] + "\n" + sections["commits"]
 
     system_prompt = """당신은 경험 많은 프로젝트 리더이자 기술 문서 작성 전문가입니다.
 개발팀의 주간 작업 내역을 분석하여 구조화된 주간 개발 요약 보고서를 작성합니다.
@@ -187,8 +200,8 @@ def generate_weekly_summary_with_gpt(daily_logs, commit_stats, week_info, api_ke
 
     user_prompt = f"""다음은 {week_info['date_range']} 주간의 작업 내역입니다:
 
-## Daily DevLog 내용
-{daily_summary[:15000]}
+## Daily DevLog 요약
+{daily_summary}
 
 ## 커밋 통계
 {commit_summary}
@@ -200,33 +213,30 @@ def generate_weekly_summary_with_gpt(daily_logs, commit_stats, week_info, api_ke
 """
 
     try:
-        response = client.chat.completions.create(
-            model="gpt-4o",
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ],
-            temperature=0.7,
-            max_tokens=4000
+        summary = get_client().complete(
+            system_prompt, user_prompt, model="gpt-4o", temperature=0.7, max_tokens=4000
         )
-
-        summary = response.choices[0].message.content
         return summary
 
     except Exception as e:
         print(f"❌ GPT API 호출 실패: {e}")
         return None
 
-def main():
+@traced("generate_weekly_gpt")
+def main(argv=None):
     ap = argparse.ArgumentParser(description="GPT 기반 Weekly DevLog Generator")
     ap.add_argument("--date", default=None, help="기준 날짜 (YYYY-MM-DD, 비워두면 이번 주)")
     ap.add_argument("--devlog-dir", required=True, help="Daily DevLog 디렉토리")
     ap.add_argument("--out", required=True, help="출력 파일 경로")
-    args = ap.parse_args()
+    ap.add_argument("--no-cache", action="store_true", help="GPT 응답 캐시를 사용하지 않음")
+    ap.add_argument("--coupling-weeks", type=int, default=DEFAULT_WEEKS, help="모듈 결합도 분석 구간 (주, 0이면 생략)")
+    args = ap.parse_args(argv)
+
+    if args.no_cache:
+        configure(cache=False)
 
     # API 키 확인
-    api_key = os.getenv("OPENAI_API_KEY")
-    if not api_key:
+    if not get_client().available():
         print("❌ OPENAI_API_KEY 환경 변수가 설정되지 않았습니다.")
         print("   GPT 없이 기본 통계만 생성하려면 generate_weekly.py를 사용하세요.")
         return 1
@@ -245,19 +255,32 @@ def main():
         print("⚠️ Daily DevLog가 없습니다. 주간 요약을 생성할 수 없습니다.")
         return 1
 
+    # 일일 요약 (map 단계: 이미 요약된 날은 사이드카 재사용)
+    print(f"📝 일일 요약 준비 중...")
+    day_summaries = summarize_days([Path(args.devlog_dir) / log["filename"] for log in daily_logs])
+    for log in daily_logs:
+        log["summary"] = day_summaries.get(log["date"])
+
     # 커밋 통계 수집
     print(f"📊 커밋 통계 수집 중...")
     commit_stats = get_week_commits(week_info)
+    commit_stats["metrics"] = get_week_metrics(week_info)
     print(f"   총 커밋: {commit_stats['count']}개")
 
     # GPT로 주간 요약 생성
     print(f"🤖 GPT-4로 주간 개발 요약 생성 중...")
-    summary = generate_weekly_summary_with_gpt(daily_logs, commit_stats, week_info, api_key)
+    summary = generate_weekly_summary_with_gpt(daily_logs, commit_stats, week_info)
 
     if not summary:
         print("❌ 주간 요약 생성 실패")
         return 1
 
+    # 모듈 결합도 (GPT 요약 뒤에 표로 첨부)
+    if args.coupling_weeks > 0:
+        with span("stats.coupling", weeks=args.coupling_weeks):
+            coupling = analyze_window(week_info["sunday"], args.coupling_weeks)
+        summary = summary.rstrip() + "\n\n" + format_coupling(coupling)
+
     # 파일 저장
     output_path = Path(args.out)
     output_path.parent.mkdir(parents=True, exist_ok=True)
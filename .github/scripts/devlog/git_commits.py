@@ -0,0 +1,248 @@
+"""
+Git Commit Collector
+단일 `git log -z --numstat` 호출로 범위 내 커밋의 메타데이터와 변경 통계를 수집합니다.
+
+커밋마다 `git show`를 실행하는 대신 한 번의 스트림을 NUL 단위로 점진 파싱하므로
+커밋 수와 무관하게 git 프로세스는 1개만 생성됩니다.
+
+`sync_from_tips`는 마지막으로 반영한 tip 이후의 커밋만 누적 인덱스(hotspot, coupling)에 반영하며,
+force-push 등으로 tip이 HEAD의 조상이 아니게 되면 인덱스를 비우고 처음부터 다시 만듭니다.
+"""
+
+import subprocess
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+
+# 헤더 필드: RS(0x1e)로 커밋 시작, US(0x1f)로 필드 구분
+FIELDS = ("hash", "short", "author", "email", "date", "subject", "body")
+LOG_FORMAT = "%x1e" + "%x1f".join(["%H", "%h", "%an", "%ae", "%aI", "%s", "%b"]) + "%x1f"
+
+CHUNK_SIZE = 64 * 1024
+
+
+def _new_commit(header: str) -> Dict:
+    values = header.lstrip("\n").lstrip("\x1e").split("\x1f")
+    values += [""] * (len(FIELDS) - len(values))
+    commit = dict(zip(FIELDS, values))
+    commit["subject"] = commit["subject"].strip()
+    commit["body"] = commit["body"].strip()
+    commit.update({"added": 0, "deleted": 0, "files": []})
+    return commit
+
+
+def _add_file(commit: Dict, adds: str, dels: str, path: str, old_path: Optional[str] = None) -> None:
+    added = int(adds) if adds.isdigit() else None
+    deleted = int(dels) if dels.isdigit() else None
+    commit["files"].append({"path": path, "old_path": old_path, "added": added, "deleted": deleted})
+    commit["added"] += added or 0
+    commit["deleted"] += deleted or 0
+
+
+def _iter_tokens(stream) -> Iterator[str]:
+    """바이너리 스트림을 NUL 단위 토큰으로 분리"""
+    pending = b""
+    while True:
+        chunk = stream.read(CHUNK_SIZE)
+        if not chunk:
+            break
+        pending += chunk
+        *tokens, pending = pending.split(b"\0")
+        for token in tokens:
+            yield token.decode("utf-8", errors="replace")
+    if pending:
+        yield pending.decode("utf-8", errors="replace")
+
+
+def parse_log_stream(stream) -> Iterator[Dict]:
+    """`git log -z --numstat --format=LOG_FORMAT` 출력을 커밋 단위로 파싱"""
+    current = None
+    rename = None  # 이름 변경 항목: [adds, dels, old_path] 대기 상태
+
+    for token in _iter_tokens(stream):
+        if rename is not None:
+            if len(rename) == 2:
+                rename.append(token)
+            else:
+                _add_file(current, rename[0], rename[1], token, old_path=rename[2])
+                rename = None
+            continue
+
+        body = token.lstrip("\n")
+        if body.startswith("\x1e"):
+            if current:
+                yield current
+            current = _new_commit(body)
+            continue
+
+        if current is None or not body:
+            continue
+
+        parts = body.split("\t", 2)
+        if len(parts) != 3:
+            continue
+        adds, dels, path = parts
+        if path:
+            _add_file(current, adds, dels, path)
+        else:
+            rename = [adds, dels]
+
+    if current:
+        yield current
+
+
+def iter_commits(
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    rev_args: Sequence[str] = (),
+    revisions: Optional[Iterable[str]] = None,
+    cwd: Optional[str] = None,
+    check: bool = False,
+) -> Iterator[Dict]:
+    """범위 내 커밋을 하나의 git 프로세스로 스트리밍
+
+    Args:
+        since: `--since` 값 (선택)
+        until: `--until` 값 (선택)
+        rev_args: 추가 git log 인자 (예: ["--all", "--no-merges"])
+        revisions: 지정 시 해당 커밋들만 `--stdin --no-walk`로 조회
+        cwd: git 실행 디렉토리
+        check: True면 git이 실패했을 때(잘못된 리비전 등) 끝에서 CalledProcessError
+    """
+    cmd = ["git", "log", "-z", "--numstat", f"--format={LOG_FORMAT}"]
+    if since:
+        cmd.append(f"--since={since}")
+    if until:
+        cmd.append(f"--until={until}")
+    cmd += list(rev_args)
+
+    stdin_data = None
+    if revisions is not None:
+        stdin_data = "".join(f"{rev}\n" for rev in revisions).encode("utf-8")
+        if not stdin_data:
+            return
+        cmd += ["--no-walk=unsorted", "--stdin"]
+
+    try:
+        proc = subprocess.Popen(
+            cmd,
+            cwd=cwd,
+            stdin=subprocess.PIPE if stdin_data is not None else subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+    except OSError:
+        return
+
+    try:
+        if stdin_data is not None:
+            # git은 --stdin 리비전을 모두 읽은 뒤 출력하므로 먼저 기록해도 교착되지 않음
+            proc.stdin.write(stdin_data)
+            proc.stdin.close()
+        yield from parse_log_stream(proc.stdout)
+    finally:
+        proc.stdout.close()
+        proc.wait()
+    if check and proc.returncode:
+        raise subprocess.CalledProcessError(proc.returncode, cmd)
+
+
+def rev_parse(revs: Sequence[str], cwd: Optional[str] = None) -> List[str]:
+    """리비전 인자 → 커밋 해시 목록 (실패 시 빈 목록)"""
+    try:
+        cp = subprocess.run(["git", "rev-parse"] + list(revs), cwd=cwd,
+                            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+    except OSError:
+        return []
+    return list(dict.fromkeys(cp.stdout.split())) if cp.returncode == 0 else []
+
+
+def is_ancestor(tip: str, heads: Sequence[str], cwd: Optional[str] = None) -> bool:
+    """tip이 존재하고 heads 중 하나의 조상인지 (객체가 없으면 False)"""
+    for head in heads:
+        cp = subprocess.run(["git", "merge-base", "--is-ancestor", tip, head], cwd=cwd,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        if cp.returncode == 0:
+            return True
+    return False
+
+
+def sync_from_tips(index, rev_args: Sequence[str] = ("HEAD",), log_args: Sequence[str] = ()) -> int:
+    """누적 인덱스를 rev_args까지 갱신하고 저장, 반영한 커밋 수 반환
+
+    index는 `tips`, `cwd`, `apply(commit)`, `reset()`, `save()`를 제공해야 합니다.
+    저장된 tip 중 하나라도 사라졌거나 현재 히스토리의 조상이 아니면(force-push, 객체가 없는 클론에
+    복원된 캐시) 재작성된 히스토리의 항목이 남지 않도록 인덱스를 비우고 전체를 다시 반영합니다.
+    """
+    heads = rev_parse(rev_args, index.cwd)
+    if not heads:
+        return 0
+    if index.tips and not all(is_ancestor(tip, heads, index.cwd) for tip in index.tips):
+        print(f"⚠️ {type(index).__name__}: 저장된 tip을 현재 히스토리에서 찾을 수 없어 처음부터 다시 만듭니다.")
+        index.reset()
+        index.tips = []
+
+    revs = ["--reverse"] + list(log_args) + list(rev_args) + (["--not"] + index.tips if index.tips else [])
+    count = 0
+    try:
+        for commit in iter_commits(rev_args=revs, cwd=index.cwd, check=True):
+            index.apply(commit)
+            count += 1
+    except subprocess.CalledProcessError:
+        # 일부만 반영된 상태를 저장하지 않음 (tip도 그대로 두어 다음 실행에서 다시 시도)
+        index.reset()
+        index.tips = []
+        return 0
+
+    if count or heads != index.tips:
+        index.tips = heads
+        index.save()
+    return count
+
+
+def list_hashes(
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    rev_args: Sequence[str] = (),
+    cwd: Optional[str] = None,
+) -> List[str]:
+    """범위 내 커밋 해시 목록 반환 (numstat 없이 조회하므로 저렴함)"""
+    cmd = ["git", "log", "--format=%H"]
+    if since:
+        cmd.append(f"--since={since}")
+    if until:
+        cmd.append(f"--until={until}")
+    cmd += list(rev_args)
+    try:
+        out = subprocess.run(cmd, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                             text=True, encoding="utf-8", errors="replace").stdout
+    except OSError:
+        return []
+    return [line for line in out.splitlines() if line]
+
+
+def collect_commits(
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    rev_args: Sequence[str] = (),
+    cwd: Optional[str] = None,
+) -> List[Dict]:
+    """범위 내 커밋 목록 반환 (최신순)"""
+    return list(iter_commits(since, until, rev_args=rev_args, cwd=cwd))
+
+
+def format_stat(commit: Dict, max_files: int = 10) -> str:
+    """`git show --stat`과 유사한 변경 파일 요약 문자열 생성"""
+    lines = []
+    for f in commit["files"][:max_files]:
+        if f["added"] is None:
+            change = "Bin"
+        else:
+            change = f"{f['added'] + f['deleted']} (+{f['added']}/-{f['deleted']})"
+        name = f"{f['old_path']} => {f['path']}" if f["old_path"] else f["path"]
+        lines.append(f" {name} | {change}")
+    if len(commit["files"]) > max_files:
+        lines.append(f" ... {len(commit['files']) - max_files} more files")
+    lines.append(
+        f" {len(commit['files'])} files changed, "
+        f"{commit['added']} insertions(+), {commit['deleted']} deletions(-)"
+    )
+    return "\n".join(lines)
@@ -0,0 +1,180 @@
+"""
+Hotspot Index
+파일별 변경 이력(churn, 커밋 수, 작성자 수, 주간 버킷)을 누적하는 영속 인덱스입니다.
+
+- 이름 변경(`-M`)을 따라가 처음 본 경로를 키로, 마지막 경로를 표시 이름으로 유지합니다.
+  이름을 바꿔 비운 경로에 새 파일이 생기면(.uasset 이름 변경 후 재생성 등) 새 키(`경로#2`)로 따로 집계합니다.
+- 바이너리(.uasset 등, numstat `-`)는 변경 라인 대신 변경 횟수로 집계합니다.
+- 마지막으로 반영한 tip 이후의 커밋만 오래된 순서로 한 번의 `git log`로 반영합니다
+  (tip이 사라지거나 히스토리가 바뀌면 처음부터 다시 만듦, git_commits.sync_from_tips).
+- 순위는 변경 빈도(커밋 수) → churn 순이라 라인 수가 없는 바이너리도 제자리를 찾습니다.
+"""
+
+import datetime
+import json
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from git_commits import sync_from_tips
+from paths import STATE_DIR
+from tracing import traced
+
+INDEX_PATH = STATE_DIR / "hotspot_index.json"
+INDEX_VERSION = 2
+
+
+def week_of(date_iso: str) -> str:
+    """ISO 8601 날짜 → `YYYY-Www`"""
+    try:
+        year, week, _ = datetime.date.fromisoformat(date_iso[:10]).isocalendar()
+    except ValueError:
+        return ""
+    return f"{year}-W{week:02d}"
+
+
+def _rank_key(entry: Dict):
+    return (-entry["commits"], -entry["churn"], entry["path"])
+
+
+class HotspotIndex:
+    def __init__(self, path: Optional[Path] = None, cwd: Optional[str] = None):
+        self.path = Path(path) if path else INDEX_PATH
+        self.cwd = cwd
+        self.tips: List[str] = []
+        # 지금까지 본 모든 경로(이전 이름 포함) → 키. 이전 이름을 남겨 두어야
+        # 이름 변경 전 커밋이 들어 있는 과거 구간도 같은 파일로 묶을 수 있음
+        self.ids: Dict[str, str] = {}
+        self.files: Dict[str, Dict] = {}
+        self._load()
+
+    def reset(self) -> None:
+        self.ids = {}
+        self.files = {}
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return
+        if data.get("version") != INDEX_VERSION:
+            return
+        self.tips = data.get("tips", [])
+        self.ids = data.get("ids", {})
+        self.files = data.get("files", {})
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        data = {"version": INDEX_VERSION, "tips": self.tips, "ids": self.ids, "files": self.files}
+        tmp.write_text(json.dumps(data, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+        tmp.replace(self.path)
+
+    def key_of(self, path: str, old_path: Optional[str] = None) -> str:
+        """경로의 정규 키 (이름 변경이면 이전 이름의 키를 이어받음)"""
+        if old_path:
+            key = self.ids.get(old_path, old_path)
+            self.ids.setdefault(old_path, key)
+            self.ids[path] = key
+            return key
+        key = self.ids.get(path)
+        if key is None:
+            key = path if path not in self.files else self._fresh_key(path)
+        elif key in self.files and self.files[key]["path"] != path:
+            # 이 경로의 파일은 다른 이름으로 옮겨졌으므로 새로 생긴 파일
+            key = self._fresh_key(path)
+        self.ids[path] = key
+        return key
+
+    def _fresh_key(self, path: str) -> str:
+        n = 2
+        while f"{path}#{n}" in self.files:
+            n += 1
+        return f"{path}#{n}"
+
+    def apply(self, commit: Dict) -> None:
+        """커밋 하나를 인덱스에 반영 (오래된 커밋부터 호출해야 이름 변경이 이어짐)"""
+        week = week_of(commit["date"])
+        author = commit["author"] or "Unknown"
+        for f in commit["files"]:
+            key = self.key_of(f["path"], f["old_path"])
+            entry = self.files.setdefault(key, {
+                "path": f["path"], "commits": 0, "churn": 0, "binary": False,
+                "authors": [], "last": "", "weeks": {},
+            })
+            churn = (f["added"] or 0) + (f["deleted"] or 0)
+            entry["path"] = f["path"]
+            entry["commits"] += 1
+            entry["churn"] += churn
+            entry["binary"] = entry["binary"] or f["added"] is None
+            if author not in entry["authors"]:
+                entry["authors"].append(author)
+            entry["last"] = max(entry["last"], commit["date"][:10])
+            if week:
+                bucket = entry["weeks"].setdefault(week, [0, 0])
+                bucket[0] += 1
+                bucket[1] += churn
+
+    @traced("index.hotspot_update")
+    def update(self, rev_args: Sequence[str] = ("HEAD",)) -> int:
+        """마지막 tip 이후의 새 커밋만 반영하고 저장, 반영한 커밋 수 반환"""
+        return sync_from_tips(self, rev_args, ("-M",))
+
+    def top(self, n: int = 10, weeks: Optional[Iterable[str]] = None) -> List[Dict]:
+        """전체 기간 또는 지정한 주간 버킷 기준 상위 파일"""
+        if weeks is None:
+            entries = [dict(e, authors=len(e["authors"])) for e in self.files.values()]
+        else:
+            weeks = set(weeks)
+            entries = []
+            for e in self.files.values():
+                buckets = [b for w, b in e["weeks"].items() if w in weeks]
+                if buckets:
+                    entries.append({
+                        "path": e["path"], "binary": e["binary"], "authors": len(e["authors"]),
+                        "commits": sum(b[0] for b in buckets), "churn": sum(b[1] for b in buckets),
+                    })
+        for e in entries:
+            e.pop("weeks", None)
+        return sorted(entries, key=_rank_key)[:n]
+
+    def rank(self, commits: Sequence[Dict], n: int = 10) -> List[Dict]:
+        """주어진 커밋 구간(git log 순서, 최신 커밋부터)의 상위 파일 (경로는 인덱스 기준 최신 이름으로 정규화)"""
+        window: Dict[str, Dict] = {}
+        # 최신 → 과거로 내려가며 이름 변경을 되감아, 이름을 바꿔 비운 뒤 재생성된 경로의
+        # 과거 커밋이 새 파일이 아니라 원래 파일로 묶이게 함
+        earlier: Dict[str, str] = {}
+        for commit in commits:
+            for f in commit["files"]:
+                key = earlier.get(f["path"]) or self.ids.get(f["path"], f["path"])
+                if f["old_path"]:
+                    earlier[f["old_path"]] = key
+                entry = window.setdefault(key, {
+                    "path": f["path"], "commits": 0, "churn": 0, "binary": False, "authors": set(),
+                })
+                entry["commits"] += 1
+                entry["churn"] += (f["added"] or 0) + (f["deleted"] or 0)
+                entry["binary"] = entry["binary"] or f["added"] is None
+                entry["authors"].add(commit["author"] or "Unknown")
+        for key, entry in window.items():
+            entry["path"] = self.files.get(key, entry)["path"]
+            entry["authors"] = len(entry["authors"])
+        return sorted(window.values(), key=_rank_key)[:n]
+
+
+_shared: Dict[Optional[str], HotspotIndex] = {}
+
+
+def shared_index(cwd: Optional[str] = None) -> HotspotIndex:
+    """프로세스 전역 인덱스 (한 번만 로드하고 HEAD까지 갱신)"""
+    if cwd not in _shared:
+        index = HotspotIndex(cwd=cwd)
+        index.update()
+        _shared[cwd] = index
+    return _shared[cwd]
+
+
+def rank_hotspots(commits: Sequence[Dict], n: int = 10) -> List[Dict]:
+    """커밋 구간의 이름 변경/바이너리 인식 hotspot 순위"""
+    return shared_index().rank(commits, n)
@@ -0,0 +1,267 @@
+"""
+HTTP Client
+Discord 웹훅 등 DevLog 알림 스크립트가 공유하는 경량 HTTP 클라이언트입니다.
+
+- (scheme, host, port)별 keep-alive 연결 풀 (스레드 안전, 유휴 연결 상한)
+- 요청별 타임아웃, 재사용한 연결이 끊겨 있으면 새 연결로 한 번 더 시도
+- 일시적 오류(429/5xx/타임아웃/연결 오류)에 대한 지수 백오프 재시도, 429는 Retry-After 우선
+- TokenBucket: `X-RateLimit-*` 헤더를 따라가는 웹훅별 요청 속도 제한
+- JSON 요청/응답 도우미 (post_json, HttpResponse.json)
+
+환경 변수:
+  DEVLOG_HTTP_TIMEOUT   요청별 타임아웃 초 (기본 10)
+  DEVLOG_HTTP_RETRIES   재시도 횟수 (기본 3)
+"""
+
+import http.client
+import json
+import os
+import random
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from tracing import span
+
+DEFAULT_TIMEOUT = float(os.environ.get("DEVLOG_HTTP_TIMEOUT", "10"))
+DEFAULT_RETRIES = int(os.environ.get("DEVLOG_HTTP_RETRIES", "3"))
+MAX_IDLE_PER_HOST = 4
+# 429 응답에 대기 시간이 없을 때 기본 대기 (초)
+DEFAULT_RETRY_AFTER = 1.0
+
+
+class HttpError(RuntimeError):
+    """재시도 후에도 실패한 HTTP 요청 (status가 None이면 연결/타임아웃 오류)"""
+
+    def __init__(self, status: Optional[int], message: str, body: str = ""):
+        super().__init__(f"{status} {message}" if status else message)
+        self.status = status
+        self.body = body
+
+    @property
+    def transient(self) -> bool:
+        return self.status is None or self.status == 429 or self.status >= 500
+
+
+class HttpResponse:
+    def __init__(self, status: int, reason: str, headers, body: bytes):
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self.body = body
+
+    @property
+    def text(self) -> str:
+        return self.body.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        """본문을 JSON으로 파싱 (빈 본문이나 JSON이 아니면 None)"""
+        if not self.body:
+            return None
+        try:
+            return json.loads(self.body)
+        except ValueError:
+            return None
+
+
+def retry_after(response: HttpResponse) -> float:
+    """429 응답의 대기 시간 (JSON retry_after → Retry-After 헤더 순)"""
+    body = response.json()
+    if isinstance(body, dict) and body.get("retry_after") is not None:
+        try:
+            return float(body["retry_after"])
+        except (TypeError, ValueError):
+            pass
+    try:
+        return float(response.headers.get("Retry-After"))
+    except (TypeError, ValueError):
+        return DEFAULT_RETRY_AFTER
+
+
+class TokenBucket:
+    """웹훅별 토큰 버킷 (Discord 기본 5회/2초, 응답 헤더로 보정)"""
+
+    def __init__(self, size: int = 5, window: float = 2.0):
+        self.size = size
+        self.window = window
+        self.tokens = float(size)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.size, self.tokens + (now - self.updated) * self.size / self.window)
+                self.updated = now
+                wait = self.blocked_until - now
+                if wait <= 0 and self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                if wait <= 0:
+                    wait = (1 - self.tokens) * self.window / self.size
+            time.sleep(wait)
+
+    def observe(self, headers) -> None:
+        """`X-RateLimit-Limit/Remaining/Reset-After` 헤더 반영"""
+        limit = headers.get("X-RateLimit-Limit")
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset_after = headers.get("X-RateLimit-Reset-After")
+        with self.lock:
+            if limit and limit.isdigit() and int(limit) > 0:
+                self.size = int(limit)
+            if remaining is None or reset_after is None:
+                return
+            try:
+                remaining_n, reset_s = int(remaining), float(reset_after)
+            except ValueError:
+                return
+            self.tokens = min(self.tokens, remaining_n)
+            if remaining_n == 0:
+                self.blocked_until = max(self.blocked_until, time.monotonic() + reset_s)
+
+    def block_for(self, seconds: float) -> None:
+        with self.lock:
+            self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+
+
+class HttpClient:
+    def __init__(
+        self,
+        timeout: float = DEFAULT_TIMEOUT,
+        retries: int = DEFAULT_RETRIES,
+        backoff: float = 0.5,
+        max_idle: int = MAX_IDLE_PER_HOST,
+    ):
+        self.timeout = timeout
+        self.retries = max(0, retries)
+        self.backoff = backoff
+        self.max_idle = max_idle
+        self._idle: Dict[Tuple[str, str, int], List[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+
+    def _checkout(self, key, timeout: float, fresh: bool):
+        """풀에서 유휴 연결을 꺼내거나 새로 생성, (연결, 재사용 여부) 반환"""
+        if not fresh:
+            with self._lock:
+                idle = self._idle.get(key)
+                conn = idle.pop() if idle else None
+            if conn is not None:
+                conn.timeout = timeout
+                if conn.sock is not None:
+                    conn.sock.settimeout(timeout)
+                return conn, True
+        scheme, host, port = key
+        cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        return cls(host, port, timeout=timeout), False
+
+    def _checkin(self, key, conn) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_idle:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def close(self) -> None:
+        with self._lock:
+            pools, self._idle = self._idle, {}
+        for idle in pools.values():
+            for conn in idle:
+                conn.close()
+
+    def _send_once(self, method: str, url: str, body: Optional[bytes], headers: Dict[str, str], timeout: float) -> HttpResponse:
+        parts = urlsplit(url)
+        scheme = parts.scheme or "http"
+        key = (scheme, parts.hostname or "", parts.port or (443 if scheme == "https" else 80))
+        target = parts.path or "/"
+        if parts.query:
+            target += "?" + parts.query
+
+        for fresh in (False, True):
+            conn, reused = self._checkout(key, timeout, fresh)
+            try:
+                conn.request(method, target, body=body, headers=headers)
+                resp = conn.getresponse()
+                data = resp.read()
+            except (ConnectionError, http.client.HTTPException):
+                conn.close()
+                # keep-alive 연결이 서버 쪽에서 이미 닫힌 경우
+                if reused:
+                    continue
+                raise
+            except Exception:
+                conn.close()
+                raise
+            if resp.will_close:
+                conn.close()
+            else:
+                self._checkin(key, conn)
+            return HttpResponse(resp.status, resp.reason, resp.headers, data)
+        raise AssertionError("unreachable")
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        limiter: Optional[TokenBucket] = None,
+    ) -> HttpResponse:
+        """요청 (타임아웃 + 재시도), 2xx/3xx 응답 반환 또는 HttpError"""
+        headers = dict(headers or {})
+        timeout = timeout if timeout is not None else self.timeout
+        with span(f"http.{method}", host=urlsplit(url).hostname) as info:
+            return self._request(method, url, body, headers, timeout, limiter, info)
+
+    def _request(self, method, url, body, headers, timeout, limiter, info) -> HttpResponse:
+        attempt = 0
+        while True:
+            info["attempts"] = attempt + 1
+            if limiter:
+                limiter.acquire()
+            delay = None
+            try:
+                resp = self._send_once(method, url, body, headers, timeout)
+            except (OSError, http.client.HTTPException) as exc:
+                error = HttpError(None, str(exc) or type(exc).__name__)
+            else:
+                if limiter:
+                    limiter.observe(resp.headers)
+                if resp.status < 400:
+                    return resp
+                error = HttpError(resp.status, resp.reason, resp.text)
+                if resp.status == 429:
+                    delay = retry_after(resp)
+                    if limiter:
+                        limiter.block_for(delay)
+                        delay = 0.0
+
+            if attempt >= self.retries or not error.transient:
+                raise error
+            if delay is None:
+                delay = self.backoff * (2 ** attempt) + random.uniform(0, self.backoff)
+            attempt += 1
+            time.sleep(delay)
+
+    def post_json(self, url: str, payload: Any, timeout: Optional[float] = None, limiter: Optional[TokenBucket] = None) -> Any:
+        """JSON POST, 응답 본문을 JSON으로 파싱해 반환 (본문이 없으면 None)"""
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        headers = {"Content-Type": "application/json", "User-Agent": "DevLog-Bot"}
+        return self.request("POST", url, body, headers, timeout=timeout, limiter=limiter).json()
+
+
+_shared_client: Optional[HttpClient] = None
+_shared_lock = threading.Lock()
+
+
+def shared_client() -> HttpClient:
+    """프로세스 전역 클라이언트 (여러 알림이 같은 연결 풀을 재사용)"""
+    global _shared_client
+    with _shared_lock:
+        if _shared_client is None:
+            _shared_client = HttpClient()
+        return _shared_client
@@ -0,0 +1,329 @@
+"""
+LLM Client
+DevLog 스크립트가 공유하는 OpenAI 호출 계층입니다.
+
+- 동시 요청 수 제한 (프로세스 전역 세마포어)
+- 요청별 타임아웃
+- 일시적 오류(429/5xx/타임아웃/연결 오류)에 대한 지수 백오프 재시도
+- 독립적인 프롬프트를 스레드 풀로 동시에 실행하는 run_concurrently()
+- hash(model, system, user, temperature, max_tokens) 기반 디스크 응답 캐시 (TTL + 개수 상한)
+  기본 OpenAI 외의 백엔드/엔드포인트 응답은 백엔드 이름과 base URL을 키에 넣어 실제 응답과 섞이지 않게 분리
+- 교체 가능한 백엔드: openai(실제 API 또는 DEVLOG_LLM_BASE_URL의 호환 서버), record, replay
+
+환경 변수:
+  DEVLOG_LLM_CONCURRENCY  동시 요청 상한 (기본 4)
+  DEVLOG_LLM_TIMEOUT      요청별 타임아웃 초 (기본 60)
+  DEVLOG_LLM_RETRIES      재시도 횟수 (기본 3)
+  DEVLOG_LLM_NO_CACHE     1이면 응답 캐시 사용 안 함 (--no-cache와 동일)
+  DEVLOG_LLM_CACHE_TTL    캐시 유효 기간 초 (기본 30일)
+  DEVLOG_LLM_CACHE_MAX    캐시 최대 항목 수 (기본 500)
+  DEVLOG_LLM_BACKEND      openai | record | replay (기본 openai)
+  DEVLOG_LLM_BASE_URL     OpenAI 호환 엔드포인트 (예: mock_llm_server.py의 http://127.0.0.1:8765/v1)
+  DEVLOG_LLM_FIXTURES     record/replay 응답 디렉토리 (기본 Saved/DevLog/llm_fixtures)
+
+오프라인 측정 시에는 응답 캐시가 요청을 가로채지 않도록 DEVLOG_LLM_NO_CACHE=1 과 함께 사용합니다.
+"""
+
+import hashlib
+import json
+import os
+import random
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+from paths import STATE_DIR
+from tracing import span
+
+DEFAULT_CONCURRENCY = int(os.environ.get("DEVLOG_LLM_CONCURRENCY", "4"))
+DEFAULT_TIMEOUT = float(os.environ.get("DEVLOG_LLM_TIMEOUT", "60"))
+DEFAULT_RETRIES = int(os.environ.get("DEVLOG_LLM_RETRIES", "3"))
+DEFAULT_CACHE = os.environ.get("DEVLOG_LLM_NO_CACHE", "").lower() not in ("1", "true", "yes")
+CACHE_DIR = STATE_DIR / "llm_cache"
+CACHE_TTL = float(os.environ.get("DEVLOG_LLM_CACHE_TTL", str(30 * 24 * 3600)))
+CACHE_MAX_ENTRIES = int(os.environ.get("DEVLOG_LLM_CACHE_MAX", "500"))
+DEFAULT_BACKEND = os.environ.get("DEVLOG_LLM_BACKEND", "openai").lower()
+BASE_URL = os.environ.get("DEVLOG_LLM_BASE_URL") or None
+FIXTURE_DIR = Path(os.environ.get("DEVLOG_LLM_FIXTURES", str(STATE_DIR / "llm_fixtures")))
+
+TRANSIENT_ERRORS = ("APITimeoutError", "APIConnectionError", "RateLimitError", "InternalServerError")
+
+
+class LLMError(RuntimeError):
+    """재시도 후에도 실패한 LLM 요청"""
+
+
+def is_transient(exc: Exception) -> bool:
+    """재시도할 가치가 있는 오류인지 판별"""
+    if type(exc).__name__ in TRANSIENT_ERRORS:
+        return True
+    status = getattr(exc, "status_code", None)
+    return status == 429 or (isinstance(status, int) and status >= 500)
+
+
+def cache_key(
+    model: str,
+    system_prompt: str,
+    user_prompt: str,
+    temperature: float,
+    max_tokens: Optional[int],
+    scope: str = "",
+) -> str:
+    """요청 내용(+ 응답 출처 scope)으로부터 캐시 키(SHA-256) 생성"""
+    fields = [model, system_prompt, user_prompt, temperature, max_tokens]
+    if scope:
+        fields.append(scope)
+    payload = json.dumps(fields, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """키별 JSON 파일로 저장하는 응답 캐시 (만료 + 오래된 항목부터 축출)"""
+
+    def __init__(self, directory: Path = CACHE_DIR, ttl: float = CACHE_TTL, max_entries: int = CACHE_MAX_ENTRIES):
+        self.directory = Path(directory)
+        self.ttl = ttl
+        self.max_entries = max_entries
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> Optional[str]:
+        path = self._path(key)
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl:
+                path.unlink()
+                return None
+            return json.loads(path.read_text(encoding="utf-8"))["response"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def put(self, key: str, response: str, meta: Optional[Dict] = None) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        record = dict(meta or {}, response=response, created_at=time.time())
+        tmp = self._path(key).with_suffix(f".{threading.get_ident()}.tmp")
+        tmp.write_text(json.dumps(record, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, self._path(key))
+        self._evict()
+
+    def _evict(self) -> None:
+        entries = []
+        now = time.time()
+        for path in self.directory.glob("*.json"):
+            try:
+                mtime = path.stat().st_mtime
+            except OSError:
+                continue
+            if now - mtime > self.ttl:
+                path.unlink(missing_ok=True)
+            else:
+                entries.append((mtime, path))
+        if len(entries) > self.max_entries:
+            entries.sort()
+            for _, path in entries[: len(entries) - self.max_entries]:
+                path.unlink(missing_ok=True)
+
+
+class OpenAIBackend:
+    """OpenAI SDK 백엔드 (base_url 지정 시 로컬 호환 서버 사용)"""
+
+    def __init__(self, api_key: Optional[str], timeout: float, base_url: Optional[str] = BASE_URL):
+        self.api_key = api_key
+        self.timeout = timeout
+        self.base_url = base_url
+        # 로컬 호환 서버는 실제 키가 필요 없음
+        self.needs_key = not base_url
+        self._client = None
+        self._lock = threading.Lock()
+
+    def _openai(self):
+        with self._lock:
+            if self._client is None:
+                from openai import OpenAI
+                # 재시도는 LLMClient 계층에서 직접 관리
+                self._client = OpenAI(
+                    api_key=self.api_key or "local",
+                    base_url=self.base_url,
+                    timeout=self.timeout,
+                    max_retries=0,
+                )
+            return self._client
+
+    def request(self, messages, model, temperature, max_tokens) -> str:
+        kwargs = {"model": model, "messages": messages, "temperature": temperature}
+        if max_tokens:
+            kwargs["max_tokens"] = max_tokens
+        response = self._openai().chat.completions.create(**kwargs)
+        return (response.choices[0].message.content or "").strip()
+
+
+def fixture_store(directory: Path) -> ResponseCache:
+    # 녹화 응답은 만료/축출 없이 보관
+    return ResponseCache(directory, ttl=float("inf"), max_entries=sys.maxsize)
+
+
+def messages_key(messages, model, temperature, max_tokens) -> str:
+    return cache_key(model, messages[0]["content"], messages[1]["content"], temperature, max_tokens)
+
+
+class ReplayBackend:
+    """녹화된 응답만 반환하는 오프라인 백엔드"""
+
+    needs_key = False
+
+    def __init__(self, directory: Path = FIXTURE_DIR):
+        self.store = fixture_store(directory)
+
+    def request(self, messages, model, temperature, max_tokens) -> str:
+        key = messages_key(messages, model, temperature, max_tokens)
+        response = self.store.get(key)
+        if response is None:
+            raise LLMError(f"녹화된 응답이 없습니다: {key[:12]} ({self.store.directory})")
+        return response
+
+
+class RecordBackend:
+    """다른 백엔드의 응답을 replay용 fixture로 기록"""
+
+    def __init__(self, inner, directory: Path = FIXTURE_DIR):
+        self.inner = inner
+        self.needs_key = inner.needs_key
+        self.store = fixture_store(directory)
+
+    def request(self, messages, model, temperature, max_tokens) -> str:
+        response = self.inner.request(messages, model, temperature, max_tokens)
+        self.store.put(messages_key(messages, model, temperature, max_tokens), response, {"model": model})
+        return response
+
+
+def make_backend(name: str, api_key: Optional[str], timeout: float):
+    """이름으로 백엔드 생성"""
+    if name == "openai":
+        return OpenAIBackend(api_key, timeout)
+    if name == "replay":
+        return ReplayBackend()
+    if name == "record":
+        return RecordBackend(OpenAIBackend(api_key, timeout))
+    raise ValueError(f"알 수 없는 LLM 백엔드: {name} (openai | record | replay)")
+
+
+def cache_scope(name: str, base_url: Optional[str] = BASE_URL) -> str:
+    """응답 캐시 구분자 (실제 OpenAI API는 빈 문자열, 그 외는 백엔드 이름 + base URL)"""
+    if name == "openai" and not base_url:
+        return ""
+    return f"{name}|{base_url or ''}"
+
+
+class LLMClient:
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        timeout: float = DEFAULT_TIMEOUT,
+        retries: int = DEFAULT_RETRIES,
+        backoff: float = 1.0,
+        cache: bool = DEFAULT_CACHE,
+        backend: str = DEFAULT_BACKEND,
+    ):
+        self.api_key = api_key if api_key is not None else os.environ.get("OPENAI_API_KEY")
+        self.concurrency = max(1, concurrency)
+        self.timeout = timeout
+        self.retries = max(0, retries)
+        self.backoff = backoff
+        self.cache = ResponseCache() if cache else None
+        self.backend = make_backend(backend, self.api_key, timeout)
+        self.scope = cache_scope(backend)
+        self._slots = threading.BoundedSemaphore(self.concurrency)
+
+    def available(self) -> bool:
+        return bool(self.api_key) or not self.backend.needs_key
+
+    def _request(self, messages, model, temperature, max_tokens) -> str:
+        return self.backend.request(messages, model, temperature, max_tokens)
+
+    def complete(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        model: str = "gpt-4o-mini",
+        temperature: float = 0.5,
+        max_tokens: Optional[int] = None,
+    ) -> str:
+        """단일 chat completion 요청 (캐시 + 동시성 상한 + 타임아웃 + 재시도)"""
+        key = cache_key(model, system_prompt, user_prompt, temperature, max_tokens, self.scope)
+        with span("gpt.complete", model=model) as info:
+            if self.cache:
+                cached = self.cache.get(key)
+                if cached is not None:
+                    info["cached"] = True
+                    return cached
+
+            response = self._complete_uncached(system_prompt, user_prompt, model, temperature, max_tokens)
+            if self.cache and response:
+                self.cache.put(key, response, {"model": model})
+            return response
+
+    def _complete_uncached(self, system_prompt, user_prompt, model, temperature, max_tokens) -> str:
+        if not self.available():
+            raise LLMError("OPENAI_API_KEY가 설정되지 않았습니다.")
+
+        messages = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt},
+        ]
+        attempt = 0
+        while True:
+            with self._slots:
+                try:
+                    return self._request(messages, model, temperature, max_tokens)
+                except Exception as exc:
+                    if attempt >= self.retries or not is_transient(exc):
+                        raise LLMError(str(exc)) from exc
+            # 슬롯을 반납한 상태에서 대기해야 다른 요청이 진행됨
+            delay = self.backoff * (2 ** attempt) + random.uniform(0, self.backoff)
+            attempt += 1
+            time.sleep(delay)
+
+
+_default_client: Optional[LLMClient] = None
+_default_lock = threading.Lock()
+
+
+def get_client() -> LLMClient:
+    """프로세스 전역 클라이언트 (동시성 상한을 모든 호출자가 공유)"""
+    global _default_client
+    with _default_lock:
+        if _default_client is None:
+            _default_client = LLMClient()
+        return _default_client
+
+
+def configure(concurrency: Optional[int] = None, cache: Optional[bool] = None, **kwargs) -> LLMClient:
+    """전역 클라이언트를 재생성 (지정하지 않은 설정은 기존 값 유지)"""
+    global _default_client
+    with _default_lock:
+        current = _default_client
+        if concurrency is None:
+            concurrency = current.concurrency if current else DEFAULT_CONCURRENCY
+        if cache is None:
+            cache = (current.cache is not None) if current else DEFAULT_CACHE
+        _default_client = LLMClient(concurrency=concurrency, cache=cache, **kwargs)
+        return _default_client
+
+
+def run_concurrently(tasks: Dict[str, Callable[[], str]], max_workers: Optional[int] = None) -> Dict[str, str]:
+    """독립적인 작업들을 동시에 실행하고 이름별 결과 반환
+
+    각 작업의 예외는 호출자에게 그대로 전파됩니다.
+    """
+    if not tasks:
+        return {}
+    # concurrent.futures는 logging까지 끌어와 무거우므로 동시 실행이 필요할 때만 로드
+    from concurrent.futures import ThreadPoolExecutor
+
+    workers = max_workers or min(len(tasks), get_client().concurrency)
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = {name: pool.submit(fn) for name, fn in tasks.items()}
+        return {name: f.result() for name, f in futures.items()}
@@ -0,0 +1,103 @@
+"""
+Markdown Sections
+DevLog 마크다운을 `## ` 헤더 단위 섹션으로 한 번만 파싱해 수정하고 한 번에 직렬화합니다.
+
+- 첫 `## ` 헤더 이전 내용(preamble)과 각 섹션 원문을 그대로 보관하므로 수정하지 않은 섹션은 바이트 단위로 보존
+- 코드 펜스(```) 안의 `## ` 줄은 헤더로 취급하지 않음
+- 같은 제목이 여러 번 나오면 첫 번째 섹션을 대상으로 함
+- 교체/추가 시 공백은 이전 update_devlog.update_section과 동일
+  (교체한 섹션 뒤에 다음 헤더가 있으면 빈 줄 두 개, 추가는 문서 앞뒤 공백을 정리하고 빈 줄 하나)
+"""
+
+import re
+from typing import Dict, List, Optional
+
+# 코드 펜스 줄(그룹 1) 또는 `## ` 헤더 줄(그룹 2, 제목)
+BOUNDARY_RE = re.compile(r"^(?:[ \t]*(```).*|## (.*?)\r?)(?:\n|\Z)", re.MULTILINE)
+
+
+class Section:
+    def __init__(self, title: str, header: str, body: str):
+        self.title = title    # `## ` 뒤의 제목 텍스트
+        self.header = header  # 줄바꿈을 포함한 헤더 줄 원문
+        self.body = body      # 다음 `## ` 헤더 직전까지의 본문 원문
+
+    def lines(self) -> List[str]:
+        return self.body.splitlines()
+
+
+class MarkdownDocument:
+    def __init__(self, text: str = ""):
+        self.preamble = ""
+        self.sections: List[Section] = []
+        self._index: Dict[str, int] = {}
+        self._parse(text)
+
+    def _parse(self, text: str) -> None:
+        # 헤더/펜스 줄만 정규식으로 훑어 경계를 찾고, 본문은 원문을 잘라 그대로 보관
+        bounds = []
+        in_fence = False
+        for match in BOUNDARY_RE.finditer(text):
+            if match.group(1):
+                in_fence = not in_fence
+            elif not in_fence:
+                bounds.append((match.start(), match.end(), match.group(2).strip()))
+
+        self.preamble = text[:bounds[0][0]] if bounds else text
+        for i, (start, header_end, title) in enumerate(bounds):
+            end = bounds[i + 1][0] if i + 1 < len(bounds) else len(text)
+            self._index.setdefault(title, len(self.sections))
+            self.sections.append(Section(title, text[start:header_end], text[header_end:end]))
+
+    def titles(self) -> List[str]:
+        return [s.title for s in self.sections]
+
+    def get(self, title: str) -> Optional[Section]:
+        """제목이 정확히 일치하는 첫 섹션"""
+        i = self._index.get(title)
+        return self.sections[i] if i is not None else None
+
+    def find(self, prefix: str) -> Optional[Section]:
+        """제목이 prefix로 시작하는 첫 섹션 (예: `1. 오늘의 핵심 변경` → `1. 오늘의 핵심 변경 (Top Changes)`)"""
+        section = self.get(prefix)
+        if section:
+            return section
+        return next((s for s in self.sections if s.title.startswith(prefix)), None)
+
+    def set(self, title: str, content: str) -> None:
+        """섹션 본문 교체, 없으면 문서 끝에 새 섹션으로 추가"""
+        content = content.strip()
+        section = self.get(title)
+        if section:
+            # 다음 헤더 앞의 줄바꿈은 그대로 남김
+            section.body = content + ("\n\n\n" if section is not self.sections[-1] else "\n\n")
+            return
+
+        # 문서 앞뒤 공백을 정리하고 빈 줄 하나 뒤에 추가
+        if self.sections:
+            self.preamble = self.preamble.lstrip()
+            last = self.sections[-1]
+            body = last.body.rstrip()
+            if body:
+                last.body = body + "\n\n"
+            else:
+                # 본문이 비어 있으면 헤더 줄바꿈까지 정리된 것과 같음
+                last.header = last.header.rstrip() + "\n"
+                last.body = "\n"
+        else:
+            self.preamble = self.preamble.strip() + "\n\n"
+        self._index[title] = len(self.sections)
+        self.sections.append(Section(title, f"## {title}\n", content + "\n"))
+
+    def update(self, updates: Dict[str, str]) -> "MarkdownDocument":
+        for title, content in updates.items():
+            self.set(title, content)
+        return self
+
+    def render(self) -> str:
+        return self.preamble + "".join(section.header + section.body for section in self.sections)
+
+
+def update_sections(text: str, updates: Dict[str, str]) -> str:
+    """여러 섹션을 한 번의 파싱/직렬화로 교체 또는 추가"""
+    return MarkdownDocument(text).update(updates).render()
@@ -0,0 +1,247 @@
+"""
+Meeting Index
+Documents/Meeting 회의록을 한 번만 파싱해 구조화된 JSON 사이드카와 날짜 → 파일 맵으로 유지하는 영속 인덱스입니다.
+
+- 대상: Documents/Meeting/{Daily,Common}/*.md, 루트의 `Meeting_*.md`/`YYYY-MM-DD.md` (이전 배치)
+- 사이드카(STATE_DIR/meetings/<하위 경로>.json): 날짜, 제목, 키워드, 참석자, 열린/닫힌 Action Item, 의사결정
+- 파일 크기/mtime이 같으면 읽지 않고, 달라도 내용 해시가 같으면 다시 파싱하지 않음 (체크아웃마다 mtime이 바뀌는 CI 대응)
+- 날짜 조회는 인덱스의 날짜 맵으로 바로 찾고, 같은 날짜는 Daily → Common → 루트 순
+"""
+
+import hashlib
+import json
+import re
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from md_sections import MarkdownDocument
+from paths import STATE_DIR
+from tracing import traced
+
+MEETING_ROOT = Path("Documents/Meeting")
+MEETING_DIRS = ("Daily", "Common")
+INDEX_DIR = STATE_DIR / "meetings"
+INDEX_PATH = INDEX_DIR / "index.json"
+INDEX_VERSION = 1
+
+FILENAME_DATE_RE = re.compile(r"^Meeting_(\d{2})(\d{2})(\d{2})")
+ISO_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+# `- 키워드: a, b` (Daily) / `- **키워드:** a, b` (Common)
+FIELD_RE = r"^- (?:\*\*)?{}:(?:\*\*)?[ \t]*(.+)$"
+KEYWORDS_RE = re.compile(FIELD_RE.format("키워드"), re.M)
+ATTENDEES_RE = re.compile(FIELD_RE.format("참석"), re.M)
+OPEN_ACTION_RE = re.compile(r"- \[ \] (.+)")
+CLOSED_ACTION_RE = re.compile(r"- \[[xX]\] (.+)")
+DECISION_RE = re.compile(r"^- \*\*결정[^*]*\*\*[ \t]*(.+?)\s*$", re.M)
+
+
+def _split_frontmatter(text: str):
+    """(`---` 블록 원문, 본문)"""
+    if not text.startswith("---"):
+        return "", text
+    end = text.find("\n---", 3)
+    if end < 0:
+        return "", text
+    body_start = text.find("\n", end + 4)
+    return text[3:end], text[body_start + 1:] if body_start >= 0 else ""
+
+
+def _load_frontmatter(raw: str) -> Dict:
+    if not raw.strip():
+        return {}
+    try:
+        import yaml  # 회의록이 바뀌었을 때만 필요
+    except ImportError:
+        return {}
+    try:
+        data = yaml.safe_load(raw)
+    except yaml.YAMLError:
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _as_list(value) -> List[str]:
+    if value is None:
+        return []
+    if isinstance(value, str):
+        value = value.split(",")
+    return [str(v).strip() for v in value if str(v).strip()]
+
+
+def _field(pattern, body: str) -> List[str]:
+    match = pattern.search(body)
+    return _as_list(match.group(1)) if match else []
+
+
+def note_date(path: Path, front: Dict) -> str:
+    """front matter `date` → 파일명(`Meeting_YYMMDD_*`, `YYYY-MM-DD`) 순으로 날짜 결정"""
+    value = str(front.get("date") or "").strip()
+    if ISO_DATE_RE.match(value):
+        return value
+    if ISO_DATE_RE.match(path.stem):
+        return path.stem
+    match = FILENAME_DATE_RE.match(path.name)
+    if match:
+        return "20{}-{}-{}".format(*match.groups())
+    return ""
+
+
+def parse_note(path: Path, text: str, kind: str = "") -> Dict:
+    """회의록 하나를 사이드카 레코드로 변환 (본문의 `- 키워드:`/`- 참석:` 줄 우선, 없으면 front matter)"""
+    raw, body = _split_frontmatter(text)
+    front = _load_frontmatter(raw)
+
+    decisions: List[str] = []
+    for section in MarkdownDocument(body).sections:
+        if "Decision" in section.title or "의사결정" in section.title:
+            decisions += DECISION_RE.findall(section.body)
+
+    title = front.get("title")
+    if not title:
+        heading = re.search(r"^# (.+)$", body, re.M)
+        title = heading.group(1).strip() if heading else path.stem
+    return {
+        "path": path.as_posix(),
+        "kind": kind,
+        "date": note_date(path, front),
+        "title": str(title),
+        "keywords": _field(KEYWORDS_RE, body) or _as_list(front.get("keywords")),
+        "attendees": _field(ATTENDEES_RE, body) or _as_list(front.get("attendees")),
+        "open_actions": OPEN_ACTION_RE.findall(body),
+        "closed_actions": CLOSED_ACTION_RE.findall(body),
+        "decisions": decisions,
+    }
+
+
+def _kind(rel: str) -> str:
+    """`Daily`/`Common` (루트의 회의록은 빈 문자열)"""
+    return rel.split("/", 1)[0] if "/" in rel else ""
+
+
+def _kind_order(rel: str) -> int:
+    kind = _kind(rel)
+    return MEETING_DIRS.index(kind) if kind in MEETING_DIRS else len(MEETING_DIRS)
+
+
+class MeetingIndex:
+    def __init__(self, root: Optional[Path] = None, state_dir: Optional[Path] = None):
+        self.root = Path(root) if root else MEETING_ROOT
+        self.state_dir = Path(state_dir) if state_dir else INDEX_DIR
+        self.path = self.state_dir / INDEX_PATH.name
+        # 회의록 상대 경로 → {hash, size, mtime_ns, date}
+        self.files: Dict[str, Dict] = {}
+        # 날짜 → 회의록 상대 경로 목록 (Daily → Common → 루트)
+        self.dates: Dict[str, List[str]] = {}
+        self._records: Dict[str, Dict] = {}
+        self._load()
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return
+        if data.get("version") != INDEX_VERSION:
+            return
+        self.files = data.get("files", {})
+        self.dates = data.get("dates", {})
+
+    def save(self) -> None:
+        self.state_dir.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        data = {"version": INDEX_VERSION, "files": self.files, "dates": self.dates}
+        tmp.write_text(json.dumps(data, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+        tmp.replace(self.path)
+
+    def sidecar_path(self, rel: str) -> Path:
+        return self.state_dir / Path(rel).with_suffix(".json")
+
+    def _scan(self) -> List[Path]:
+        notes = [p for d in MEETING_DIRS for p in sorted((self.root / d).glob("*.md"))]
+        notes += [p for p in sorted(self.root.glob("*.md"))
+                  if FILENAME_DATE_RE.match(p.name) or ISO_DATE_RE.match(p.stem)]
+        return notes
+
+    @traced("index.meeting_update")
+    def update(self) -> int:
+        """새로 생기거나 내용이 바뀐 회의록만 다시 파싱하고 저장, 다시 파싱한 파일 수 반환"""
+        seen = set()
+        parsed = 0
+        changed = False
+        for note in self._scan():
+            rel = note.relative_to(self.root).as_posix()
+            seen.add(rel)
+            stat = note.stat()
+            entry = self.files.get(rel)
+            if entry and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns \
+                    and self.sidecar_path(rel).exists():
+                continue
+
+            data = note.read_bytes()
+            digest = hashlib.sha1(data).hexdigest()
+            if not (entry and entry["hash"] == digest and self.sidecar_path(rel).exists()):
+                record = parse_note(note, data.decode("utf-8", errors="replace"), _kind(rel))
+                record["hash"] = digest
+                sidecar = self.sidecar_path(rel)
+                sidecar.parent.mkdir(parents=True, exist_ok=True)
+                sidecar.write_text(json.dumps(record, ensure_ascii=False, indent=2), encoding="utf-8")
+                self._records[rel] = record
+                entry = {"hash": digest, "date": record["date"]}
+                parsed += 1
+            self.files[rel] = dict(entry, size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+            changed = True
+
+        for rel in set(self.files) - seen:
+            del self.files[rel]
+            self._records.pop(rel, None)
+            self.sidecar_path(rel).unlink(missing_ok=True)
+            changed = True
+
+        if changed:
+            dates: Dict[str, List[str]] = {}
+            for rel, entry in self.files.items():
+                if entry["date"]:
+                    dates.setdefault(entry["date"], []).append(rel)
+            self.dates = {d: sorted(rels, key=lambda r: (_kind_order(r), r)) for d, rels in sorted(dates.items())}
+            self.save()
+        return parsed
+
+    def record(self, rel: str) -> Optional[Dict]:
+        """회의록 상대 경로의 사이드카 레코드"""
+        if rel not in self._records:
+            try:
+                self._records[rel] = json.loads(self.sidecar_path(rel).read_text(encoding="utf-8"))
+            except (OSError, json.JSONDecodeError):
+                return None
+        return self._records[rel]
+
+    def for_date(self, date: str, kind: Optional[str] = None) -> List[Dict]:
+        """날짜(YYYY-MM-DD)의 회의록 레코드 (kind 지정 시 `Daily`/`Common`만)"""
+        rels = self.dates.get(date, [])
+        if kind is not None:
+            rels = [r for r in rels if _kind(r) == kind]
+        return [r for r in map(self.record, rels) if r]
+
+    def find(self, date: str, kind: Optional[str] = None) -> Optional[Dict]:
+        """날짜의 대표 회의록 (Daily 우선)"""
+        records = self.for_date(date, kind)
+        return records[0] if records else None
+
+
+_shared: Dict[str, MeetingIndex] = {}
+
+
+def shared_index(root: Optional[Path] = None) -> MeetingIndex:
+    """프로세스 전역 인덱스 (한 번만 로드하고 변경된 회의록 반영)"""
+    key = str(root or MEETING_ROOT)
+    if key not in _shared:
+        index = MeetingIndex(root)
+        index.update()
+        _shared[key] = index
+    return _shared[key]
+
+
+def find_meeting(date: str, kind: Optional[str] = None) -> Optional[Dict]:
+    """날짜의 회의록 레코드 (없으면 None)"""
+    return shared_index().find(date, kind)
@@ -0,0 +1,217 @@
+"""
+Metrics Store
+흩어진 일일 `*.metrics.json`을 하나의 SQLite 파일에 모아 날짜 범위로 조회합니다.
+
+- `Documents/DevLog/Daily/*.metrics.json`, `Documents/DevLog/Metrics/YYYY-MM-DD.json`을
+  (경로, mtime, 크기) 기준으로 한 번만 읽어 `daily` 테이블에 반영합니다.
+  mtime/크기가 달라도 내용 해시(SHA-1)가 같으면 다시 반영하지 않습니다 (체크아웃마다 mtime이 바뀌는 CI 대응).
+- 주간/월간/Last30 리포트는 파일을 다시 열거나 git을 다시 조회하지 않고
+  `aggregate(start, end)` 한 번의 쿼리로 합계를 얻습니다.
+
+    python .github/scripts/devlog/metrics_store.py --from 2025-11-01 --to 2025-11-30
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import sqlite3
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from paths import STATE_DIR
+
+DB_PATH = STATE_DIR / "metrics.sqlite"
+SCHEMA_VERSION = 2
+SOURCE_GLOBS = (
+    ("Documents/DevLog/Daily", "*.metrics.json"),
+    ("Documents/DevLog/Metrics", "*.json"),
+)
+DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}")
+
+# 컬럼 이름 → 메트릭 JSON에서 값을 찾을 경로 후보 (generate_daily / build_daily_log / Tools/DevLog 스키마)
+COLUMNS = {
+    "commits": (("commit_count",), ("commits",)),
+    "authors": (("author_count",),),
+    "additions": (("additions",), ("adds",)),
+    "deletions": (("deletions",), ("dels",)),
+    "files_changed": (("files_changed",), ("files",)),
+    "tests_pass": (("tests", "pass"),),
+    "tests_fail": (("tests", "fail"),),
+    "build_success": (("ubt", "success"),),
+    "build_errors": (("ubt", "errors"),),
+    "build_warnings": (("ubt", "warnings"),),
+    "build_sec": (("ubt", "duration_sec"),),
+    "cook_sec": (("cook", "duration_sec"),),
+    "cook_errors": (("cook", "errors"),),
+}
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS sources (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    hash TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS daily (
+    date TEXT PRIMARY KEY,
+    {", ".join(f"{name} NUMERIC" for name in COLUMNS)},
+    source TEXT
+);
+"""
+
+
+def _lookup(metrics: Dict, path) -> Optional[float]:
+    value = metrics
+    for key in path:
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    if isinstance(value, bool):
+        return int(value)
+    return value if isinstance(value, (int, float)) else None
+
+
+def flatten(metrics: Dict) -> Dict:
+    """메트릭 JSON → daily 테이블 한 행"""
+    row = {}
+    for name, candidates in COLUMNS.items():
+        row[name] = next((v for v in (_lookup(metrics, c) for c in candidates) if v is not None), None)
+    return row
+
+
+class MetricsStore:
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else DB_PATH
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.db = sqlite3.connect(str(self.path))
+        self.db.row_factory = sqlite3.Row
+        if self.db.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            # 이전 스키마의 sources(해시 없음)는 버리고 다음 sync에서 다시 채움
+            self.db.execute("DROP TABLE IF EXISTS sources")
+            self.db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self.db.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self.db.close()
+
+    def _put(self, date: str, metrics: Dict, source: str) -> None:
+        row = flatten(metrics)
+        names = ["date", *row, "source"]
+        self.db.execute(
+            f"INSERT OR REPLACE INTO daily ({', '.join(names)}) VALUES ({', '.join('?' * len(names))})",
+            [date, *row.values(), source],
+        )
+
+    def upsert(self, date: str, metrics: Dict, source: str = "") -> None:
+        """하루치 메트릭 반영 (같은 날짜는 덮어씀, source 파일은 다음 sync에서 다시 읽지 않음)"""
+        self._put(date, metrics, source)
+        if source and Path(source).exists():
+            st = Path(source).stat()
+            self._mark(source, st, hashlib.sha1(Path(source).read_bytes()).hexdigest())
+        self.db.commit()
+
+    def _mark(self, source: str, st, digest: str) -> None:
+        self.db.execute("INSERT OR REPLACE INTO sources VALUES (?, ?, ?, ?)", (source, st.st_mtime_ns, st.st_size, digest))
+
+    def ingest(self, files: Iterable[Path]) -> int:
+        """내용이 바뀐(또는 처음 보는) 메트릭 파일만 읽어 반영, 반영한 파일 수 반환"""
+        known = {r["path"]: r for r in self.db.execute("SELECT * FROM sources")}
+        count = 0
+        for f in sorted(files):
+            if not DATE_RE.match(f.name):
+                continue
+            st = f.stat()
+            key = str(f)
+            entry = known.get(key)
+            if entry and (entry["mtime_ns"], entry["size"]) == (st.st_mtime_ns, st.st_size):
+                continue
+            try:
+                data = f.read_bytes()
+            except OSError:
+                continue
+            digest = hashlib.sha1(data).hexdigest()
+            if not (entry and entry["hash"] == digest):
+                try:
+                    metrics = json.loads(data.decode("utf-8"))
+                except (UnicodeDecodeError, json.JSONDecodeError):
+                    continue
+                self._put(metrics.get("date") or f.name[:10], metrics, key)
+                count += 1
+            self._mark(key, st, digest)
+        self.db.commit()
+        return count
+
+    def sync(self, root: Path = Path(".")) -> int:
+        """저장소의 알려진 메트릭 위치를 모두 스캔"""
+        files = []
+        for directory, pattern in SOURCE_GLOBS:
+            d = Path(root) / directory
+            if d.exists():
+                files.extend(d.glob(pattern))
+        return self.ingest(files)
+
+    def range(self, start: str, end: str) -> List[Dict]:
+        """start ~ end (포함) 일별 행"""
+        rows = self.db.execute("SELECT * FROM daily WHERE date BETWEEN ? AND ? ORDER BY date", (start, end))
+        return [dict(r) for r in rows]
+
+    def aggregate(self, start: str, end: str) -> Dict:
+        """start ~ end (포함) 합계/비율"""
+        row = self.db.execute(
+            """
+            SELECT COUNT(*) AS days,
+                   TOTAL(commits) AS commits,
+                   TOTAL(additions) AS additions,
+                   TOTAL(deletions) AS deletions,
+                   TOTAL(files_changed) AS files_changed,
+                   TOTAL(tests_pass) AS tests_pass,
+                   TOTAL(tests_fail) AS tests_fail,
+                   SUM(build_success = 0) AS build_failures,
+                   COUNT(build_success) AS builds,
+                   TOTAL(build_warnings) AS build_warnings
+            FROM daily WHERE date BETWEEN ? AND ?
+            """,
+            (start, end),
+        ).fetchone()
+        d = {k: (int(row[k]) if row[k] is not None else 0) for k in row.keys()}
+        tests = d["tests_pass"] + d["tests_fail"]
+        d["test_pass_rate"] = round(d["tests_pass"] / tests * 100, 1) if tests else None
+        d["start"], d["end"] = start, end
+        return d
+
+
+def open_store(root: Path = Path(".")) -> MetricsStore:
+    """스토어를 열고 새/변경된 메트릭 파일을 반영"""
+    store = MetricsStore()
+    store.sync(root)
+    return store
+
+
+def record(date: str, metrics: Dict, source="") -> None:
+    """메트릭 JSON을 쓴 직후 스토어에도 반영 (실패해도 리포트 생성은 계속)"""
+    try:
+        store = MetricsStore()
+        store.upsert(date, metrics, str(source))
+        store.close()
+    except sqlite3.Error as e:
+        print(f"⚠️ metrics store 갱신 실패: {e}")
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="DevLog metrics store")
+    ap.add_argument("--from", dest="start", required=True, help="시작 날짜 (YYYY-MM-DD)")
+    ap.add_argument("--to", dest="end", required=True, help="종료 날짜 (YYYY-MM-DD, 포함)")
+    ap.add_argument("--daily", action="store_true", help="합계 대신 일별 행 출력")
+    args = ap.parse_args(argv)
+
+    store = open_store()
+    result = store.range(args.start, args.end) if args.daily else store.aggregate(args.start, args.end)
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+    store.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
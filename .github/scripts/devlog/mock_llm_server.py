@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Mock LLM Server
+OpenAI 호환 `/v1/chat/completions` 엔드포인트를 흉내내는 로컬 서버입니다.
+
+실제 API 없이 DevLog GPT 경로의 종단 지연 시간과 동시성 동작을 측정하기 위해 사용합니다.
+- 요청별 지연 시간(--latency, --jitter)과 오류 주입(--error-rate, 429 응답)
+- --fixtures 지정 시 llm_client record 백엔드가 남긴 응답을 그대로 반환
+- GET /stats 로 총 요청 수와 최대 동시 처리 수 확인
+
+사용 예:
+  python .github/scripts/devlog/mock_llm_server.py --port 8765 --latency 1.5
+  DEVLOG_LLM_BASE_URL=http://127.0.0.1:8765/v1 DEVLOG_LLM_NO_CACHE=1 \\
+    python .github/scripts/devlog/update_devlog.py --mode daily --date 2025-01-01
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from llm_client import fixture_store, messages_key
+
+
+class MockState:
+    """서버 설정과 요청 통계"""
+
+    def __init__(self, latency, jitter, error_rate, fixtures=None):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.fixtures = fixture_store(Path(fixtures)) if fixtures else None
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def enter(self):
+        with self.lock:
+            self.requests += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+    def leave(self):
+        with self.lock:
+            self.in_flight -= 1
+
+    def snapshot(self):
+        with self.lock:
+            return {
+                "requests": self.requests,
+                "errors": self.errors,
+                "in_flight": self.in_flight,
+                "max_in_flight": self.max_in_flight,
+            }
+
+    def respond(self, payload):
+        """요청 본문에 대한 응답 텍스트 결정 (fixture 우선)"""
+        messages = payload.get("messages") or []
+        model = payload.get("model", "mock")
+        if self.fixtures and len(messages) >= 2:
+            key = messages_key(messages, model, payload.get("temperature"), payload.get("max_tokens"))
+            recorded = self.fixtures.get(key)
+            if recorded is not None:
+                return recorded
+        prompt = messages[-1]["content"] if messages else ""
+        return f"## Mock Response\n\n- model: {model}\n- prompt chars: {len(prompt)}\n"
+
+
+def make_handler(state):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _send_json(self, status, body):
+            data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self):
+            if self.path.rstrip("/") == "/stats":
+                self._send_json(200, state.snapshot())
+            else:
+                self._send_json(404, {"error": {"message": "not found"}})
+
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            raw = self.rfile.read(length)
+            if not self.path.rstrip("/").endswith("/chat/completions"):
+                self._send_json(404, {"error": {"message": "not found"}})
+                return
+
+            state.enter()
+            try:
+                time.sleep(max(0.0, state.latency + random.uniform(-state.jitter, state.jitter)))
+                if state.error_rate and random.random() < state.error_rate:
+                    with state.lock:
+                        state.errors += 1
+                    self._send_json(429, {"error": {"message": "mock rate limit", "type": "rate_limit"}})
+                    return
+
+                payload = json.loads(raw or b"{}")
+                content = state.respond(payload)
+                self._send_json(200, {
+                    "id": f"chatcmpl-mock-{state.requests}",
+                    "object": "chat.completion",
+                    "created": int(time.time()),
+                    "model": payload.get("model", "mock"),
+                    "choices": [{
+                        "index": 0,
+                        "message": {"role": "assistant", "content": content},
+                        "finish_reason": "stop",
+                    }],
+                    "usage": {
+                        "prompt_tokens": len(raw) // 4,
+                        "completion_tokens": len(content) // 4,
+                        "total_tokens": (len(raw) + len(content)) // 4,
+                    },
+                })
+            finally:
+                state.leave()
+
+        def log_message(self, fmt, *args):
+            pass
+
+    return Handler
+
+
+def main():
+    ap = argparse.ArgumentParser(description="OpenAI 호환 Mock LLM 서버")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8765)
+    ap.add_argument("--latency", type=float, default=1.0, help="요청별 기본 지연 시간(초)")
+    ap.add_argument("--jitter", type=float, default=0.0, help="지연 시간 편차(초)")
+    ap.add_argument("--error-rate", type=float, default=0.0, help="429 응답 비율 (0~1)")
+    ap.add_argument("--fixtures", default=None, help="record 백엔드가 기록한 응답 디렉토리")
+    args = ap.parse_args()
+
+    state = MockState(args.latency, args.jitter, args.error_rate, args.fixtures)
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(state))
+    print(f"🧪 Mock LLM 서버: http://{args.host}:{server.server_port}/v1 (latency={args.latency}s)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"📊 {json.dumps(state.snapshot())}")
+
+
+if __name__ == "__main__":
+    main()
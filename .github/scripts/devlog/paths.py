@@ -0,0 +1,10 @@
+"""
+DevLog Paths
+DevLog 스크립트가 공유하는 로컬 상태(캐시, 인덱스) 경로를 정의합니다.
+"""
+
+import os
+from pathlib import Path
+
+# 재생성 가능한 로컬 상태 저장 위치 (저장소 루트 기준, Saved/는 커밋 대상 아님)
+STATE_DIR = Path(os.environ.get("DEVLOG_STATE_DIR", "Saved/DevLog"))
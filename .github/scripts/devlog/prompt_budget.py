@@ -0,0 +1,204 @@
+"""
+Prompt Budget
+GPT 프롬프트를 토큰 예산 안에서 조립합니다.
+
+고정 글자 수로 자르는 대신 섹션별 토큰 수를 세고, 예산을 넘으면
+우선순위가 낮은 섹션부터 압축합니다. 압축은 제목/목록처럼 정보량이 큰 줄을
+먼저 남기고 코드 블록, 주석, 빈 줄 같은 줄부터 버립니다.
+
+tiktoken이 설치되어 있으면 정확한 토큰 수를, 없으면 근사치를 사용합니다.
+"""
+
+import re
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional
+
+HTML_COMMENT_RE = re.compile(r"<!--.*?-->", re.S)
+CODE_BLOCK_RE = re.compile(r"```.*?```", re.S)
+OMITTED = "…(생략)"
+
+
+@lru_cache(maxsize=None)
+def _encoding(model: str):
+    # tiktoken은 임포트만으로 수십 ms가 걸려 처음 토큰을 셀 때 로드
+    try:
+        import tiktoken
+    except ImportError:  # 선택 의존성
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("o200k_base")
+
+
+def count_tokens(text: str, model: str = "gpt-4o") -> int:
+    """텍스트의 토큰 수 (tiktoken이 없으면 ASCII 4자당 1토큰, 그 외 문자 1자당 1토큰으로 근사)"""
+    if not text:
+        return 0
+    enc = _encoding(model)
+    if enc is not None:
+        return len(enc.encode(text, disallowed_special=()))
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    return (ascii_chars + 3) // 4 + (len(text) - ascii_chars)
+
+
+def _line_score(line: str) -> int:
+    """줄의 정보량 점수 (높을수록 나중에 버림)"""
+    stripped = line.strip()
+    if stripped.startswith("#"):
+        return 3
+    if stripped.startswith(("- ", "* ", "**")) or re.match(r"\d+\. ", stripped):
+        return 2
+    if stripped.startswith("|") and not set(stripped) <= set("|-: "):
+        return 1
+    return 0
+
+
+def _head_chars(text: str, max_tokens: int, model: str) -> str:
+    """한 줄이 예산보다 길 때 글자 단위로 앞부분만 남김 (이분 탐색)"""
+    lo, hi = 0, len(text)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if count_tokens(text[:mid], model) <= max_tokens:
+            lo = mid
+        else:
+            hi = mid - 1
+    return text[:lo]
+
+
+def truncate_to_tokens(text: str, max_tokens: int, model: str = "gpt-4o") -> str:
+    """줄 단위로 앞에서부터 예산만큼만 남김"""
+    if max_tokens <= 0:
+        return ""
+    if count_tokens(text, model) <= max_tokens:
+        return text
+    kept, used = [], count_tokens(OMITTED, model)
+    for line in text.splitlines():
+        cost = count_tokens(line + "\n", model)
+        if used + cost > max_tokens:
+            break
+        kept.append(line)
+        used += cost
+    if not kept:
+        return _head_chars(text, max_tokens - count_tokens(OMITTED, model), model) + OMITTED
+    return "\n".join(kept + [OMITTED])
+
+
+def compact_markdown(text: str, max_tokens: int, model: str = "gpt-4o") -> str:
+    """마크다운을 예산에 맞게 압축 (정보량이 큰 줄을 우선 보존, 원래 순서 유지)"""
+    if count_tokens(text, model) <= max_tokens:
+        return text
+
+    text = HTML_COMMENT_RE.sub("", text)
+    text = CODE_BLOCK_RE.sub("", text)
+    lines = [line.rstrip() for line in text.splitlines() if line.strip()]
+    if count_tokens("\n".join(lines), model) <= max_tokens:
+        return "\n".join(lines)
+
+    budget = max_tokens - count_tokens(OMITTED, model)
+    costs = [count_tokens(line + "\n", model) for line in lines]
+    # 점수 높은 순, 같은 점수면 앞쪽 줄부터 채택
+    order = sorted(range(len(lines)), key=lambda i: (-_line_score(lines[i]), i))
+    chosen, used = set(), 0
+    for i in order:
+        if used + costs[i] <= budget:
+            chosen.add(i)
+            used += costs[i]
+    if not chosen:
+        return truncate_to_tokens("\n".join(lines), max_tokens, model)
+    return "\n".join([lines[i] for i in sorted(chosen)] + [OMITTED])
+
+
+class Section:
+    """프롬프트 섹션 (priority가 낮을수록 먼저 압축)"""
+
+    def __init__(
+        self,
+        name: str,
+        text: str,
+        priority: int = 1,
+        min_tokens: int = 0,
+        compact: Optional[Callable[[str, int, str], str]] = None,
+    ):
+        self.name = name
+        self.text = text or ""
+        self.priority = priority
+        self.min_tokens = min_tokens
+        self.compact = compact or compact_markdown
+
+
+def _water_fill(sizes: List[int], floors: List[int], target: int) -> List[int]:
+    """합이 target이 되도록 큰 섹션부터 깎은 섹션별 상한 계산"""
+    caps = list(sizes)
+    order = sorted(range(len(sizes)), key=lambda i: sizes[i])
+    remaining = target
+    for pos, i in enumerate(order):
+        share = remaining / (len(order) - pos)
+        if sizes[i] <= share:
+            remaining -= sizes[i]
+            continue
+        for j in order[pos:]:
+            caps[j] = min(sizes[j], max(floors[j], int(share)))
+        break
+    return caps
+
+
+def _drop(tier: List[Section], texts: Dict[str, str], sizes: Dict[str, int]) -> int:
+    """묶음의 마지막 섹션을 통째로 제외하고 줄어든 토큰 수 반환"""
+    section = tier.pop()
+    freed = sizes[section.name]
+    texts[section.name] = ""
+    sizes[section.name] = 0
+    return freed
+
+
+def fit_sections(sections: List[Section], budget: int, model: str = "gpt-4o") -> Dict[str, str]:
+    """섹션들을 토큰 예산에 맞춰 압축하고 이름별 텍스트 반환
+
+    우선순위가 낮은 묶음부터, 묶음 안에서는 큰 섹션부터 min_tokens까지 줄입니다.
+    하한 합계만으로도 예산을 넘으면 그 묶음의 뒤쪽 섹션(예: 가장 오래된 커밋)부터 통째로 빼며,
+    낮은 묶음이 예산을 넘는 동안에는 높은 묶음을 줄이지 않습니다. 결과 합계는 항상 budget 이하입니다.
+    """
+    texts = {s.name: s.text for s in sections}
+    sizes = {s.name: count_tokens(s.text, model) for s in sections}
+    overflow = sum(sizes.values()) - budget
+    if overflow <= 0:
+        return texts
+
+    for priority in sorted({s.priority for s in sections}):
+        tier = [s for s in sections if s.priority == priority]
+        # 이 묶음에 남길 수 있는 양보다 하한 합계가 크면 뒤쪽 섹션부터 제외
+        while tier and sum(min(s.min_tokens, sizes[s.name]) for s in tier) > sum(sizes[s.name] for s in tier) - overflow:
+            overflow -= _drop(tier, texts, sizes)
+        if overflow <= 0:
+            break
+
+        tier_sizes = [sizes[s.name] for s in tier]
+        floors = [min(s.min_tokens, sizes[s.name]) for s in tier]
+        target = max(sum(floors), sum(tier_sizes) - overflow)
+        caps = _water_fill(tier_sizes, floors, target)
+
+        for s, size, cap in zip(tier, tier_sizes, caps):
+            if cap >= size:
+                continue
+            texts[s.name] = s.compact(s.text, cap, model)
+            new_size = count_tokens(texts[s.name], model)
+            overflow -= size - new_size
+            sizes[s.name] = new_size
+
+        # 압축 결과가 상한을 조금 넘으면 뒤쪽 섹션을 한 번 더 줄이고, 그래도 넘으면 제외
+        while tier and overflow > 0:
+            last = tier[-1]
+            cap = sizes[last.name] - overflow
+            if cap > 0 and cap >= min(last.min_tokens, sizes[last.name]):
+                texts[last.name] = last.compact(texts[last.name], cap, model)
+                new_size = count_tokens(texts[last.name], model)
+                overflow -= sizes[last.name] - new_size
+                sizes[last.name] = new_size
+                if overflow <= 0:
+                    break
+            overflow -= _drop(tier, texts, sizes)
+        if overflow <= 0:
+            break
+
+    return texts
@@ -5,43 +5,31 @@ DevLog를 Discord로 전송하고 피드백을 유도합니다.
 """
 
 import argparse
-import json
 import re
 import os
-import subprocess
 from pathlib import Path
 from datetime import datetime
 
+from http_client import HttpError, shared_client
+from md_sections import MarkdownDocument
+from tracing import traced
+
+@traced("notify.discord")
 def send_webhook(webhook_url, payload):
-    """Discord Webhook으로 메시지 전송 (curl 사용)"""
+    """Discord Webhook으로 메시지 전송 (공유 keep-alive 연결 풀 사용)"""
     if not webhook_url:
         print("⚠️ Discord webhook URL이 설정되지 않았습니다.")
         return False
 
     try:
-        # curl을 사용하여 전송 (GitHub Actions에서 안정적)
-        result = subprocess.run(
-            [
-                'curl',
-                '-H', 'Content-Type: application/json',
-                '-X', 'POST',
-                '-d', json.dumps(payload),
-                webhook_url
-            ],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-
+        shared_client().post_json(webhook_url, payload)
         print("✅ Discord 메시지 전송 성공")
         return True
 
-    except subprocess.CalledProcessError as e:
-        print(f"❌ HTTP Error: curl failed with exit code {e.returncode}")
-        if e.stderr:
-            print(f"   Error: {e.stderr}")
-        if e.stdout:
-            print(f"   Response: {e.stdout}")
+    except HttpError as e:
+        print(f"❌ HTTP Error: {e}")
+        if e.body:
+            print(f"   Response: {e.body}")
         return False
     except Exception as e:
         print(f"❌ Error: {e}")
@@ -66,24 +54,20 @@ def extract_summary_from_daily(md_path):
 
     # 핵심 변경 추출 (최대 3개)
     top_changes = []
-    in_top_changes = False
-    for line in content.split('\n'):
-        if '## 1. 오늘의 핵심 변경' in line:
-            in_top_changes = True
-            continue
-        if in_top_changes:
-            if line.startswith('##'):
-                break
-            if line.startswith('- ['):
-                # [type] summary 형식 파싱
-                match = re.match(r'-\s*\[([^\]]+)\]\s*(.+)', line)
-                if match:
-                    top_changes.append({
-                        'type': match.group(1),
-                        'summary': match.group(2).split('—')[0].strip()
-                    })
-                    if len(top_changes) >= 3:
-                        break
+    section = MarkdownDocument(content).find('1. 오늘의 핵심 변경')
+    for line in section.lines() if section else []:
+        if line.startswith('##'):
+            break
+        if line.startswith('- ['):
+            # [type] summary 형식 파싱
+            match = re.match(r'-\s*\[([^\]]+)\]\s*(.+)', line)
+            if match:
+                top_changes.append({
+                    'type': match.group(1),
+                    'summary': match.group(2).split('—')[0].strip()
+                })
+                if len(top_changes) >= 3:
+                    break
 
     summary['top_changes'] = top_changes
 
@@ -328,7 +312,7 @@ def create_feedback_thread(webhook_url, message_content):
     }
     return feedback_guide
 
-def main():
+def main(argv=None):
     ap = argparse.ArgumentParser(description="Discord Webhook Sender")
     ap.add_argument("--webhook-url", required=True, help="Discord Webhook URL")
     ap.add_argument("--type", choices=["daily", "weekly", "meeting_log"], required=True, help="리포트 또는 메시지 타입")
@@ -336,7 +320,7 @@ def main():
     ap.add_argument("--date", help="날짜 또는 주차 (YYYY-MM-DD, YYYY-WXX 등)")
     ap.add_argument("--devlog-url", help="DevLog 온라인 URL")
     ap.add_argument("--notice", help="추가 안내 문구 (회의록 다중 변경 등)")
-    args = ap.parse_args()
+    args = ap.parse_args(argv)
 
     # DevLog 파일 확인
     if args.type in ["daily", "weekly", "meeting_log"]:
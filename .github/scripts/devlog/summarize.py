@@ -0,0 +1,149 @@
+"""
+Hierarchical Summarizer
+Daily → Weekly → Monthly 순으로 요약을 축약(map-reduce)합니다.
+
+- map: 각 Daily DevLog를 한 번만 요약하여 `Daily/<date>.summary.json` 사이드카에 저장
+  (원본 내용의 해시가 같으면 재사용하므로 이미 요약된 날은 다시 요청하지 않음)
+- reduce: 주간은 7개의 일일 요약을, 월간은 주간 요약들을 다시 요약
+
+큰 프롬프트 하나 대신 작은 요청 여러 개로 나뉘며, 일수가 늘어나도 요청 크기는 일정합니다.
+"""
+
+import datetime
+import hashlib
+import json
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from llm_client import get_client, run_concurrently
+from prompt_budget import compact_markdown
+from tracing import traced
+
+SUMMARY_MODEL = "gpt-4o-mini"
+DAY_INPUT_BUDGET = 3000
+SUMMARY_MAX_TOKENS = 600
+# 요약 실패 시 대신 사용할 압축 원문 크기
+FALLBACK_TOKENS = 400
+
+DAY_SYSTEM_PROMPT = """당신은 게임 개발팀의 DevLog를 요약하는 기술 문서 작성자입니다.
+하루치 DevLog에서 핵심 변경, 영향받은 시스템, 이슈/위험, 다음 작업만 추려
+5~8개의 bullet point로 간결하게 정리합니다. 클래스명/시스템명 등 고유명사는 유지합니다."""
+
+REDUCE_SYSTEM_PROMPT = """당신은 게임 개발팀의 진행 상황을 정리하는 프로젝트 리더입니다.
+여러 기간의 요약을 하나로 합쳐 주요 흐름, 핵심 성과, 반복되는 이슈, 다음 우선순위를
+6~10개의 bullet point로 정리합니다. 중복은 합치고 기간 간 변화가 드러나게 작성합니다."""
+
+
+def source_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def sidecar_path(md_path: Path) -> Path:
+    """`2025-11-10.md` → `2025-11-10.summary.json`"""
+    return md_path.with_suffix(".summary.json")
+
+
+def load_day_summary(md_path: Path, content: Optional[str] = None) -> Optional[str]:
+    """원본이 바뀌지 않았으면 사이드카의 요약 반환"""
+    sidecar = sidecar_path(md_path)
+    if not sidecar.exists():
+        return None
+    if content is None:
+        content = md_path.read_text(encoding="utf-8")
+    try:
+        data = json.loads(sidecar.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if data.get("source_hash") != source_hash(content):
+        return None
+    return data.get("summary")
+
+
+def summarize_day(md_path: Path) -> str:
+    """일일 DevLog 요약 (map 단계, 사이드카 캐시)"""
+    md_path = Path(md_path)
+    content = md_path.read_text(encoding="utf-8")
+    cached = load_day_summary(md_path, content)
+    if cached is not None:
+        return cached
+
+    user_prompt = f"# {md_path.stem} DevLog\n\n{compact_markdown(content, DAY_INPUT_BUDGET, SUMMARY_MODEL)}"
+    summary = get_client().complete(
+        DAY_SYSTEM_PROMPT, user_prompt, model=SUMMARY_MODEL, temperature=0.2, max_tokens=SUMMARY_MAX_TOKENS
+    )
+    sidecar_path(md_path).write_text(json.dumps({
+        "date": md_path.stem,
+        "source_hash": source_hash(content),
+        "model": SUMMARY_MODEL,
+        "summary": summary,
+    }, ensure_ascii=False, indent=2), encoding="utf-8")
+    return summary
+
+
+def _summarize_day_or_fallback(md_path: Path) -> str:
+    try:
+        return summarize_day(md_path)
+    except Exception as e:
+        print(f"⚠️ {md_path.name} 요약 실패, 압축 원문 사용: {e}")
+        return compact_markdown(md_path.read_text(encoding="utf-8"), FALLBACK_TOKENS, SUMMARY_MODEL)
+
+
+@traced("gpt.summarize_days")
+def summarize_days(md_paths: List[Path]) -> Dict[str, str]:
+    """여러 날을 동시에 요약하여 날짜별 요약 반환"""
+    tasks = {Path(p).stem: (lambda p=Path(p): _summarize_day_or_fallback(p)) for p in md_paths}
+    results = run_concurrently(tasks)
+    return {date: results[date] for date in sorted(results)}
+
+
+def reduce_summaries(title: str, summaries: Dict[str, str]) -> str:
+    """하위 기간 요약들을 하나로 축약 (reduce 단계)"""
+    body = "\n\n".join(f"### {label}\n{text}" for label, text in summaries.items() if text)
+    user_prompt = f"다음은 {title}의 기간별 요약입니다:\n\n{body}\n\n위 내용을 하나의 요약으로 정리해주세요."
+    return get_client().complete(
+        REDUCE_SYSTEM_PROMPT, user_prompt, model=SUMMARY_MODEL, temperature=0.2, max_tokens=SUMMARY_MAX_TOKENS
+    )
+
+
+def week_label(day: datetime.date) -> str:
+    """ISO 주차 라벨 (연도도 ISO 기준: 2024-12-30 → 2025-W01)"""
+    year, week, _ = day.isocalendar()
+    return f"{year}-W{week:02d}"
+
+
+def daily_logs_between(devlog_dir: Path, start: datetime.date, end: datetime.date) -> List[Path]:
+    """기간 내 존재하는 Daily DevLog 경로"""
+    paths = []
+    current = start
+    while current <= end:
+        path = Path(devlog_dir) / f"{current:%Y-%m-%d}.md"
+        if path.exists():
+            paths.append(path)
+        current += datetime.timedelta(days=1)
+    return paths
+
+
+@traced("gpt.summarize_weeks")
+def summarize_weeks(devlog_dir: Path, start: datetime.date, end: datetime.date) -> Dict[str, str]:
+    """기간 내 일일 요약을 주차별로 축약하여 주차 라벨별 요약 반환"""
+    day_summaries = summarize_days(daily_logs_between(devlog_dir, start, end))
+
+    weeks: Dict[str, Dict[str, str]] = {}
+    for date_str, summary in day_summaries.items():
+        day = datetime.datetime.strptime(date_str, "%Y-%m-%d").date()
+        weeks.setdefault(week_label(day), {})[date_str] = summary
+
+    tasks = {label: (lambda label=label, days=days: reduce_summaries(f"{label} 주간", days))
+             for label, days in weeks.items()}
+    results = run_concurrently(tasks)
+    return {label: results[label] for label in sorted(results)}
+
+
+def summarize_month(devlog_dir: Path, year: int, month: int) -> Optional[str]:
+    """월간 요약: 일일 → 주간 → 월간 순으로 축약"""
+    first = datetime.date(year, month, 1)
+    last = (datetime.date(year + (month == 12), month % 12 + 1, 1) - datetime.timedelta(days=1))
+    weekly = summarize_weeks(devlog_dir, first, last)
+    if not weekly:
+        return None
+    return reduce_summaries(f"{year}-{month:02d} 월간", weekly)
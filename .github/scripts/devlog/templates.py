@@ -0,0 +1,65 @@
+"""
+Templates
+DevLog 마크다운 템플릿(daily_template.md, weekly_template.md 등)을 공용 Jinja2 환경으로 렌더링합니다.
+
+- 템플릿 디렉토리별 Environment + FileSystemLoader를 프로세스에서 한 번만 생성 (컴파일 결과 메모리 캐시)
+- 컴파일된 바이트코드는 STATE_DIR/jinja에 저장해 다음 프로세스도 파싱/컴파일을 건너뜀
+  (원본이 바뀌면 체크섬이 달라져 자동으로 다시 컴파일)
+- render_many: 한 번 컴파일한 템플릿으로 여러 날짜의 문서를 연속 렌더링 (`devlog daily --until` 백필용)
+- 렌더링 결과는 기존 `jinja2.Template(text).render()`와 동일 (기본 Environment 설정 그대로)
+- jinja2는 처음 렌더링할 때 임포트 (스크립트 시작 시간 예산 유지)
+"""
+
+import functools
+from pathlib import Path
+from typing import Any, Dict, Iterable, Tuple, Union
+
+from fsutil import write_if_changed
+from paths import STATE_DIR
+from tracing import span
+
+TEMPLATE_DIR = Path(__file__).resolve().parent
+BYTECODE_DIR = STATE_DIR / "jinja"
+
+PathLike = Union[str, Path]
+
+
+@functools.lru_cache(maxsize=None)
+def environment(directory: str):
+    """템플릿 디렉토리별 공용 Environment"""
+    from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+
+    BYTECODE_DIR.mkdir(parents=True, exist_ok=True)
+    return Environment(
+        loader=FileSystemLoader(directory, encoding="utf-8"),
+        bytecode_cache=FileSystemBytecodeCache(str(BYTECODE_DIR)),
+    )
+
+
+def get_template(template: PathLike):
+    """템플릿 파일 경로(또는 TEMPLATE_DIR 기준 이름)의 컴파일된 템플릿"""
+    path = Path(template)
+    if not path.is_absolute() and not path.exists():
+        path = TEMPLATE_DIR / path
+    path = path.resolve()
+    with span("render.compile", template=path.name):
+        return environment(str(path.parent)).get_template(path.name)
+
+
+def render(template: PathLike, context: Dict[str, Any]) -> str:
+    return get_template(template).render(**context)
+
+
+
+def render_many(template: PathLike, jobs: Iterable[Tuple[Dict[str, Any], PathLike]]) -> int:
+    """(컨텍스트, 출력 경로) 목록을 하나의 컴파일된 템플릿으로 렌더링, 내용이 바뀐 파일 수 반환"""
+    compiled = get_template(template)
+    written = 0
+    with span("render.batch", template=Path(template).name) as info:
+        count = 0
+        for context, out_path in jobs:
+            count += 1
+            written += write_if_changed(Path(out_path), compiled.render(**context))
+        info["documents"] = count
+        info["written"] = written
+    return written
@@ -0,0 +1,178 @@
+"""
+Test Reports
+JUnit XML을 iterparse로 스트리밍 파싱하고, 테스트별 소요 시간 이력을 관리합니다.
+
+- 처리한 `<testcase>` 요소는 즉시 clear 하므로 수천 개 테스트 리포트에서도 트리가 쌓이지 않습니다.
+- pass/fail은 기존과 같이 `<testsuite>` 속성 합계(`tests - failures - errors`, 건너뛴 테스트는 pass에 포함)이며,
+  건너뛴 테스트 수는 `skipped`로 따로 기록합니다.
+- 이력은 날짜별 한 줄(`{"date", "tests": {이름: 초}}`)의 JSONL로 STATE_DIR에 저장하고,
+  최근 HISTORY_DAYS 일치만 유지합니다.
+"""
+
+import json
+import statistics
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from paths import STATE_DIR
+from tracing import traced
+
+HISTORY_PATH = STATE_DIR / "test_history.jsonl"
+HISTORY_DAYS = 30
+TRAILING_DAYS = 7
+TOP_SLOWEST = 10
+# 새로 느려진 테스트 판정: 최근 중앙값 대비 배율과 최소 증가 시간
+SLOW_RATIO = 1.5
+SLOW_MIN_DELTA = 0.5
+
+
+def _local(tag) -> str:
+    """네임스페이스를 제거한 태그 이름"""
+    return tag.rsplit("}", 1)[-1] if isinstance(tag, str) else ""
+
+
+def iter_testcases(path, properties: Optional[Dict] = None, suites: Optional[List[Dict]] = None) -> Iterator[Dict]:
+    """`<testcase>`를 하나씩 {name, seconds, status}로 반환 (`<property>`는 properties, `<testsuite>` 속성은 suites에 기록)"""
+    from lxml import etree
+
+    tags = ("{*}testcase", "{*}property", "{*}testsuite")
+    for _, elem in etree.iterparse(str(path), events=("end",), tag=tags):
+        kind = _local(elem.tag)
+        if kind == "property":
+            if properties is not None and elem.get("name"):
+                properties.setdefault(elem.get("name"), elem.get("value"))
+            continue
+        if kind == "testsuite":
+            if suites is not None:
+                suites.append(dict(elem.attrib))
+            continue
+
+        status = "passed"
+        for child in elem:
+            kind = _local(child.tag)
+            if kind in ("failure", "error"):
+                status = "failed"
+                break
+            if kind == "skipped":
+                status = "skipped"
+        classname = elem.get("classname") or ""
+        name = elem.get("name") or ""
+        try:
+            seconds = float(elem.get("time") or 0)
+        except ValueError:
+            seconds = 0.0
+        yield {
+            "name": f"{classname}.{name}" if classname else name,
+            "seconds": seconds,
+            "status": status,
+        }
+
+        # 처리한 요소와 이미 지나간 형제 요소를 해제하여 메모리를 일정하게 유지
+        elem.clear()
+        parent = elem.getparent()
+        if parent is not None:
+            while elem.getprevious() is not None:
+                del parent[0]
+
+
+def _float(value) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_junit(path) -> Dict:
+    """JUnit XML 요약 + 테스트별 소요 시간 (metrics JSON의 `tests` 블록)"""
+    d = {"pass": None, "fail": None, "coverage": None}
+    p = Path(path)
+    if not p.exists():
+        return d
+
+    durations: Dict[str, float] = {}
+    counts = {"passed": 0, "failed": 0, "skipped": 0}
+    properties: Dict[str, str] = {}
+    suites: List[Dict] = []
+    for case in iter_testcases(p, properties, suites):
+        counts[case["status"]] += 1
+        durations[case["name"]] = round(durations.get(case["name"], 0.0) + case["seconds"], 3)
+
+    # 기존 정의 유지: sum(//testsuite/@tests) - failures - errors (test_pass_rate 추이가 끊기지 않도록)
+    total, failures, errors = (int(sum(_float(s.get(attr)) or 0 for s in suites))
+                               for attr in ("tests", "failures", "errors"))
+    d.update({
+        "pass": total - failures - errors,
+        "fail": failures + errors,
+        "skipped": counts["skipped"],
+        "duration_sec": round(sum(durations.values()), 2),
+        "coverage": _float(properties.get("coverage")),
+        "slowest": [
+            {"name": name, "seconds": seconds}
+            for name, seconds in sorted(durations.items(), key=lambda kv: -kv[1])[:TOP_SLOWEST]
+        ],
+    })
+    d["durations"] = durations
+    return d
+
+
+def load_history(path: Optional[Path] = None) -> List[Dict]:
+    """이력 로드 (손상된 줄은 무시, 날짜 오름차순)"""
+    path = Path(path) if path else HISTORY_PATH
+    if not path.exists():
+        return []
+    days = {}
+    with path.open(encoding="utf-8") as fh:
+        for line in fh:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(record, dict) and record.get("date"):
+                days[record["date"]] = record
+    return [days[k] for k in sorted(days)]
+
+
+def save_history(date: str, durations: Dict[str, float], path: Optional[Path] = None) -> List[Dict]:
+    """오늘 결과를 이력에 반영 (같은 날짜는 교체) 후 최근 HISTORY_DAYS 일만 남겨 저장"""
+    path = Path(path) if path else HISTORY_PATH
+    history = [r for r in load_history(path) if r["date"] != date]
+    history.append({"date": date, "tests": durations})
+    history = sorted(history, key=lambda r: r["date"])[-HISTORY_DAYS:]
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    with tmp.open("w", encoding="utf-8") as fh:
+        for record in history:
+            fh.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
+    tmp.replace(path)
+    return history
+
+
+def newly_slow(durations: Dict[str, float], history: List[Dict], date: str) -> List[Dict]:
+    """직전 TRAILING_DAYS 일 중앙값 대비 느려진 테스트 (증가 시간 큰 순)"""
+    previous = [r["tests"] for r in history if r["date"] < date][-TRAILING_DAYS:]
+    if not previous:
+        return []
+
+    result = []
+    for name, seconds in durations.items():
+        past = [day[name] for day in previous if name in day]
+        if not past:
+            continue
+        baseline = statistics.median(past)
+        if seconds - baseline >= SLOW_MIN_DELTA and seconds >= baseline * SLOW_RATIO:
+            result.append({"name": name, "seconds": seconds, "baseline": round(baseline, 3)})
+    result.sort(key=lambda r: r["baseline"] - r["seconds"])
+    return result[:TOP_SLOWEST]
+
+
+@traced("parse.junit")
+def analyze_tests(junit_xml, date: str, history_path: Optional[Path] = None) -> Dict:
+    """JUnit 파싱 + 이력 갱신 + 새로 느려진 테스트 판정"""
+    d = parse_junit(junit_xml)
+    durations = d.pop("durations", None)
+    if durations is None:
+        return d
+    history = save_history(date, durations, history_path)
+    d["newly_slow"] = newly_slow(durations, history, date)
+    return d
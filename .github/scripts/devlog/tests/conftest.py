@@ -0,0 +1,41 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# devlog 스크립트는 패키지가 아니라 같은 디렉토리 모듈을 직접 임포트함
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+def git(repo, *args):
+    subprocess.run(["git", "-c", "user.name=dev", "-c", "user.email=dev@example.com", *args],
+                   cwd=repo, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def commit(repo, message, files):
+    """files: 경로 → 내용(str/bytes, None이면 삭제)"""
+    for name, content in files.items():
+        path = repo / name
+        if content is None:
+            path.unlink()
+            continue
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(content) if isinstance(content, bytes) else path.write_text(content)
+    git(repo, "add", "-A")
+    git(repo, "commit", "-q", "-m", message)
+
+
+def rewrite_history(repo, keep_back: int):
+    """HEAD~keep_back으로 되돌리고 버려진 객체까지 정리 (force-push 후 새 클론과 같은 상태)"""
+    git(repo, "reset", "-q", "--hard", f"HEAD~{keep_back}")
+    git(repo, "reflog", "expire", "--expire=now", "--all")
+    git(repo, "gc", "-q", "--prune=now")
+
+
+@pytest.fixture
+def repo(tmp_path):
+    path = tmp_path / "repo"
+    path.mkdir()
+    git(path, "init", "-q")
+    return path
@@ -0,0 +1,17 @@
+from conftest import commit, rewrite_history
+from coupling import CouplingIndex
+
+
+def test_rewritten_history_rebuilds_index(repo):
+    for i in (1, 2, 3):
+        commit(repo, f"c{i}", {f"Source/Combat/a{i}.cpp": f"{i}\n", f"Source/Inventory/b{i}.cpp": f"{i}\n"})
+    path = repo.parent / "coupling_index.json"
+    assert CouplingIndex(path, cwd=str(repo)).update() == 3
+
+    rewrite_history(repo, 2)
+    commit(repo, "c4", {"Source/Combat/a4.cpp": "4\n"})
+
+    index = CouplingIndex(path, cwd=str(repo))
+    assert index.update() == 2
+    assert len(index.commits) == 2
+    assert CouplingIndex(path, cwd=str(repo)).update() == 0
@@ -0,0 +1,10 @@
+from generate_daily import parse_cook_summary, parse_tests, parse_ubt_summary
+
+
+def test_unreadable_logs_degrade_to_empty_stats(tmp_path):
+    # 디렉토리를 넘기면 읽기에서 IsADirectoryError → 전체 실행을 멈추지 않고 빈 통계
+    ubt = parse_ubt_summary(tmp_path)
+    assert ubt["success"] is None and ubt["errors"] == 0
+    cook = parse_cook_summary(tmp_path)
+    assert cook["cooked"] == 0 and cook["errors"] == 0
+    assert parse_tests(tmp_path)["pass"] is None
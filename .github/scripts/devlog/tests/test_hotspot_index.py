@@ -0,0 +1,81 @@
+from conftest import commit, rewrite_history
+from hotspot_index import HotspotIndex
+
+
+def open_index(repo):
+    return HotspotIndex(repo.parent / "hotspot_index.json", cwd=str(repo))
+
+
+def test_rewritten_history_rebuilds_index(repo):
+    for i in (1, 2, 3):
+        commit(repo, f"c{i}", {f"f{i}": f"{i}\n"})
+    assert open_index(repo).update() == 3
+
+    rewrite_history(repo, 2)
+    for i in (4, 5):
+        commit(repo, f"c{i}", {f"g{i}": f"{i}\n"})
+
+    index = open_index(repo)
+    assert index.update() == 3
+    assert sorted(index.files) == ["f1", "g4", "g5"]
+    assert open_index(repo).update() == 0
+
+
+def test_update_only_reads_new_commits(repo):
+    commit(repo, "c1", {"a.txt": "1\n"})
+    index = open_index(repo)
+    assert index.update() == 1
+    commit(repo, "c2", {"a.txt": "1\n2\n"})
+    assert open_index(repo).update() == 1
+    assert open_index(repo).files["a.txt"]["commits"] == 2
+
+
+LINES = "".join(f"line {i}\n" for i in range(20))
+
+
+def test_rename_keeps_one_entry_under_the_latest_path(repo):
+    commit(repo, "add", {"Source/Old.cpp": LINES})
+    commit(repo, "rename", {"Source/Old.cpp": None, "Source/New.cpp": LINES})
+    commit(repo, "edit", {"Source/New.cpp": LINES + "more\n"})
+
+    index = open_index(repo)
+    index.update()
+    assert list(index.files) == ["Source/Old.cpp"]
+    entry = index.files["Source/Old.cpp"]
+    assert entry["path"] == "Source/New.cpp"
+    assert entry["commits"] == 3
+
+
+def test_binary_rows_count_changes_without_churn(repo):
+    commit(repo, "asset", {"Content/Hero.uasset": b"\0\1\2"})
+    commit(repo, "asset again", {"Content/Hero.uasset": b"\0\1\2\3"})
+
+    index = open_index(repo)
+    index.update()
+    entry = index.files["Content/Hero.uasset"]
+    assert entry["binary"] is True
+    assert (entry["commits"], entry["churn"]) == (2, 0)
+    assert index.top(1)[0]["path"] == "Content/Hero.uasset"
+
+
+def test_recreated_path_after_rename_is_a_new_file(repo):
+    commit(repo, "add", {"Content/Hero.uasset": b"\0hero" * 50})
+    commit(repo, "rename", {"Content/Hero.uasset": None, "Content/Hero_Old.uasset": b"\0hero" * 50})
+    commit(repo, "recreate", {"Content/Hero.uasset": b"\0new" * 10})
+    commit(repo, "edit new", {"Content/Hero.uasset": b"\0new" * 11})
+
+    index = open_index(repo)
+    index.update()
+    old = index.files["Content/Hero.uasset"]
+    new = index.files["Content/Hero.uasset#2"]
+    assert (old["path"], old["commits"]) == ("Content/Hero_Old.uasset", 2)
+    assert (new["path"], new["commits"]) == ("Content/Hero.uasset", 2)
+
+    # 구간 순위도 현재 경로 기준으로 묶임
+    ranked = {e["path"]: e["commits"] for e in index.rank(_commits(repo))}
+    assert ranked == {"Content/Hero_Old.uasset": 2, "Content/Hero.uasset": 2}
+
+
+def _commits(repo):
+    from git_commits import iter_commits
+    return list(iter_commits(rev_args=["-M", "HEAD"], cwd=str(repo)))
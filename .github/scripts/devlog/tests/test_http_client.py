@@ -0,0 +1,121 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from http_client import HttpClient, HttpError, TokenBucket
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        server = self.server
+        server.requests.append(self.path)
+        server.clients.add(self.client_address)
+        status, headers, body, drop = server.script.pop(0) if server.script else (200, {}, b"{}", False)
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        # 응답에는 keep-alive로 보이게 두고 서버 쪽에서만 연결을 끊음
+        self.close_connection = drop or headers.get("Connection") == "close"
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    httpd.script = []
+    httpd.requests = []
+    httpd.clients = set()
+    httpd.url = f"http://127.0.0.1:{httpd.server_address[1]}/hook"
+    thread = threading.Thread(target=httpd.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def reply(status=200, body=b"{}", headers=None, drop=False):
+    return status, dict(headers or {}), body, drop
+
+
+@pytest.fixture
+def client():
+    c = HttpClient(timeout=2, retries=2, backoff=0)
+    yield c
+    c.close()
+
+
+def test_429_waits_for_retry_after_then_succeeds(server, client):
+    server.script = [reply(429, json.dumps({"retry_after": 0.2}).encode()), reply(200, b'{"ok": true}')]
+    start = time.monotonic()
+    assert client.post_json(server.url, {"content": "hi"}) == {"ok": True}
+    assert time.monotonic() - start >= 0.2
+    assert len(server.requests) == 2
+
+
+def test_5xx_is_retried(server, client):
+    server.script = [reply(502), reply(503), reply(200, b'{"id": 1}')]
+    assert client.post_json(server.url, {}) == {"id": 1}
+    assert len(server.requests) == 3
+
+
+def test_5xx_gives_up_after_retries(server, client):
+    server.script = [reply(500)] * 3
+    with pytest.raises(HttpError) as err:
+        client.post_json(server.url, {})
+    assert err.value.status == 500 and err.value.transient
+    assert len(server.requests) == 3
+
+
+def test_non_transient_4xx_is_not_retried(server, client):
+    server.script = [reply(404, b'{"message": "Unknown Webhook"}')]
+    with pytest.raises(HttpError) as err:
+        client.post_json(server.url, {})
+    assert err.value.status == 404 and not err.value.transient
+    assert "Unknown Webhook" in err.value.body
+    assert len(server.requests) == 1
+
+
+def test_rate_limit_remaining_zero_blocks_next_request(server, client):
+    limiter = TokenBucket()
+    server.script = [reply(200, headers={"X-RateLimit-Limit": "5", "X-RateLimit-Remaining": "0",
+                                         "X-RateLimit-Reset-After": "0.3"})]
+    client.post_json(server.url, {}, limiter=limiter)
+    start = time.monotonic()
+    client.post_json(server.url, {}, limiter=limiter)
+    assert time.monotonic() - start >= 0.25
+
+
+def test_keep_alive_connection_is_pooled_and_close_is_not(server, client):
+    client.post_json(server.url, {})
+    client.post_json(server.url, {})
+    assert len(server.clients) == 1
+    assert sum(len(idle) for idle in client._idle.values()) == 1
+
+    server.script = [reply(200, headers={"Connection": "close"})]
+    client.post_json(server.url, {})
+    assert sum(len(idle) for idle in client._idle.values()) == 0
+
+
+def test_reused_connection_closed_by_server_reconnects(server):
+    client = HttpClient(timeout=2, retries=0, backoff=0)
+    server.script = [reply(200, drop=True)]
+    client.post_json(server.url, {})
+    assert sum(len(idle) for idle in client._idle.values()) == 1
+    time.sleep(0.05)  # 서버가 소켓을 닫을 시간
+
+    # 재시도 없이도(retries=0) 끊긴 연결 대신 새 연결로 한 번 더 보내 성공
+    assert client.post_json(server.url, {}) == {}
+    assert len(server.requests) == 2
+    assert len(server.clients) == 2
+    client.close()
@@ -0,0 +1,41 @@
+import re
+
+import pytest
+
+from md_sections import MarkdownDocument, update_sections
+
+
+def legacy_update_section(md, header, content):
+    """이전 update_devlog.update_section (출력 비교 기준)"""
+    match = re.compile(rf"(## {re.escape(header)}\n)", re.MULTILINE).search(md)
+    if not match:
+        return md.strip() + f"\n\n## {header}\n{content.strip()}\n"
+    start = match.end()
+    next_header = re.search(r"\n## ", md[start:])
+    end = start + next_header.start() if next_header else len(md)
+    return md[:start] + content.strip() + "\n\n" + md[end:]
+
+
+DOC = "# Daily DevLog\n\n## 1. 오늘의 핵심 변경\nold\n\n## 2. 시스템 영향도\n- a\n\n## 생성 시간\nx\n"
+
+
+@pytest.mark.parametrize("updates", [
+    {"1. 오늘의 핵심 변경": "new summary"},
+    {"생성 시간": "생성 시간: now", "3. 회의 연계 분석": "link"},
+    {"3. 회의 연계 분석": "link", "생성 시간": "생성 시간: now", "2. 시스템 영향도": "  impact\n\n"},
+    {"A": "", "1. 오늘의 핵심 변경": "", "B": "b"},
+])
+def test_updates_match_legacy_update_section(updates):
+    expected = DOC
+    for title, content in updates.items():
+        expected = legacy_update_section(expected, title, content)
+    assert update_sections(DOC, updates) == expected
+
+
+def test_replaced_section_keeps_two_blank_lines_before_next_header():
+    assert "new\n\n\n## 2. 시스템 영향도" in update_sections(DOC, {"1. 오늘의 핵심 변경": "new"})
+
+
+def test_untouched_document_round_trips():
+    text = DOC + "```\n## not a header\n```\n"
+    assert MarkdownDocument(text).render() == text
@@ -0,0 +1,19 @@
+import json
+import os
+
+from metrics_store import MetricsStore
+
+
+def test_ingest_skips_unchanged_content_after_mtime_change(tmp_path):
+    source = tmp_path / "2025-11-03.metrics.json"
+    source.write_text(json.dumps({"date": "2025-11-03", "commit_count": 4}), encoding="utf-8")
+    store = MetricsStore(tmp_path / "metrics.sqlite")
+
+    assert store.ingest([source]) == 1
+    os.utime(source, ns=(0, 0))  # 새 체크아웃: 내용은 같고 mtime만 다름
+    assert store.ingest([source]) == 0
+
+    source.write_text(json.dumps({"date": "2025-11-03", "commit_count": 5}), encoding="utf-8")
+    assert store.ingest([source]) == 1
+    assert store.range("2025-11-03", "2025-11-03")[0]["commits"] == 5
+    store.close()
@@ -0,0 +1,53 @@
+from generate_gpt_feedback import PROMPT_BUDGET, build_prompt_sections
+from prompt_budget import Section, count_tokens, fit_sections
+
+
+def make_devlog(lines=85):
+    return "\n".join(f"- {i}번 변경: Inventory/Combat 시스템 정리 및 리팩터링 항목 {i}" for i in range(lines))
+
+
+def make_commits(n=100):
+    return [
+        {
+            "hash": f"{i:07x}",
+            "subject": f"feat(Core): add feature number {i} with a descriptive subject line",
+            "files": [f"Source/Module{i % 7}/File{i}_{j}.cpp" for j in range(8)],
+            "diff_stat": "\n".join(f"Source/Module{i % 7}/File{i}_{j}.cpp | +{j * 3} -{j}" for j in range(8)),
+        }
+        for i in range(n)
+    ]
+
+
+def test_floors_over_budget_drop_oldest_sections_first():
+    devlog = make_devlog()
+    commits = [Section(f"commit_{i}", "commit text " * 40, priority=1, min_tokens=40) for i in range(100)]
+    sections = [Section("devlog", devlog, priority=2)] + commits
+    assert sum(s.min_tokens for s in commits) > 3000
+
+    texts = fit_sections(sections, 3000)
+
+    assert sum(count_tokens(t) for t in texts.values()) <= 3000
+    assert texts["devlog"] == devlog
+    assert texts["commit_0"]
+    assert texts["commit_99"] == ""
+
+
+def prompt_tokens(devlog, commit_summary):
+    return count_tokens(devlog) + sum(count_tokens(part) for part in commit_summary.split("\n\n"))
+
+
+def test_feedback_prompt_keeps_devlog_and_newest_commits():
+    devlog, commit_summary = build_prompt_sections(make_devlog(), make_commits())
+
+    assert devlog == make_devlog()
+    assert prompt_tokens(devlog, commit_summary) <= PROMPT_BUDGET
+    assert "0000000" in commit_summary
+
+
+def test_feedback_prompt_with_devlog_over_budget():
+    # DevLog만으로 예산을 넘어도 결과는 예산 안이고 DevLog는 비지 않음
+    devlog, commit_summary = build_prompt_sections(make_devlog(135), make_commits())
+
+    assert count_tokens(make_devlog(135)) > PROMPT_BUDGET
+    assert devlog
+    assert prompt_tokens(devlog, commit_summary) <= PROMPT_BUDGET
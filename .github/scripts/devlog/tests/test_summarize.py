@@ -0,0 +1,9 @@
+import datetime
+
+from summarize import week_label
+
+
+def test_week_label_uses_iso_year_across_year_boundary():
+    assert week_label(datetime.date(2024, 12, 30)) == "2025-W01"
+    assert week_label(datetime.date(2025, 1, 5)) == "2025-W01"
+    assert week_label(datetime.date(2021, 1, 3)) == "2020-W53"
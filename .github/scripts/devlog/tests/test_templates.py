@@ -0,0 +1,19 @@
+import templates
+from templates import render, render_many
+
+
+def test_render_many_matches_render_and_skips_unchanged(tmp_path, monkeypatch):
+    monkeypatch.setattr(templates, "BYTECODE_DIR", tmp_path / "jinja")
+    templates.environment.cache_clear()
+    template = tmp_path / "day.md"
+    template.write_text("# {{ date }} ({{ weekday }})\n커밋 {{ commit_count }}개\n", encoding="utf-8")
+    contexts = [{"date": f"2025-11-0{d}", "weekday": "월", "commit_count": d} for d in (3, 4, 5)]
+    jobs = [(c, tmp_path / "out" / f"{c['date']}.md") for c in contexts]
+
+    assert render_many(template, jobs) == 3
+    for context, out in jobs:
+        assert out.read_text(encoding="utf-8") == render(template, context)
+
+    # 같은 내용으로 재생성하면 파일을 다시 쓰지 않음
+    assert render_many(template, jobs) == 0
+    templates.environment.cache_clear()
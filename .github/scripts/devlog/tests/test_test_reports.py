@@ -0,0 +1,30 @@
+from test_reports import parse_junit
+
+REPORT = """<testsuites>
+<testsuite name="Combat" tests="4" failures="1" errors="1" skipped="1">
+  <properties><property name="coverage" value="71.5"/></properties>
+  <testcase classname="Combat" name="ok" time="0.1"/>
+  <testcase classname="Combat" name="bad" time="0.2"><failure/></testcase>
+  <testcase classname="Combat" name="err" time="0.3"><error/></testcase>
+  <testcase classname="Combat" name="skip"><skipped/></testcase>
+</testsuite>
+<testsuite name="Inventory" tests="2" failures="0" errors="0">
+  <testcase classname="Inventory" name="a" time="1.5"/>
+  <testcase classname="Inventory" name="b" time="0.5"/>
+</testsuite>
+</testsuites>
+"""
+
+
+def test_pass_keeps_suite_attribute_definition(tmp_path):
+    path = tmp_path / "junit.xml"
+    path.write_text(REPORT)
+    tests = parse_junit(path)
+    # sum(@tests) - failures - errors: 건너뛴 테스트는 기존처럼 pass에 포함
+    assert (tests["pass"], tests["fail"], tests["skipped"]) == (4, 2, 1)
+    assert tests["coverage"] == 71.5
+    assert tests["slowest"][0] == {"name": "Inventory.a", "seconds": 1.5}
+
+
+def test_missing_report(tmp_path):
+    assert parse_junit(tmp_path / "none.xml") == {"pass": None, "fail": None, "coverage": None}
@@ -0,0 +1,158 @@
+"""
+Tracing
+DevLog 스크립트의 단계별 소요 시간을 span으로 기록하고 Chrome/Perfetto trace JSON으로 내보냅니다.
+
+    with span("git", since=since):
+        ...
+
+    @traced("render")
+    def render(...): ...
+
+- DEVLOG_TRACE가 비어 있으면 span/traced는 아무 일도 하지 않음 (임포트 시 한 번 판정)
+- DEVLOG_TRACE=1 이면 STATE_DIR/traces/<스크립트>-<시각>-<pid>.json, 그 외 값은 출력 파일(또는 디렉토리) 경로
+- 같은 파일을 지정한 여러 프로세스(워크플로우의 여러 단계)는 기존 trace에 이벤트를 이어 붙임
+- 종료 시 단계별 요약 표를 stderr와 GITHUB_STEP_SUMMARY(있으면)에 출력
+- 이벤트 시각은 벽시계 µs라 프로세스가 달라도 한 타임라인에 정렬됨
+"""
+
+import atexit
+import contextlib
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from paths import STATE_DIR
+
+TRACE_SETTING = os.environ.get("DEVLOG_TRACE", "").strip()
+ENABLED = TRACE_SETTING.lower() not in ("", "0", "false", "no")
+
+_events: List[Dict] = []
+_lock = threading.Lock()
+_registered = False
+
+
+def _script_name() -> str:
+    argv0 = Path(sys.argv[0]) if sys.argv and sys.argv[0] else Path("python")
+    # `python .github/scripts/devlog daily` 형태는 디렉토리 이름 + 하위 명령으로 표시
+    if argv0.is_dir() or argv0.name == "__main__.py":
+        return "devlog-" + (sys.argv[1] if len(sys.argv) > 1 else "cli")
+    return argv0.stem
+
+
+def trace_path() -> Path:
+    if TRACE_SETTING.lower() in ("1", "true", "yes"):
+        base = STATE_DIR / "traces"
+    else:
+        base = Path(TRACE_SETTING)
+        if not (base.is_dir() or TRACE_SETTING.endswith(("/", os.sep))):
+            return base
+    return base / f"{_script_name()}-{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}.json"
+
+
+def _record(name: str, start_us: int, dur_us: int, args: Dict) -> None:
+    global _registered
+    event = {
+        "name": name, "cat": name.split(".", 1)[0], "ph": "X",
+        "ts": start_us, "dur": dur_us, "pid": os.getpid(), "tid": threading.get_ident(),
+    }
+    if args:
+        event["args"] = {k: v if isinstance(v, (int, float, bool)) or v is None else str(v) for k, v in args.items()}
+    with _lock:
+        _events.append(event)
+        if not _registered:
+            _registered = True
+            atexit.register(flush)
+
+
+@contextlib.contextmanager
+def _span(name: str, args: Dict):
+    start_us = time.time_ns() // 1000
+    t0 = time.perf_counter_ns()
+    try:
+        yield args
+    finally:
+        _record(name, start_us, (time.perf_counter_ns() - t0) // 1000, args)
+
+
+def span(name: str, **args):
+    """단계 하나를 측정하는 context manager (비활성 시 no-op, yield된 dict에 인자 추가 가능)"""
+    if not ENABLED:
+        return contextlib.nullcontext(args)
+    return _span(name, args)
+
+
+def traced(name: Optional[str] = None):
+    """함수 전체를 span으로 감싸는 데코레이터"""
+    def decorate(func):
+        if not ENABLED:
+            return func
+        label = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*a, **kw):
+            with _span(label, {}):
+                return func(*a, **kw)
+        return wrapper
+    return decorate
+
+
+def summarize(events: List[Dict]) -> List[Dict]:
+    """span 이름별 횟수/합계/최대 (ms, 합계 내림차순)"""
+    totals = defaultdict(lambda: [0, 0, 0])
+    for e in events:
+        t = totals[e["name"]]
+        t[0] += 1
+        t[1] += e["dur"]
+        t[2] = max(t[2], e["dur"])
+    rows = [
+        {"stage": name, "count": c, "total_ms": round(total / 1000, 1), "max_ms": round(peak / 1000, 1)}
+        for name, (c, total, peak) in totals.items()
+    ]
+    return sorted(rows, key=lambda r: -r["total_ms"])
+
+
+def format_summary(rows: List[Dict]) -> str:
+    lines = ["| Stage | Count | Total (ms) | Max (ms) |", "|---|---:|---:|---:|"]
+    lines += [f"| {r['stage']} | {r['count']} | {r['total_ms']:.1f} | {r['max_ms']:.1f} |" for r in rows]
+    return "\n".join(lines)
+
+
+def flush() -> Optional[Path]:
+    """기록된 span을 trace 파일에 쓰고 요약 표 출력 (프로세스 종료 시 자동 호출)"""
+    with _lock:
+        events = list(_events)
+        _events.clear()
+    if not events:
+        return None
+
+    pid = os.getpid()
+    meta = [{"name": "process_name", "ph": "M", "pid": pid, "args": {"name": _script_name()}}]
+    for tid in dict.fromkeys(e["tid"] for e in events):
+        thread = "main" if tid == threading.main_thread().ident else f"worker-{tid}"
+        meta.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": thread}})
+
+    path = trace_path()
+    existing: List[Dict] = []
+    if path.exists():
+        try:
+            existing = json.loads(path.read_text(encoding="utf-8")).get("traceEvents", [])
+        except (OSError, ValueError, AttributeError):
+            existing = []
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + f".{pid}.tmp")
+    tmp.write_text(json.dumps({"traceEvents": existing + meta + events, "displayTimeUnit": "ms"}), encoding="utf-8")
+    tmp.replace(path)
+
+    table = format_summary(summarize(events))
+    print(f"\n⏱️ {_script_name()} 단계별 소요 시간 (trace: {path})\n{table}", file=sys.stderr)
+    step_summary = os.environ.get("GITHUB_STEP_SUMMARY")
+    if step_summary:
+        with open(step_summary, "a", encoding="utf-8") as f:
+            f.write(f"### ⏱️ {_script_name()} 단계별 소요 시간\n\n{table}\n\n")
+    return path
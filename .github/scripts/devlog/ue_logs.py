@@ -0,0 +1,377 @@
+"""
+Unreal Log Parsers
+UnrealBuildTool / Cook 로그를 한 줄씩 스트리밍으로 파싱합니다.
+
+전체 로그를 메모리에 올리지 않고, 첫 글자/키워드로 후보 줄만 골라
+모든 패턴을 하나로 묶은 정규식으로 한 번만 검사하므로 수백 MB 로그에서도 메모리 사용량이 일정합니다.
+
+UBT 로그에서 추출하는 정보:
+- 타겟 / 플랫폼 / 구성(Development, Shipping ...)
+- 오류·경고 레코드 (파일, 줄, 코드, 메시지)
+- 모듈별 액션 수와 컴파일 시간 (줄 앞 타임스탬프가 있을 때, 다음 액션 시작까지의 근사치)
+- 전체 소요 시간과 결과
+
+Cook 로그에서 추출하는 정보:
+- 패키지별 쿠킹 시간 (다음 패키지 시작까지의 근사치) 과 가장 느린 에셋 Top N
+- Content 폴더별 누적 쿠킹 시간
+- 셰이더 컴파일 수, DDC 히트/미스 비율, 오류·경고 수
+"""
+
+import datetime
+import functools
+import heapq
+import re
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+
+from tracing import traced
+
+MAX_RECORDS = 50
+TOP_MODULES = 10
+TOP_ASSETS = 20
+TOP_FOLDERS = 10
+
+# 줄 앞 타임스탬프: GitHub Actions ISO, UE `[2025.01.01-12.00.00:000][ 12]`, 경과 시간 `[00:01:23]`
+TIMESTAMP_RE = re.compile(
+    r"^(?:(?P<iso>\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?)Z?\s+"
+    r"|\[(?P<ue>\d{4}\.\d{2}\.\d{2}-\d{2}\.\d{2}\.\d{2}):(?P<ms>\d+)\](?:\[\s*\d+\])?"
+    r"|\[(?P<elapsed>\d+:\d{2}(?::\d{2})?)\]\s*)"
+)
+
+CONFIGURATIONS = "Debug|DebugGame|Development|Shipping|Test"
+PLATFORMS = "Win64|Linux|LinuxArm64|Mac|Android|IOS|TVOS|PS5|XSX"
+
+# 모든 패턴은 줄 시작에 고정(match)하여 줄마다 한 번의 선형 검사로 끝나도록 구성
+UBT_PATTERN = re.compile(
+    r"\s*(?:"
+    # `[12/40] Compile [x64] Module.Onepiece.cpp`
+    r"(?P<action>\[(?P<index>\d+)/(?P<count>\d+)\]\s+(?P<kind>\w+)\s+(?:\[\w+\]\s+)?(?P<item>\S+))"
+    r"|(?P<total>Total (?:execution time|time in [\w ]+ executor):\s*(?P<seconds>[\d.]+)\s*seconds)"
+    r"|(?P<result>Result:\s*(?P<result_value>Succeeded|Failed|Cancelled))"
+    r"|(?P<build>\**\s*BUILD (?P<build_value>SUCCESSFUL|FAILED))"
+    r"|(?P<cmdline>(?:Running UnrealBuildTool|Command line):.*)"
+    r"|(?P<building>Building\s+(?P<target>[A-Za-z][\w-]*)(?:\s+-\s+(?P<b_platform>\w+)(?:\s+-\s+(?P<b_config>\w+))?)?)"
+    r"|(?P<generic>(?:\w+:\s*)?(?:ERROR|Error):\s*(?P<generic_message>.*))"
+    # MSVC `File.cpp(42): error C2065: ...` / clang `File.cpp:42:10: error: ...`
+    r"|(?P<diag>(?P<file>(?:[A-Za-z]:)?[^\s:(][^:(]*)(?:\((?P<line>\d+)(?:,\d+)?\)|:(?P<line2>\d+)(?::\d+)?)"
+    r"\s*:\s*(?:fatal\s+)?(?P<severity>error|warning)\s*(?P<code>[A-Z]+\d+)?\s*:?\s*(?P<message>.*))"
+    r")"
+)
+# 정규식 검사 전 1차 필터: 위 패턴이 시작할 수 있는 첫 글자, 또는 오류/경고 단어 포함 여부
+LEAD_CHARS = frozenset("[TRBC*")
+KINDS = ("action", "total", "result", "build", "cmdline", "building", "generic", "diag")
+CMDLINE_RE = re.compile(
+    r"UnrealBuildTool(?:\.dll|\.exe)?\"?\s+(?P<target>\w+)\s+(?P<platform>" + PLATFORMS + r")\s+"
+    r"(?P<config>" + CONFIGURATIONS + r")\b"
+)
+
+
+def iter_lines(path) -> Iterator[str]:
+    """로그 파일을 한 줄씩 읽기 (인코딩 오류 무시)"""
+    with open(path, "r", encoding="utf-8", errors="ignore") as f:
+        for line in f:
+            yield line.rstrip("\r\n")
+
+
+@functools.lru_cache(maxsize=1024)
+def _epoch(text: str, fmt: Optional[str]) -> float:
+    """타임스탬프 문자열 → 초 (같은 초의 줄이 연속되므로 캐시)"""
+    if fmt is None:
+        return datetime.datetime.fromisoformat(text[:26]).timestamp()
+    return datetime.datetime.strptime(text, fmt).timestamp()
+
+
+def parse_timestamp(line: str):
+    """(초 단위 시각, 타임스탬프를 제거한 줄) 반환. 타임스탬프가 없으면 None"""
+    m = TIMESTAMP_RE.match(line)
+    if not m:
+        return None, line
+    rest = line[m.end():]
+    if m.group("iso"):
+        ts = _epoch(m.group("iso"), None)
+    elif m.group("ue"):
+        ts = _epoch(m.group("ue"), "%Y.%m.%d-%H.%M.%S") + int(m.group("ms")) / 1000
+    else:
+        ts = 0.0
+        for part in m.group("elapsed").split(":"):
+            ts = ts * 60 + int(part)
+    return ts, rest
+
+
+def module_of(item: str) -> str:
+    """액션 대상에서 모듈 이름 추정 (`Module.Onepiece.2.cpp` → Onepiece, `UnrealEditor-Onepiece.dll` → Onepiece)"""
+    name = item.replace("\\", "/").rsplit("/", 1)[-1]
+    parts = name.split(".")
+    if parts[0] in ("Module", "SharedPCH", "PCH") and len(parts) > 2:
+        return parts[1]
+    stem = parts[0]
+    return stem.rsplit("-", 1)[-1] if "-" in stem else stem
+
+
+def _record(m) -> Dict:
+    return {
+        "file": m.group("file").strip(),
+        "line": int(m.group("line") or m.group("line2")),
+        "code": m.group("code") or "",
+        "message": m.group("message").strip()[:300],
+    }
+
+
+@traced("parse.ubt_log")
+def empty_ubt_stats() -> Dict:
+    """로그가 없거나 읽지 못했을 때의 `ubt` 블록"""
+    return {
+        "success": None, "target": "", "platform": "", "configuration": "", "result": "",
+        "errors": 0, "warnings": 0, "duration_sec": None, "actions": 0,
+        "modules": [], "error_records": [], "warning_records": [], "warning_codes": {},
+    }
+
+
+def parse_ubt_log(path) -> Dict:
+    """UBT 로그 스트리밍 파싱 결과 (metrics JSON의 `ubt` 블록)"""
+    d = empty_ubt_stats()
+    p = Path(path)
+    if not p.exists():
+        return d
+
+    seen = set()
+    warning_codes = Counter()
+    module_actions = Counter()
+    module_seconds = Counter()
+    generic_errors = 0
+    build_failed = False
+    first_ts = last_ts = None
+    open_action = None  # (모듈, 시작 시각)
+
+    for raw in iter_lines(p):
+        ts, line = parse_timestamp(raw)
+        if ts is not None:
+            first_ts = ts if first_ts is None else first_ts
+            last_ts = ts
+
+        head = line.lstrip()
+        if not head or (head[0] not in LEAD_CHARS and "rror" not in head and "arning" not in head):
+            continue
+        m = UBT_PATTERN.match(head)
+        if not m:
+            continue
+        kind = next(k for k in KINDS if m.group(k) is not None)
+
+        if kind == "diag":
+            rec = _record(m)
+            key = (m.group("severity"), rec["file"], rec["line"], rec["code"], rec["message"])
+            if key in seen:
+                continue
+            seen.add(key)
+            if m.group("severity") == "error":
+                d["errors"] += 1
+                if len(d["error_records"]) < MAX_RECORDS:
+                    d["error_records"].append(rec)
+            else:
+                d["warnings"] += 1
+                warning_codes[rec["code"] or "other"] += 1
+                if len(d["warning_records"]) < MAX_RECORDS:
+                    d["warning_records"].append(rec)
+        elif kind == "action":
+            d["actions"] = max(d["actions"], int(m.group("count")))
+            module = module_of(m.group("item"))
+            module_actions[module] += 1
+            if ts is not None:
+                if open_action:
+                    module_seconds[open_action[0]] += ts - open_action[1]
+                open_action = (module, ts)
+        elif kind == "cmdline":
+            cm = CMDLINE_RE.search(head)
+            if cm:
+                d["target"] = d["target"] or cm.group("target")
+                d["platform"] = cm.group("platform")
+                d["configuration"] = cm.group("config")
+        elif kind == "building":
+            d["target"] = d["target"] or m.group("target")
+            d["platform"] = d["platform"] or (m.group("b_platform") or "")
+            d["configuration"] = d["configuration"] or (m.group("b_config") or "")
+        elif kind == "total":
+            d["duration_sec"] = float(m.group("seconds"))
+        elif kind == "result":
+            d["result"] = m.group("result_value")
+        elif kind == "build":
+            build_failed = build_failed or m.group("build_value") == "FAILED"
+        elif kind == "generic":
+            generic_errors += 1
+
+    if open_action and last_ts is not None:
+        module_seconds[open_action[0]] += last_ts - open_action[1]
+
+    if d["duration_sec"] is None and first_ts is not None and last_ts > first_ts:
+        d["duration_sec"] = round(last_ts - first_ts, 2)
+    d["errors"] = d["errors"] or generic_errors
+    if d["result"]:
+        d["success"] = d["result"] == "Succeeded"
+    else:
+        d["success"] = d["errors"] == 0 and not build_failed
+
+    ranked = sorted(module_actions, key=lambda mod: (-module_seconds[mod], -module_actions[mod], mod))
+    d["modules"] = [
+        {"name": mod, "actions": module_actions[mod],
+         "seconds": round(module_seconds[mod], 2) if mod in module_seconds else None}
+        for mod in ranked[:TOP_MODULES]
+    ]
+    d["warning_codes"] = dict(warning_codes.most_common(10))
+    return d
+
+
+def format_ubt_summary(ubt: Dict) -> Optional[str]:
+    """템플릿용 한 줄 요약"""
+    if not ubt or not ubt.get("target"):
+        return None
+    parts = [ubt.get("configuration"), ubt.get("platform")]
+    head = " ".join(p for p in parts if p)
+    text = f"{'성공' if ubt.get('success') else '실패'}"
+    if head:
+        text = f"{head} {text}"
+    if ubt.get("duration_sec") is not None:
+        text += f", {ubt['duration_sec']:.1f}s"
+    text += f", 오류 {ubt.get('errors', 0)} / 경고 {ubt.get('warnings', 0)}"
+    return text
+
+
+# Cook 로그: `LogCook: Display: Cooking /Game/Maps/Lobby` 처럼 `카테고리: 상세도: 메시지` 형식
+COOK_LINE_RE = re.compile(r"\s*(?P<category>Log\w+):\s*(?:(?P<verbosity>Display|Verbose|VeryVerbose|Log|Warning|Error):\s*)?(?P<message>.*)")
+COOK_PACKAGE_RE = re.compile(r"Cooking\s+(?:package\s+)?(?P<package>/[^\s,]+)")
+COOK_COUNT_RE = re.compile(r"(?P<kind>Cooked|Skipped)\s+(?:packages\s+)?(?P<count>\d+)")
+SHADER_COMPILED_RE = re.compile(r"[Cc]ompiled\s+(?P<count>\d+)\s+shaders?")
+SHADER_JOBS_RE = re.compile(r"Jobs assigned\s+\d+,\s*completed\s+(?P<count>\d+)")
+DDC_TOTAL_RE = re.compile(r"\b(?P<kind>[Hh]its?|[Mm]iss(?:es)?)\b\s*[:=]?\s*(?P<count>\d+)|(?P<count2>\d+)\s+(?P<kind2>[Hh]its?|[Mm]iss(?:es)?)\b")
+DDC_CATEGORIES = ("LogDerivedDataCache", "LogDDC", "LogZenStore")
+
+
+def content_folder(package: str, depth: int = 2) -> str:
+    """패키지 경로의 상위 폴더 (`/Game/Maps/Lobby` → /Game/Maps)"""
+    parts = package.split("/")
+    return "/".join(parts[:depth + 1]) if len(parts) > depth + 1 else package.rsplit("/", 1)[0] or package
+
+
+@traced("parse.cook_log")
+def empty_cook_stats() -> Dict:
+    """로그가 없거나 읽지 못했을 때의 `cook` 블록"""
+    return {
+        "cooked": 0, "skipped": 0, "errors": 0, "warnings": 0,
+        "packages": 0, "duration_sec": None,
+        "shaders_compiled": 0, "ddc_hits": 0, "ddc_misses": 0, "ddc_hit_ratio": None,
+        "slowest_assets": [], "slowest_folders": [],
+    }
+
+
+def parse_cook_log(path) -> Dict:
+    """Cook 로그 스트리밍 파싱 결과 (metrics JSON의 `cook` 블록)"""
+    d = empty_cook_stats()
+    p = Path(path)
+    if not p.exists():
+        return d
+
+    slowest = []  # (초, 패키지) 최소 힙, 크기는 TOP_ASSETS로 제한
+    folder_seconds = Counter()
+    folder_packages = Counter()
+    reported = {}  # 로그가 직접 보고한 누적 값 (마지막 값 사용)
+    shader_sum = 0
+    ddc_seen = Counter()  # 누적 값이 없을 때 개별 hit/miss 줄 수
+    first_ts = last_ts = None
+    open_package = None  # (패키지, 시작 시각)
+
+    def close_package(ts):
+        pkg, start = open_package
+        seconds = ts - start
+        folder = content_folder(pkg)
+        folder_seconds[folder] += seconds
+        folder_packages[folder] += 1
+        item = (seconds, pkg)
+        if len(slowest) < TOP_ASSETS:
+            heapq.heappush(slowest, item)
+        elif item > slowest[0]:
+            heapq.heapreplace(slowest, item)
+
+    for raw in iter_lines(p):
+        ts, line = parse_timestamp(raw)
+        if ts is not None:
+            first_ts = ts if first_ts is None else first_ts
+            last_ts = ts
+
+        if "Log" not in line:
+            continue
+        m = COOK_LINE_RE.match(line)
+        if not m:
+            continue
+        category, verbosity, message = m.group("category", "verbosity", "message")
+
+        if verbosity == "Error":
+            d["errors"] += 1
+        elif verbosity == "Warning":
+            d["warnings"] += 1
+
+        if category == "LogCook":
+            pm = COOK_PACKAGE_RE.match(message)
+            if pm:
+                d["packages"] += 1
+                if open_package and ts is not None:
+                    close_package(ts)
+                open_package = (pm.group("package"), ts) if ts is not None else None
+                continue
+            for cm in COOK_COUNT_RE.finditer(message):
+                reported[cm.group("kind").lower()] = int(cm.group("count"))
+        elif category == "LogShaderCompilers":
+            sm = SHADER_COMPILED_RE.search(message)
+            if sm:
+                shader_sum += int(sm.group("count"))
+            jm = SHADER_JOBS_RE.search(message)
+            if jm:
+                reported["shader_jobs"] = int(jm.group("count"))
+        elif category in DDC_CATEGORIES:
+            totals = {}
+            for dm in DDC_TOTAL_RE.finditer(message):
+                kind = (dm.group("kind") or dm.group("kind2")).lower()
+                totals["hits" if kind.startswith("hit") else "misses"] = int(dm.group("count") or dm.group("count2"))
+            if totals:
+                reported.update({f"ddc_{k}": v for k, v in totals.items()})
+            else:
+                lowered = message.lower()
+                if "cache hit" in lowered:
+                    ddc_seen["hits"] += 1
+                elif "cache miss" in lowered:
+                    ddc_seen["misses"] += 1
+
+    if open_package and last_ts is not None:
+        close_package(last_ts)
+
+    if first_ts is not None and last_ts > first_ts:
+        d["duration_sec"] = round(last_ts - first_ts, 2)
+    d["cooked"] = max(reported.get("cooked", 0), d["packages"])
+    d["skipped"] = reported.get("skipped", 0)
+    d["shaders_compiled"] = max(shader_sum, reported.get("shader_jobs", 0))
+    d["ddc_hits"] = reported.get("ddc_hits", ddc_seen["hits"])
+    d["ddc_misses"] = reported.get("ddc_misses", ddc_seen["misses"])
+    lookups = d["ddc_hits"] + d["ddc_misses"]
+    if lookups:
+        d["ddc_hit_ratio"] = round(d["ddc_hits"] / lookups, 3)
+
+    d["slowest_assets"] = [
+        {"package": pkg, "seconds": round(seconds, 2)}
+        for seconds, pkg in sorted(slowest, reverse=True)
+    ]
+    d["slowest_folders"] = [
+        {"folder": folder, "seconds": round(seconds, 2), "packages": folder_packages[folder]}
+        for folder, seconds in folder_seconds.most_common(TOP_FOLDERS)
+    ]
+    return d
+
+
+def format_cook_summary(cook: Dict) -> str:
+    """템플릿용 한 줄 요약"""
+    text = f'cooked {cook.get("cooked", 0)}, skipped {cook.get("skipped", 0)}, errors {cook.get("errors", 0)}'
+    if cook.get("duration_sec") is not None:
+        text += f', {cook["duration_sec"]:.1f}s'
+    if cook.get("shaders_compiled"):
+        text += f', shaders {cook["shaders_compiled"]}'
+    if cook.get("ddc_hit_ratio") is not None:
+        text += f', DDC hit {cook["ddc_hit_ratio"] * 100:.0f}%'
+    return text
@@ -5,21 +5,30 @@ Update Daily/Weekly DevLog Markdown in place using metrics.json + meeting notes
 Usage:
   python update_devlog.py --mode daily --date 2025-11-12
   python update_devlog.py --mode weekly --range 2025-W46
+  python update_devlog.py --mode weekly --range 2025-W46 --no-gpt
 """
 import argparse
 import json
-import os
-import re
 import shutil
 from pathlib import Path
 from datetime import datetime, timedelta, timezone
-from typing import Dict, Optional, Sequence, Tuple
+from typing import Dict, Sequence
+
+from llm_client import configure, get_client, run_concurrently
+from md_sections import update_sections
+from meeting_index import find_meeting
+from metrics_store import open_store
+from prompt_budget import Section, fit_sections, truncate_to_tokens
+from tracing import traced
 
 PROMPT_TEMPLATES = {
     "daily": Path(__file__).parent / "prompt_templates" / "daily.txt",
     "weekly": Path(__file__).parent / "prompt_templates" / "weekly.txt",
     "meeting_link": Path(__file__).parent / "prompt_templates" / "meeting_link.txt",
 }
+# 요약 프롬프트에 들어가는 metrics/top changes 섹션의 토큰 예산
+SUMMARY_PROMPT_BUDGET = 1500
+GPT_DISABLED = "GPT summary not available (--no-gpt)."
 
 
 def read_prompt(name: str, context: Dict[str, str]) -> str:
@@ -29,59 +38,20 @@ def read_prompt(name: str, context: Dict[str, str]) -> str:
 
 
 def call_gpt(prompt: str) -> str:
-    key = os.environ.get("OPENAI_API_KEY")
-    if not key:
+    client = get_client()
+    if not client.available():
         return "GPT summary not available (OPENAI_API_KEY missing)."
     try:
-        import openai
-
-        openai.api_key = key
-        response = openai.ChatCompletion.create(
+        return client.complete(
+            "You are a concise DevLog summarizer.",
+            prompt,
             model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": "You are a concise DevLog summarizer."},
-                {"role": "user", "content": prompt},
-            ],
             temperature=0.2,
         )
-        return response.choices[0].message.content.strip()
     except Exception as exc:
         return f"GPT request failed: {exc}"
 
 
-def section_bounds(text: str, header: str) -> Optional[Tuple[int, int]]:
-    pattern = re.compile(rf"(## {re.escape(header)}\n)", re.MULTILINE)
-    match = pattern.search(text)
-    if not match:
-        return None
-    start = match.end()
-    next_header = re.search(r"\n## ", text[start:])
-    end = start + next_header.start() if next_header else len(text)
-    return start, end
-
-
-def update_section(md: str, header: str, content: str) -> str:
-    bounds = section_bounds(md, header)
-    if bounds:
-        start, end = bounds
-        return md[:start] + content.strip() + "\n\n" + md[end:]
-    else:
-        return md.strip() + f"\n\n## {header}\n{content.strip()}\n"
-
-
-def extract_meeting_keywords(path: Path) -> Tuple[str, str]:
-    if not path.exists():
-        return "", ""
-    text = path.read_text(encoding="utf-8")
-    keyword_match = re.search(r"- 키워드: (.+)", text)
-    if keyword_match:
-        keywords = keyword_match.group(1).strip()
-    else:
-        keywords = ""
-    actions = "\n".join(re.findall(r"- \[ \] (.+)", text))
-    return keywords, actions
-
-
 def ensure_metrics_file(primary: Path, fallbacks: Sequence[Path]) -> Path:
     """Ensure metrics file exists by copying from known fallbacks if needed."""
 
@@ -101,24 +71,36 @@ def ensure_metrics_file(primary: Path, fallbacks: Sequence[Path]) -> Path:
     )
 
 
-def resolve_meeting_file(meeting_key: str) -> Optional[Path]:
-    """Resolve meeting markdown path supporting legacy Meeting_YYMMDD naming."""
-
-    canonical = Path(f"Documents/Meeting/{meeting_key}.md")
-    if canonical.exists():
-        return canonical
-
-    meeting_dir = Path("Documents/Meeting")
-    if not meeting_dir.exists():
-        return None
+@traced("metrics.weekly")
+def write_weekly_metrics(week_label: str, primary: Path) -> None:
+    """Build weekly metrics from the daily metrics store when no weekly file exists."""
 
     try:
-        short_key = datetime.strptime(meeting_key, "%Y-%m-%d").strftime("%y%m%d")
+        monday = datetime.strptime(f"{week_label}-1", "%G-W%V-%u")
     except ValueError:
-        return None
-
-    matches = sorted(meeting_dir.glob(f"Meeting_{short_key}_*.md"))
-    return matches[0] if matches else None
+        return
+    sunday = monday + timedelta(days=6)
+    store = open_store()
+    totals = store.aggregate(f"{monday:%Y-%m-%d}", f"{sunday:%Y-%m-%d}")
+    store.close()
+    if not totals["days"]:
+        return
+
+    metrics = {
+        "range": week_label,
+        "days": totals["days"],
+        "commit_count": totals["commits"],
+        "additions": totals["additions"],
+        "deletions": totals["deletions"],
+        "files_changed": totals["files_changed"],
+        "tests": totals["tests_pass"] + totals["tests_fail"],
+        "test_pass_rate": totals["test_pass_rate"],
+        "ubt": {"runs": totals["builds"], "failures": totals["build_failures"]},
+        "ubt_runs": totals["builds"],
+    }
+    primary.parent.mkdir(parents=True, exist_ok=True)
+    primary.write_text(json.dumps(metrics, ensure_ascii=False, indent=2), encoding="utf-8")
+    print(f"Built weekly metrics from metrics store: {primary}")
 
 
 def load_metrics(path: Path) -> Dict:
@@ -160,6 +142,7 @@ def format_mermaid(metrics: Dict) -> str:
     )
 
 
+@traced("write.devlog")
 def update_markdown(
     target: Path,
     metrics: Dict,
@@ -171,12 +154,16 @@ def update_markdown(
         data = target.read_text(encoding="utf-8")
     else:
         data = "# Daily DevLog\n\n"
-    data = update_section(data, "1. 오늘의 핵심 변경", section_summary)
-    data = update_section(data, "2. 시스템 영향도", format_impact(metrics))
-    data = update_section(data, "4. Mermaid 개요도", format_mermaid(metrics))
-    data = update_section(data, "생성 시간", generated_at)
+    updates = {
+        "1. 오늘의 핵심 변경": section_summary,
+        "2. 시스템 영향도": format_impact(metrics),
+        "4. Mermaid 개요도": format_mermaid(metrics),
+        "생성 시간": generated_at,
+    }
     if meeting_link:
-        data = update_section(data, "3. 회의 연계 분석", meeting_link)
+        updates["3. 회의 연계 분석"] = meeting_link
+    # Parse once, apply every section update in memory, serialize once
+    data = update_sections(data, updates)
     target.write_text(data.strip() + "\n", encoding="utf-8")
 
 
@@ -184,13 +171,19 @@ def build_generated_at() -> str:
     return datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
 
 
-def main():
+@traced("update_devlog")
+def main(argv=None):
     parser = argparse.ArgumentParser()
     parser.add_argument("--mode", choices=["daily", "weekly"], required=True)
     parser.add_argument("--date", help="YYYY-MM-DD for daily")
     parser.add_argument("--range", help="YYYY-W## for weekly")
     parser.add_argument("--meeting-date", help="YYYY-MM-DD of meeting note")
-    args = parser.parse_args()
+    parser.add_argument("--no-cache", action="store_true", help="bypass the GPT response cache")
+    parser.add_argument("--no-gpt", action="store_true", help="skip GPT calls even if OPENAI_API_KEY is set")
+    args = parser.parse_args(argv)
+
+    if args.no_cache:
+        configure(cache=False)
 
     if args.mode == "daily":
         if not args.date:
@@ -205,37 +198,48 @@ def main():
             raise ValueError("weekly mode requires --range")
         metrics_primary = Path(f"Documents/DevLog/Metrics/{args.range}.json")
         fallback_candidates = [Path(f"Documents/DevLog/Weekly/{args.range}.metrics.json")]
+        if not metrics_primary.exists() and not any(p.exists() for p in fallback_candidates):
+            write_weekly_metrics(args.range, metrics_primary)
         metrics_path = ensure_metrics_file(metrics_primary, fallback_candidates)
         target = Path(f"Documents/DevLog/Weekly/{args.range}.md")
         meeting_key = args.meeting_date or None
 
     metrics = load_metrics(metrics_path)
     top_changes = format_top_changes(metrics.get("top_changes", []))
+    sections = fit_sections([
+        Section("top_changes", top_changes, priority=2),
+        Section("metrics", json.dumps(metrics, ensure_ascii=False, indent=1), priority=1,
+                min_tokens=200, compact=truncate_to_tokens),
+    ], SUMMARY_PROMPT_BUDGET, model="gpt-4o-mini")
     summary_context = {
         "date": args.date or args.range,
-        "metrics_summary": metrics,
-        "top_changes": top_changes,
+        "metrics_summary": sections["metrics"],
+        "top_changes": sections["top_changes"],
     }
 
+    ask = (lambda _prompt: GPT_DISABLED) if args.no_gpt else call_gpt
     prompt_text = read_prompt(args.mode, summary_context)
-    gpt_summary = call_gpt(prompt_text)
+    tasks = {"summary": lambda: ask(prompt_text)}
 
-    meeting_link = ""
     if meeting_key:
-        meeting_file = resolve_meeting_file(meeting_key)
-        if meeting_file:
-            keywords, actions = extract_meeting_keywords(meeting_file)
+        meeting = find_meeting(meeting_key)
+        if meeting:
             meeting_context = {
                 "meeting_date": meeting_key,
-                "keywords": keywords,
-                "actions": actions,
+                "keywords": ", ".join(meeting["keywords"]),
+                "actions": "\n".join(meeting["open_actions"]),
                 "metrics_top": top_changes,
             }
             link_prompt = read_prompt("meeting_link", meeting_context)
-            meeting_link = call_gpt(link_prompt)
+            tasks["meeting_link"] = lambda: ask(link_prompt)
         else:
             print(f"No meeting note found for key {meeting_key}")
 
+    # 요약과 회의 연계 분석은 서로 독립적이므로 동시에 요청
+    results = run_concurrently(tasks)
+    gpt_summary = results["summary"]
+    meeting_link = results.get("meeting_link", "")
+
     generated = f"생성 시간: {build_generated_at()}"
     update_markdown(target, metrics, gpt_summary, meeting_link, generated)
     print(f"Updated {target}")
@@ -10,6 +10,8 @@ from pathlib import Path
 from collections import defaultdict
 from datetime import datetime
 
+from fsutil import write_if_changed
+
 def scan_devlog(devlog_dir):
     """DevLog 폴더 스캔 (Daily, Weekly, Monthly 하위 폴더 지원)"""
     devlog_path = Path(devlog_dir)
@@ -239,8 +241,10 @@ def main():
     else:
         out_path = Path(args.docs_root) / "SUMMARY.md"
 
-    out_path.write_text(summary_content, encoding="utf-8")
-    print(f"✅ SUMMARY.md generated: {out_path}")
+    if write_if_changed(out_path, summary_content):
+        print(f"✅ SUMMARY.md generated: {out_path}")
+    else:
+        print(f"⏭️ SUMMARY.md unchanged: {out_path}")
 
 if __name__ == "__main__":
     main()
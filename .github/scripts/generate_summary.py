@@ -2,17 +2,40 @@
 """
 HonKit SUMMARY.md 자동 생성 스크립트
 Documents 폴더 구조를 스캔하여 SUMMARY.md를 자동으로 생성합니다.
+
+증분 모드(기본)에서는 디렉터리 mtime과 파일별 제목을 manifest에 기록해 두고,
+변경된 디렉터리만 다시 나열하고 변경된 파일만 다시 읽습니다.
+파일은 크기/mtime이 같으면 그대로 재사용하고, 달라도 내용 해시(SHA-1)가 같으면
+제목을 다시 추출하지 않습니다 (체크아웃마다 mtime이 바뀌는 CI 대응).
+결과가 기존 SUMMARY.md와 바이트 단위로 같으면 파일을 쓰지 않습니다.
 """
 
+import argparse
+import hashlib
+import json
 import os
 import re
+import sys
 from pathlib import Path
 from datetime import datetime
 from typing import List, Dict, Tuple
 
+sys.path.insert(0, str(Path(__file__).resolve().parent / "devlog"))
+from fsutil import write_if_changed  # noqa: E402
+from paths import STATE_DIR  # noqa: E402
+from tracing import traced  # noqa: E402
+
+MANIFEST_PATH = STATE_DIR / "summary_manifest.json"
+MANIFEST_VERSION = 2
+
+
 class SummaryGenerator:
-    def __init__(self, base_dir: str = "Documents"):
+    def __init__(self, base_dir: str = "Documents", incremental: bool = True, manifest_path: Path = MANIFEST_PATH):
         self.base_dir = Path(base_dir)
+        self.incremental = incremental
+        self.manifest_path = Path(manifest_path)
+        self.manifest = self.load_manifest() if incremental else {"dirs": {}, "titles": {}}
+        self.stats = {"dirs_listed": 0, "dirs_reused": 0, "titles_read": 0, "titles_reused": 0}
         self.honkit_dir = self.base_dir  # HonKit root는 Documents
         self.devlog_dir = self.base_dir / "DevLog"
         self.planning_dir = self.base_dir / "Planning"
@@ -21,6 +44,55 @@ class SummaryGenerator:
             path for path in [self.base_dir / "Meeting", self.base_dir / "meeting"]
         ]
 
+    def load_manifest(self) -> Dict:
+        """manifest 로드 (버전/기준 디렉터리가 다르면 새로 시작)"""
+        empty = {"version": MANIFEST_VERSION, "base_dir": str(self.base_dir), "dirs": {}, "titles": {}}
+        try:
+            data = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return empty
+        if data.get("version") != MANIFEST_VERSION or data.get("base_dir") != str(self.base_dir):
+            return empty
+        return data
+
+    def save_manifest(self):
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        self.manifest["version"] = MANIFEST_VERSION
+        self.manifest["base_dir"] = str(self.base_dir)
+        write_if_changed(self.manifest_path, json.dumps(self.manifest, ensure_ascii=False))
+
+    def list_dir(self, directory: Path) -> Tuple[List[Path], List[Path]]:
+        """디렉터리의 (.md 파일, 하위 디렉터리) 목록 (mtime이 같으면 manifest 재사용)"""
+        key = directory.as_posix()
+        try:
+            mtime = directory.stat().st_mtime_ns
+        except OSError:
+            return [], []
+
+        entry = self.manifest["dirs"].get(key)
+        if entry and entry["mtime"] == mtime:
+            self.stats["dirs_reused"] += 1
+        else:
+            files, dirs = [], []
+            with os.scandir(directory) as it:
+                for item in it:
+                    if item.is_dir():
+                        dirs.append(item.name)
+                    elif item.name.endswith(".md"):
+                        files.append(item.name)
+            entry = {"mtime": mtime, "files": sorted(files), "dirs": sorted(dirs)}
+            self.manifest["dirs"][key] = entry
+            self.stats["dirs_listed"] += 1
+        return [directory / f for f in entry["files"]], [directory / d for d in entry["dirs"]]
+
+    def list_md(self, directory: Path, recursive: bool = False) -> List[Path]:
+        """디렉터리의 .md 파일 목록 (recursive=True면 하위 디렉터리 포함)"""
+        files, dirs = self.list_dir(directory)
+        if recursive:
+            for sub_dir in dirs:
+                files += self.list_md(sub_dir, recursive=True)
+        return files
+
     def scan_devlog_files(self) -> Dict[str, List[Path]]:
         """DevLog 폴더의 파일들을 카테고리별로 스캔"""
         result = {
@@ -34,27 +106,26 @@ class SummaryGenerator:
         # Agent Logs
         agent_log_dir = self.devlog_dir / "AgentLog"
         if agent_log_dir.exists():
-            for user_dir in sorted(agent_log_dir.iterdir()):
-                if user_dir.is_dir():
-                    for md_file in sorted(user_dir.glob("*.md"), reverse=True):
-                        result["agent"].append(md_file)
+            for user_dir in sorted(self.list_dir(agent_log_dir)[1]):
+                for md_file in sorted(self.list_md(user_dir), reverse=True):
+                    result["agent"].append(md_file)
 
         # Daily Logs
         daily_dir = self.devlog_dir / "Daily"
         if daily_dir.exists():
-            daily_files = sorted(daily_dir.glob("*.md"), reverse=True)
+            daily_files = sorted(self.list_md(daily_dir), reverse=True)
             result["daily"] = daily_files
 
         # Weekly Logs
         weekly_dir = self.devlog_dir / "Weekly"
         if weekly_dir.exists():
-            weekly_files = sorted(weekly_dir.glob("*.md"), reverse=True)
+            weekly_files = sorted(self.list_md(weekly_dir), reverse=True)
             result["weekly"] = weekly_files
 
         # Monthly Logs
         monthly_dir = self.devlog_dir / "Monthly"
         if monthly_dir.exists():
-            monthly_files = sorted(monthly_dir.glob("*.md"), reverse=True)
+            monthly_files = sorted(self.list_md(monthly_dir), reverse=True)
             result["monthly"] = monthly_files
 
         # Meta files (root level)
@@ -79,12 +150,12 @@ class SummaryGenerator:
             # Daily 회의록 스캔
             daily_dir = base_dir / "Daily"
             if daily_dir.exists():
-                result["daily"].extend(daily_dir.glob("*.md"))
+                result["daily"].extend(self.list_md(daily_dir))
 
             # Common 회의록 스캔
             common_dir = base_dir / "Common"
             if common_dir.exists():
-                result["common"].extend(common_dir.glob("*.md"))
+                result["common"].extend(self.list_md(common_dir))
 
         result["daily"] = sorted(list(set(result["daily"])), reverse=True)
         result["common"] = sorted(list(set(result["common"])), reverse=True)
@@ -113,7 +184,7 @@ class SummaryGenerator:
             "presentations": ["Presentation", "Weekly_Presentation"]
         }
 
-        for md_file in sorted(self.planning_dir.glob("**/*.md")):
+        for md_file in sorted(self.list_md(self.planning_dir, recursive=True)):
             # 하위 폴더 제외 여부 체크
             relative_path = md_file.relative_to(self.planning_dir)
 
@@ -141,12 +212,39 @@ class SummaryGenerator:
             return file_path.as_posix()
 
     def get_title_from_file(self, file_path: Path) -> str:
-        """MD 파일에서 제목 추출"""
+        """MD 파일에서 제목 추출 (mtime/크기 또는 내용 해시가 같으면 manifest 재사용)"""
+        key = file_path.as_posix()
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                first_line = f.readline().strip()
-                if first_line.startswith('#'):
-                    return first_line.lstrip('#').strip()
+            st = file_path.stat()
+        except OSError:
+            return file_path.stem
+        cached = self.manifest["titles"].get(key)
+        if cached and cached["mtime_ns"] == st.st_mtime_ns and cached["size"] == st.st_size:
+            self.stats["titles_reused"] += 1
+            return cached["title"]
+
+        try:
+            data = file_path.read_bytes()
+        except OSError:
+            return file_path.stem
+        digest = hashlib.sha1(data).hexdigest()
+        if cached and cached["hash"] == digest:
+            title = cached["title"]
+            self.stats["titles_reused"] += 1
+        else:
+            title = self.read_title(file_path, data)
+            self.stats["titles_read"] += 1
+        self.manifest["titles"][key] = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "hash": digest, "title": title}
+        return title
+
+    def read_title(self, file_path: Path, data: bytes = None) -> str:
+        """MD 파일 첫 줄에서 제목 읽기"""
+        try:
+            if data is None:
+                data = file_path.read_bytes()
+            first_line = data.split(b"\n", 1)[0].decode("utf-8").strip()
+            if first_line.startswith('#'):
+                return first_line.lstrip('#').strip()
         except:
             pass
 
@@ -197,6 +295,7 @@ class SummaryGenerator:
                 grouped[month_key].append(file)
         return grouped
 
+    @traced("summary.generate")
     def generate_summary(self) -> str:
         """SUMMARY.md 내용 생성"""
         lines = ["# Summary", "", "## Introduction", "* [시작하기](README.md)", ""]
@@ -307,28 +406,39 @@ class SummaryGenerator:
 
         return "\n".join(lines)
 
+    @traced("summary.write")
     def write_summary(self):
-        """SUMMARY.md 파일 작성"""
+        """SUMMARY.md 파일 작성 (내용이 같으면 건너뜀)"""
         summary_path = self.honkit_dir / "SUMMARY.md"
         content = self.generate_summary()
-
-        with open(summary_path, 'w', encoding='utf-8') as f:
-            f.write(content)
-
-        print(f"✅ SUMMARY.md generated successfully at {summary_path}")
-        print(f"📊 Total sections created")
+        if self.incremental:
+            self.save_manifest()
+            print(
+                f"📂 디렉터리 {self.stats['dirs_listed']}개 스캔 / {self.stats['dirs_reused']}개 재사용, "
+                f"제목 {self.stats['titles_read']}개 읽음 / {self.stats['titles_reused']}개 재사용"
+            )
+
+        if write_if_changed(summary_path, content):
+            print(f"✅ SUMMARY.md generated successfully at {summary_path}")
+            print(f"📊 Total sections created")
+        else:
+            print(f"⏭️ SUMMARY.md unchanged, skipped writing {summary_path}")
 
         # 레거시 호환: Documents/HonkitPage/SUMMARY.md 동기화
         legacy_dir = self.base_dir / "HonkitPage"
         legacy_summary_path = legacy_dir / "SUMMARY.md"
         if legacy_summary_path.exists() or legacy_dir.exists():
             legacy_dir.mkdir(parents=True, exist_ok=True)
-            with open(legacy_summary_path, 'w', encoding='utf-8') as legacy_file:
-                legacy_file.write(content)
-            print(f"🔁 Legacy SUMMARY.md synchronized at {legacy_summary_path}")
+            if write_if_changed(legacy_summary_path, content):
+                print(f"🔁 Legacy SUMMARY.md synchronized at {legacy_summary_path}")
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="HonKit SUMMARY.md Generator")
+    ap.add_argument("--base-dir", default="Documents", help="Documents 루트 디렉터리")
+    ap.add_argument("--full", action="store_true", help="manifest를 무시하고 전체 재스캔")
+    args = ap.parse_args(argv)
 
-def main():
-    generator = SummaryGenerator()
+    generator = SummaryGenerator(args.base_dir, incremental=not args.full)
     generator.write_summary()
 
 if __name__ == "__main__":
@@ -3,13 +3,21 @@
 from __future__ import annotations
 
 import argparse
-import json
 import os
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Iterable
-from urllib.error import HTTPError
 from urllib.parse import quote
-from urllib.request import Request, urlopen
+
+sys.path.insert(0, str(Path(__file__).resolve().parent / "devlog"))
+from http_client import HttpClient, HttpError, TokenBucket, shared_client  # noqa: E402
+from tracing import traced  # noqa: E402
+
+# Discord allows up to 10 embeds per webhook message.
+EMBEDS_PER_MESSAGE = 10
 
 
 def _load_files(manifest: Path) -> list[str]:
@@ -34,20 +42,92 @@ def _to_html_path(meeting_path: str) -> str:
     return "/".join(quote(part) for part in relative.split("/"))
 
 
-def _send_notification(webhook: str, content: str) -> None:
-    body = json.dumps({"content": content}, ensure_ascii=False).encode("utf-8")
-    request = Request(webhook, data=body, headers={"Content-Type": "application/json"})
-    with urlopen(request) as response:  # noqa: S310 - GitHub-hosted runner trusted URL
-        response.read()
-
-
-def _iter_messages(files: Iterable[str], base_url: str) -> Iterable[tuple[str, str]]:
+def _iter_messages(files: Iterable[str], base_url: str) -> Iterable[tuple[str, str, str]]:
     for path in files:
         title = path.split("/")[-1]
-        html_path = _to_html_path(path)
-        url = f"{base_url}/{html_path}"
-        content = f"📘 회의록 **{title}** 이(가) 업데이트되었습니다!\n🔗 {url}"
-        yield path, content
+        url = f"{base_url}/{_to_html_path(path)}"
+        yield path, title, url
+
+
+def _build_payloads(files: Iterable[str], base_url: str) -> list[tuple[list[str], dict]]:
+    """Group meeting updates into as few webhook payloads as Discord allows."""
+
+    messages = list(_iter_messages(files, base_url))
+    payloads: list[tuple[list[str], dict]] = []
+    for start in range(0, len(messages), EMBEDS_PER_MESSAGE):
+        batch = messages[start : start + EMBEDS_PER_MESSAGE]
+        paths = [path for path, _, _ in batch]
+        if len(batch) == 1:
+            _, title, url = batch[0]
+            payload = {"content": f"📘 회의록 **{title}** 이(가) 업데이트되었습니다!\n🔗 {url}"}
+        else:
+            payload = {
+                "content": f"📘 회의록 {len(batch)}건이 업데이트되었습니다!",
+                "embeds": [{"title": title, "url": url} for _, title, url in batch],
+            }
+        payloads.append((paths, payload))
+    return payloads
+
+
+@dataclass
+class _Result:
+    sent: list[str] = field(default_factory=list)
+    transient: list[str] = field(default_factory=list)
+    permanent: list[str] = field(default_factory=list)
+
+
+def _send(client: HttpClient, webhook: str, paths: list[str], payload: dict, bucket: TokenBucket, result: _Result) -> None:
+    label = paths[0] if len(paths) == 1 else f"{paths[0]} 외 {len(paths) - 1}건"
+    try:
+        client.post_json(webhook, payload, limiter=bucket)
+    except HttpError as exc:
+        print(f"❌ Discord 전송 실패 ({label}): {exc}")
+        if exc.transient:
+            result.transient.extend(paths)
+        else:
+            print("⚠️ 권한 또는 설정 문제로 인해 알림을 건너뜁니다.")
+            result.permanent.extend(paths)
+        return
+    result.sent.extend(paths)
+    print(f"📨 Discord 알림 전송 완료: {label}")
+
+
+@traced("notify.meetings")
+def dispatch(webhooks: list[str], payloads: list[tuple[list[str], dict]]) -> _Result:
+    """Send every payload to every webhook.
+
+    Messages to the same webhook go out in order through that webhook's token
+    bucket; independent webhooks are served concurrently.
+    """
+
+    client = shared_client()
+    result = _Result()
+
+    def run(webhook: str) -> None:
+        bucket = TokenBucket()
+        for paths, payload in payloads:
+            _send(client, webhook, paths, payload, bucket, result)
+
+    if len(webhooks) == 1:
+        run(webhooks[0])
+    else:
+        with ThreadPoolExecutor(max_workers=len(webhooks)) as pool:
+            list(pool.map(run, webhooks))
+    return result
+
+
+def _resolve_webhooks(explicit: list[str] | None) -> list[str]:
+    if explicit:
+        raw = " ".join(explicit)
+    else:
+        raw = (
+            os.environ.get("DISCORD_WEBHOOK_MEETING")
+            or os.environ.get("DISCORD_WEBHOOK_DEFAULT")
+            or os.environ.get("DISCORD_WEBHOOK")
+            or ""
+        )
+    # A variable may list several independent webhooks separated by commas or whitespace.
+    return list(dict.fromkeys(url for url in re.split(r"[\s,]+", raw) if url))
 
 
 def main() -> None:
@@ -58,35 +138,26 @@ def main() -> None:
         default="https://doppleddiggong.github.io/Onepiece/docs",
         help="Base URL for published HonKit documents",
     )
+    parser.add_argument(
+        "--webhook",
+        action="append",
+        help="Webhook URL (repeatable); defaults to the DISCORD_WEBHOOK_* environment variables",
+    )
     args = parser.parse_args()
 
-    webhook = (
-        os.environ.get("DISCORD_WEBHOOK_MEETING")
-        or os.environ.get("DISCORD_WEBHOOK_DEFAULT")
-        or os.environ.get("DISCORD_WEBHOOK")
-    )
-    if not webhook:
+    webhooks = _resolve_webhooks(args.webhook)
+    if not webhooks:
         print("⚠️ Discord 웹훅이 설정되지 않았습니다. 알림을 생략합니다.")
         return
 
     files = _load_files(args.manifest)
-    transient_errors: list[str] = []
-    for path, message in _iter_messages(files, args.base_url):
-        try:
-            _send_notification(webhook, message)
-            print(f"📨 Discord 알림 전송 완료: {path}")
-        except HTTPError as exc:
-            print(f"❌ Discord 전송 실패 ({path}): {exc.code} {exc.reason}")
-
-            if exc.code >= 500 or exc.code == 429:
-                transient_errors.append(path)
-            else:
-                print("⚠️ 권한 또는 설정 문제로 인해 알림을 건너뜁니다.")
-
-    if transient_errors:
+    payloads = _build_payloads(files, args.base_url)
+    result = dispatch(webhooks, payloads)
+
+    if result.transient:
         raise SystemExit(
             "일시적인 오류로 인해 일부 알림이 전송되지 않았습니다: "
-            + ", ".join(transient_errors)
+            + ", ".join(dict.fromkeys(result.transient))
         )
 
 
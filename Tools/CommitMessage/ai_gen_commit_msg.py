@@ -3,26 +3,38 @@ import os
 import subprocess
 import sys
 
-from dotenv import load_dotenv
-from openai import OpenAI
-
-print("RUNNING FILE:", __file__)
-print("PYTHON EXECUTABLE:", sys.executable)
-print("CWD:", os.getcwd())
-
 # ------------------------------------------------------------
-# 초기 설정: .env 로드 + OpenAI 클라이언트 준비
+# 초기 설정: .env 로드 + 공용 LLM 클라이언트 준비 (응답 캐시 공유)
+# 훅에서 바로 뜨도록 dotenv는 키 확인 시점에, LLM 클라이언트는 실제 요청 직전에 로드
 # ------------------------------------------------------------
 base_dir = os.path.dirname(os.path.abspath(__file__))
 env_path = os.path.join(base_dir, ".env")
-load_dotenv(env_path)
 
-api_key = os.getenv("OPENAI_API_KEY")
-if not api_key:
-    print("OPENAI_API_KEY가 설정되지 않았습니다. .env 파일을 확인하세요.")
-    sys.exit(1)
+_client = None
+_api_key = None
+
+def load_api_key():
+    # .env 로드 후 키 확인 (llm_client는 임포트하지 않음, .env는 한 번만 읽음)
+    global _api_key
+    if _api_key is None:
+        from dotenv import load_dotenv
+        load_dotenv(env_path)
+
+        _api_key = os.getenv("OPENAI_API_KEY")
+        if not _api_key:
+            print("OPENAI_API_KEY가 설정되지 않았습니다. .env 파일을 확인하세요.")
+            sys.exit(1)
+    return _api_key
 
-client = OpenAI(api_key=api_key)
+def get_client():
+    global _client
+    if _client is None:
+        sys.path.insert(0, os.path.join(base_dir, "..", "..", ".github", "scripts", "devlog"))
+        from llm_client import LLMClient
+
+        # --no-cache: 동일한 diff라도 새로 요청
+        _client = LLMClient(api_key=load_api_key(), cache="--no-cache" not in sys.argv)
+    return _client
 
 # ------------------------------------------------------------
 # Git diff
@@ -79,16 +91,13 @@ def ask_openai(diff_text):
     print("===== USER PROMPT =====".encode("utf-8", "ignore").decode("cp949", "ignore"))
     print(user_prompt.encode("utf-8", "ignore").decode("cp949", "ignore"))
 
-    res = client.chat.completions.create(
+    return get_client().complete(
+        system_prompt,
+        user_prompt,
         model="gpt-4.1-mini",
-        messages=[
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_prompt}
-        ],
         temperature=0.2,
         max_tokens=400
     )
-    return res.choices[0].message.content.strip()
 
 # ------------------------------------------------------------
 # 파일 저장 (UTF-8 BOM)
@@ -102,6 +111,13 @@ def save_message(content):
 # 메인
 # ------------------------------------------------------------
 def main():
+    print("RUNNING FILE:", __file__)
+    print("PYTHON EXECUTABLE:", sys.executable)
+    print("CWD:", os.getcwd())
+
+    # 키가 없으면 diff를 읽기 전에 종료 (기존 동작 유지)
+    load_api_key()
+
     start = os.getcwd()
     root = repo_root(start)
 
@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 import os, sys, subprocess, re, json, datetime
 
+from trends import compute_trends, render_trends
+
 # Simple fixed KST (+09:00) tzinfo
 class KST(datetime.tzinfo):
     def utcoffset(self, dt): return datetime.timedelta(hours=9)
@@ -51,15 +53,15 @@ def git_log_commits(root, since_iso, until_iso, no_merges=True):
     args = ["log"]
     if no_merges: args.append("--no-merges")
     args += [f"--since={since_iso}", f"--until={until_iso}", "--date=iso-strict",
-             "--pretty=format:%H|%ad|%an|%s%n%b", "--numstat"]
+             "--pretty=format:%H|%ad|%cd|%an|%s%n%b", "--numstat"]
     out = run_git(args, root)
     commits = []
     cur = None
     for line in out.splitlines():
-        m = re.match(r"^(?P<sha>[0-9a-f]{7,40})\|(?P<date>[^|]+)\|(?P<author>[^|]+)\|(?P<sub>.*)$", line)
+        m = re.match(r"^(?P<sha>[0-9a-f]{7,40})\|(?P<date>[^|]+)\|(?P<cdate>[^|]+)\|(?P<author>[^|]+)\|(?P<sub>.*)$", line)
         if m:
             if cur: commits.append(cur)
-            cur = {"sha":m.group('sha'),"date":m.group('date'),"author":m.group('author'),
+            cur = {"sha":m.group('sha'),"date":m.group('date'),"cdate":m.group('cdate'),"author":m.group('author'),
                    "subject":m.group('sub'),"body":[],"adds":0,"dels":0,"files":0}
             continue
         m2 = re.match(r"^(?P<adds>\d+|-)\t(?P<dels>\d+|-)\t(?P<path>.+)$", line)
@@ -79,6 +81,37 @@ def git_log_commits(root, since_iso, until_iso, no_merges=True):
         c["breaking"] = bool(re.search(r"(?i)breaking change", body_text))
     return commits
 
+def kst_devlog_date(date_iso):
+    # 커밋 시각이 속한 KST 09:00 경계 일자 (D-1 09:00 <= t < D 09:00 -> D)
+    # git의 --since/--until과 같은 기준을 쓰도록 커밋 시각(cdate)을 전달할 것
+    t = datetime.datetime.fromisoformat(date_iso).astimezone(KST())
+    return (t - datetime.timedelta(hours=9)).date() + datetime.timedelta(days=1)
+
+def bucket_commits_by_day(commits):
+    buckets = {}
+    for c in commits:
+        try:
+            d = kst_devlog_date(c['cdate'])
+        except ValueError:
+            continue
+        buckets.setdefault(d, []).append(c)
+    return buckets
+
+def backfill_days(root, dates, out_dir, tools_tpl, doc_tpl, no_merges=True):
+    # 누락된 날짜 전체를 git log 1회로 조회한 뒤 일자별로 나누어 렌더링
+    # (일자별 렌더링은 가벼운 순수 Python 작업이라 GIL 아래 스레드로는 빨라지지 않음)
+    missing = [d for d in dates if not os.path.isfile(os.path.join(out_dir, d.strftime('%Y-%m-%d') + '.md'))]
+    if not missing:
+        return 0
+    _, since_iso, _ = bounds_for_date_kst(min(missing))
+    _, _, until_iso = bounds_for_date_kst(max(missing))
+    buckets = bucket_commits_by_day(git_log_commits(root, since_iso, until_iso, no_merges))
+
+    work = [(d.strftime('%Y-%m-%d'), buckets[d]) for d in missing if buckets.get(d)]
+    for date_str, commits in work:
+        render_day_md(root, date_str, commits, os.path.join(out_dir, date_str + '.md'), tools_tpl, doc_tpl)
+    return len(work)
+
 def classify(subject):
     m = re.match(r"^(?P<type>[a-zA-Z]+)(\((?P<scope>[^)]+)\))?:\s*(?P<sub>.+)$", subject or "")
     ctype = (m.group('type') if m else '').lower()
@@ -214,30 +247,22 @@ def render_day_md(root, date_str, commits, out_path, template_tools, template_do
         json.dump(metrics, f, ensure_ascii=False, indent=2)
 
 def build_last30_summary(root, out_dir):
+    # 일자별 md를 다시 읽어 헤딩을 세는 대신 *.metrics.json 배열로 30/90/365일 추세 계산
     now = get_kst_now().date()
-    texts=[]
-    for i in range(30):
-        d = now - datetime.timedelta(days=i)
-        p = os.path.join(out_dir, d.strftime('%Y-%m-%d') + '.md')
-        if os.path.isfile(p):
-            with open(p,'r',encoding='utf-8', errors='ignore') as f:
-                texts.append(f.read())
-    if not texts: return
-    done=prog=need=todo=0
-    import re
-    for t in texts:
-        done += len(re.findall(r"(?m)^### Done", t))
-        prog += len(re.findall(r"(?m)^### In Progress", t))
-        need += len(re.findall(r"(?m)^### Needs Attention", t))
-        todo += len(re.findall(r"(?m)^- [ ] ", t))
+    trends = compute_trends(out_dir, now)
+    t30 = trends[30]
+    if not t30['days']: return
     lines=[f"## 30-Day Briefing {now.strftime('%Y-%m-%d')}", "",
            "### Overview / 개요",
-           f"- Daily files: {len(texts)} (last 30 days)",
-           f"- 일자 파일 수: {len(texts)} (최근 30일)",
-           f"- TODO outstanding (est.): {todo}",
-           f"- TODO 미완료(추정): {todo}",
-           "",
-           "### Suggested Focus / 권장 가이드(요약)",
+           f"- Active days: {t30['days']} (last 30 days)",
+           f"- 활동 일수: {t30['days']} (최근 30일)",
+           f"- Commits: {t30['commits']} | Changes: +{t30['adds']} / -{t30['dels']}",
+           f"- 커밋: {t30['commits']}개 | 변경 합계: +{t30['adds']} / -{t30['dels']}",
+           f"- TODO outstanding (est.): {t30['todos']}",
+           f"- TODO 미완료(추정): {t30['todos']}",
+           ""]
+    lines += render_trends(trends)
+    lines += ["### Suggested Focus / 권장 가이드(요약)",
            "1) Prioritize open TODOs and confirm schedule",
            "1) 미해결 TODO 우선 처리 및 일정 확인",
            "2) Review commit days with many in-progress items",
@@ -286,19 +311,10 @@ def main():
     # backfill
     if backfill > 0:
         now = get_kst_now().date()
-        for i in range(1, backfill+1):
-            d = now - datetime.timedelta(days=i)
-            if d < PROJECT_START_DATE:
-                continue # Don't backfill for dates before the project started
-
-            date_str, s_iso, e_iso = bounds_for_date_kst(d)
-            out_path = os.path.join(out_dir, date_str + '.md')
-            if os.path.isfile(out_path):
-                continue
-            
-            commits = git_log_commits(root, s_iso, e_iso, no_merges)
-            if commits:
-                render_day_md(root, date_str, commits, out_path, tools_tpl, doc_tpl)
+        dates = [now - datetime.timedelta(days=i) for i in range(1, backfill+1)]
+        # Don't backfill for dates before the project started
+        dates = [d for d in dates if d >= PROJECT_START_DATE]
+        backfill_days(root, dates, out_dir, tools_tpl, doc_tpl, no_merges)
 
     if build_summary:
         build_last30_summary(root, out_dir)
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# 일자별 *.metrics.json을 배열로 읽어 30/90/365일 추세를 계산 (Last30 요약용)
+# numpy가 있으면 벡터 연산, 없으면 동일한 결과의 순수 파이썬 경로 사용
+# numpy 임포트는 느려서 처음 추세를 계산할 때 로드 (False = 설치 안 됨)
+import os, json, datetime, math
+
+np = None
+
+def _numpy():
+    global np
+    if np is None:
+        try:
+            import numpy
+        except ImportError:
+            numpy = False
+        np = numpy
+    return np or None
+
+FIELDS = ('commits', 'adds', 'dels', 'files', 'todos')
+# generate_daily_devlog_bi / .github devlog 스크립트의 메트릭 키
+ALIASES = {
+    'commits': ('commits', 'commit_count'),
+    'adds': ('adds', 'additions'),
+    'dels': ('dels', 'deletions'),
+    'files': ('files', 'files_changed'),
+    'todos': ('todos',),
+}
+WINDOWS = (30, 90, 365)
+ROLLING = 7
+SIGMA = 3.0
+
+def _value(m, field):
+    for k in ALIASES[field]:
+        v = m.get(k)
+        if isinstance(v, (int, float)) and not isinstance(v, bool):
+            return v
+    return 0
+
+def load_series(out_dir, end, days):
+    # end 포함 최근 days일, 메트릭이 없는 날은 0 / present=False
+    dirs = [out_dir, os.path.join(out_dir, 'Daily')]
+    dates = [end - datetime.timedelta(days=days - 1 - i) for i in range(days)]
+    series = {f: [0] * days for f in FIELDS}
+    present = [False] * days
+    for i, d in enumerate(dates):
+        name = d.strftime('%Y-%m-%d') + '.metrics.json'
+        for base in dirs:
+            p = os.path.join(base, name)
+            if not os.path.isfile(p):
+                continue
+            try:
+                with open(p, 'r', encoding='utf-8') as f:
+                    m = json.load(f)
+            except (OSError, ValueError):
+                continue
+            for field in FIELDS:
+                series[field][i] = _value(m, field)
+            present[i] = True
+            break
+    if _numpy() is not None:
+        series = {f: np.asarray(v, dtype=float) for f, v in series.items()}
+        present = np.asarray(present, dtype=bool)
+    return dates, series, present
+
+def _percentile(values, q):
+    if not values: return 0.0
+    s = sorted(values)
+    k = (len(s) - 1) * q / 100.0
+    lo, hi = math.floor(k), math.ceil(k)
+    return s[lo] + (s[hi] - s[lo]) * (k - lo)
+
+def _stats_np(dates, s, present):
+    churn = s['adds'] + s['dels']
+    active = churn[present]
+    kernel = np.ones(ROLLING) / ROLLING
+    rolling = np.convolve(s['commits'], kernel, mode='valid') if len(s['commits']) >= ROLLING else np.array([])
+    this_w, prev_w = s['commits'][-7:].sum(), s['commits'][-14:-7].sum()
+    mu, sd = (active.mean(), active.std()) if active.size else (0.0, 0.0)
+    flags = np.nonzero(present & (sd > 0) & (churn > mu + SIGMA * sd))[0]
+    return {
+        'days': int(present.sum()),
+        'commits': int(s['commits'].sum()),
+        'adds': int(s['adds'].sum()), 'dels': int(s['dels'].sum()),
+        'todos': int(s['todos'].sum()),
+        'rolling7': float(rolling[-1]) if rolling.size else 0.0,
+        'wow': (float(this_w), float(prev_w)),
+        'churn_p50': float(np.percentile(active, 50)) if active.size else 0.0,
+        'churn_p90': float(np.percentile(active, 90)) if active.size else 0.0,
+        'anomalies': [(dates[i], int(churn[i])) for i in flags],
+        'threshold': float(mu + SIGMA * sd),
+    }
+
+def _stats_py(dates, s, present):
+    churn = [a + d for a, d in zip(s['adds'], s['dels'])]
+    active = [c for c, p in zip(churn, present) if p]
+    commits = s['commits']
+    this_w, prev_w = sum(commits[-7:]), sum(commits[-14:-7])
+    mu = sum(active) / len(active) if active else 0.0
+    sd = math.sqrt(sum((c - mu) ** 2 for c in active) / len(active)) if active else 0.0
+    return {
+        'days': sum(present),
+        'commits': int(sum(commits)),
+        'adds': int(sum(s['adds'])), 'dels': int(sum(s['dels'])),
+        'todos': int(sum(s['todos'])),
+        'rolling7': sum(commits[-ROLLING:]) / ROLLING if len(commits) >= ROLLING else 0.0,
+        'wow': (float(this_w), float(prev_w)),
+        'churn_p50': _percentile(active, 50),
+        'churn_p90': _percentile(active, 90),
+        'anomalies': [(d, int(c)) for d, c, p in zip(dates, churn, present) if p and sd > 0 and c > mu + SIGMA * sd],
+        'threshold': mu + SIGMA * sd,
+    }
+
+def compute_trends(out_dir, end, windows=WINDOWS):
+    # 가장 긴 구간을 한 번만 읽고, 짧은 구간은 끝부분을 잘라 사용
+    longest = max(windows)
+    dates, series, present = load_series(out_dir, end, longest)
+    result = {}
+    for w in windows:
+        sub = {f: v[-w:] for f, v in series.items()}
+        stats = _stats_np if _numpy() is not None else _stats_py
+        result[w] = stats(dates[-w:], sub, present[-w:])
+    return result
+
+def _delta(this_w, prev_w):
+    if not prev_w:
+        return "n/a"
+    return f"{(this_w - prev_w) / prev_w * 100:+.0f}%"
+
+def render_trends(trends):
+    lines = ["### Trends / 추세",
+             "| Window / 구간 | Active days / 활동일 | Commits / 커밋 | +/- | Churn p50 / p90 |",
+             "|---|---|---|---|---|"]
+    for w, t in sorted(trends.items()):
+        lines.append(f"| {w}d | {t['days']} | {t['commits']} | +{t['adds']} / -{t['dels']} | "
+                     f"{t['churn_p50']:.0f} / {t['churn_p90']:.0f} |")
+    t30 = trends[min(trends)]
+    this_w, prev_w = t30['wow']
+    lines += ["",
+              f"- 7-day rolling commits/day: {t30['rolling7']:.1f}",
+              f"- 최근 7일 평균 커밋/일: {t30['rolling7']:.1f}",
+              f"- Week over week commits: {this_w:.0f} vs {prev_w:.0f} ({_delta(this_w, prev_w)})",
+              f"- 전주 대비 커밋: {this_w:.0f} vs {prev_w:.0f} ({_delta(this_w, prev_w)})"]
+    if t30['anomalies']:
+        days = ", ".join(f"{d.strftime('%Y-%m-%d')} ({c})" for d, c in t30['anomalies'])
+        lines += [f"- Churn anomalies (> {SIGMA:.0f}σ, {t30['threshold']:.0f} lines): {days}",
+                  f"- 변경량 이상치 ({SIGMA:.0f}σ 초과): {days}"]
+    lines.append("")
+    return lines
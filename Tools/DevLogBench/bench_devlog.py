@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+# DevLog 생성기 벤치마크: git fast-import로 합성 저장소를 만들고 각 생성기를 종단/단계별로 측정
+#   python Tools/DevLogBench/bench_devlog.py --commits 10000,100000
+#   python Tools/DevLogBench/bench_devlog.py --commits 10000 --baseline Saved/DevLogBench/baseline.json
+# - 저장소는 파라미터 해시별로 Saved/DevLogBench/repos 아래에 캐시 (--regen으로 재생성)
+# - cold: Documents/DevLog, Saved/DevLog(커밋 캐시/인덱스/메트릭 DB)를 비운 상태, warm: 직전 실행 상태 유지
+# - 단계별 시간은 별도 cProfile 실행에서 DevLog 스크립트 함수의 누적 시간(cumtime)으로 산출
+import os, sys, json, time, random, shutil, hashlib, argparse, datetime, platform, subprocess, statistics, pstats
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+SCRIPTS = os.path.join(ROOT, '.github', 'scripts', 'devlog')
+TOOLS = os.path.join(ROOT, 'Tools', 'DevLog')
+BENCH_DIR = os.path.join(ROOT, 'Saved', 'DevLogBench')
+KST = datetime.timezone(datetime.timedelta(hours=9))
+
+TYPES = ('feat', 'fix', 'refactor', 'perf', 'docs', 'test', 'chore', 'style')
+TYPE_WEIGHTS = (30, 25, 15, 5, 8, 7, 8, 2)
+WORDS = ('Inventory', 'Combat', 'Damage', 'Ability', 'Camera', 'Input', 'Save', 'Network',
+         'Replication', 'Widget', 'Quest', 'Dialogue', 'Spawner', 'Loot', 'Audio', 'Physics')
+MODULES = ('Core', 'Character', 'Combat', 'UI', 'Network', 'AI', 'Animation', 'Audio',
+           'Save', 'Quest', 'World', 'Editor')
+
+# 생성기 이름 → (스크립트 경로, 인자 생성 함수(대상 날짜 = 이력의 마지막 날))
+GENERATORS = {
+    'daily': (os.path.join(SCRIPTS, 'build_daily_log.py'),
+              lambda d: ['--date', d.isoformat(), '--branch', 'main']),
+    'weekly': (os.path.join(SCRIPTS, 'generate_weekly.py'),
+               lambda d: ['--date', d.isoformat(), '--out', 'Documents/DevLog/Weekly/bench.md']),
+    'monthly': (os.path.join(SCRIPTS, 'generate_monthly.py'),
+                lambda d: ['--year', str(d.year), '--month', str(d.month), '--out', 'Documents/DevLog/Monthly/bench.md']),
+    'daily_bi': (os.path.join(TOOLS, 'generate_daily_devlog_bi.py'),
+                 lambda d: ['-BackfillDays', '30', '-BuildSummary']),
+}
+
+def git(args, cwd, **kw):
+    return subprocess.run(['git'] + args, cwd=cwd, check=True, stdout=subprocess.PIPE, text=True, **kw).stdout
+
+def author_mix(n):
+    # Zipf 분포: 소수 작성자가 대부분의 커밋을 작성
+    names = [f'Dev{i:02d}' for i in range(1, n + 1)]
+    return names, [1.0 / k for k in range(1, n + 1)]
+
+def _quote(path):
+    return '"' + path.replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+def _data(payload):
+    return b'data %d\n' % len(payload) + payload + b'\n'
+
+def _text_blob(rng):
+    lines = rng.randint(5, 30)
+    return ''.join(f'    {rng.choice(WORDS)}{rng.randint(0, 999)}();\n' for _ in range(lines)).encode()
+
+def write_stream(out, p, end):
+    # fast-import 스트림: 커밋마다 files_per_commit개 파일 변경 (binary_ratio는 .uasset, rename_ratio는 이름 변경)
+    rng = random.Random(p['seed'])
+    names, weights = author_mix(p['authors'])
+    pools = {False: [], True: []}  # 바이너리 여부 → 경로 목록
+    serial = 0
+    span = p['days'] * 86400
+    start = int(datetime.datetime.combine(end, datetime.time(0, 0), KST).timestamp()) - span
+    step = span / p['commits']
+
+    for i in range(p['commits']):
+        ts = start + int(i * step + rng.random() * step * 0.9)
+        author = rng.choices(names, weights)[0]
+        module = rng.choice(MODULES)
+        ctype = rng.choices(TYPES, TYPE_WEIGHTS)[0]
+        subject = f'{ctype}({module}): {rng.choice(("Add", "Fix", "Update", "Tune", "Clean up"))} {rng.choice(WORDS)} #{i}'
+        ops = []
+        touched = set()
+        for _ in range(p['files_per_commit']):
+            binary = rng.random() < p['binary_ratio']
+            pool = pools[binary]
+            if pool and rng.random() < p['rename_ratio']:
+                k = rng.randrange(len(pool))
+                old = pool[k]
+                if old in touched:
+                    continue
+                serial += 1
+                new = f"{old.rsplit('/', 1)[0]}/Renamed{serial}{os.path.splitext(old)[1]}"
+                pool[k] = new
+                touched.update((old, new))
+                ops.append(b'R %s %s\n' % (_quote(old).encode(), _quote(new).encode()))
+                continue
+            if pool and (len(pools[False]) + len(pools[True]) >= p['files'] or rng.random() < 0.8):
+                path = rng.choice(pool)
+            else:
+                serial += 1
+                mod = rng.choice(MODULES)
+                path = (f'Content/{mod}/SM_{rng.choice(WORDS)}{serial}.uasset' if binary
+                        else f'Source/Onepiece/{mod}/Private/{rng.choice(WORDS)}{serial}.cpp')
+                pool.append(path)
+            if path in touched:
+                continue
+            touched.add(path)
+            blob = rng.randbytes(rng.randint(512, 4096)) if binary else _text_blob(rng)
+            ops.append(b'M 100644 inline %s\n' % _quote(path).encode() + _data(blob))
+        who = f'{author} <{author.lower()}@example.com> {ts} +0900'.encode()
+        out.write(b'commit refs/heads/main\n')
+        out.write(b'author %s\ncommitter %s\n' % (who, who))
+        out.write(_data(subject.encode()))
+        out.write(b''.join(ops))
+        out.write(b'\n')
+
+def make_repo(path, p, end):
+    if os.path.isdir(path):
+        shutil.rmtree(path)
+    os.makedirs(path)
+    git(['init', '-q'], path)
+    git(['symbolic-ref', 'HEAD', 'refs/heads/main'], path)
+    t = time.perf_counter()
+    proc = subprocess.Popen(['git', 'fast-import', '--quiet'], cwd=path, stdin=subprocess.PIPE)
+    write_stream(proc.stdin, p, end)
+    proc.stdin.close()
+    if proc.wait() != 0:
+        raise SystemExit(f'git fast-import failed for {path}')
+    return time.perf_counter() - t
+
+def repo_for(p, end, regen):
+    key = hashlib.sha1(json.dumps([p, end.isoformat()], sort_keys=True).encode()).hexdigest()[:12]
+    path = os.path.join(BENCH_DIR, 'repos', f"c{p['commits']}-{key}")
+    marker = os.path.join(path, '.bench_ready')
+    if regen or not os.path.isfile(marker):
+        print(f"[bench] generating {p['commits']} commits -> {path}")
+        secs = make_repo(path, p, end)
+        print(f'[bench]   fast-import {secs:.1f}s')
+        with open(marker, 'w') as f:
+            f.write(str(secs))
+    return path
+
+def reset_state(repo):
+    for d in ('Documents', 'Saved'):
+        shutil.rmtree(os.path.join(repo, d), ignore_errors=True)
+
+def run_env(repo):
+    env = dict(os.environ)
+    env.pop('OPENAI_API_KEY', None)
+    env['DEVLOG_STATE_DIR'] = os.path.join(repo, 'Saved', 'DevLog')
+    env['PYTHONDONTWRITEBYTECODE'] = '1'
+    return env
+
+def run_once(repo, script, args, profile=None):
+    cmd = [sys.executable]
+    if profile:
+        cmd += ['-m', 'cProfile', '-o', profile]
+    cmd += [script] + args
+    t = time.perf_counter()
+    cp = subprocess.run(cmd, cwd=repo, env=run_env(repo), stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    secs = time.perf_counter() - t
+    if cp.returncode != 0:
+        raise SystemExit(f'{os.path.basename(script)} failed ({cp.returncode}):\n{cp.stderr[-2000:]}')
+    return secs
+
+def stages(profile, top):
+    # DevLog 스크립트(.github/scripts, Tools/DevLog)에 정의된 함수만 단계로 간주
+    st = pstats.Stats(profile)
+    rows = []
+    for (filename, line, func), (cc, nc, tt, ct, callers) in st.stats.items():
+        if not (filename.startswith(SCRIPTS) or filename.startswith(TOOLS)) or func == '<module>':
+            continue
+        rows.append({'stage': f'{os.path.basename(filename)}:{func}', 'seconds': round(ct, 4), 'calls': nc})
+    rows.sort(key=lambda r: -r['seconds'])
+    return rows[:top]
+
+def _summary(samples):
+    return {'median': round(statistics.median(samples), 4), 'min': round(min(samples), 4),
+            'runs': [round(s, 4) for s in samples]}
+
+def bench_generator(repo, name, end, repeat, top):
+    script, make_args = GENERATORS[name]
+    args = make_args(end)
+    cold, warm = [], []
+    for _ in range(repeat):
+        reset_state(repo)
+        cold.append(run_once(repo, script, args))
+        warm.append(run_once(repo, script, args))
+    reset_state(repo)
+    profile = os.path.join(BENCH_DIR, f'{name}.prof')
+    run_once(repo, script, args, profile=profile)
+    result = {'cold': _summary(cold), 'warm': _summary(warm), 'stages': stages(profile, top)}
+    os.remove(profile)
+    return result
+
+def compare(results, baseline, threshold, min_delta):
+    # 시나리오/생성기/모드별 중앙값 비교, threshold(%)와 min_delta(초)를 모두 넘게 느려지면 회귀로 표시
+    regressions = []
+    print(f"\n{'scenario':<10} {'generator':<10} {'mode':<5} {'base(s)':>9} {'now(s)':>9} {'delta':>8}")
+    for scenario, gens in results.items():
+        for name, r in gens.items():
+            for mode in ('cold', 'warm'):
+                base = baseline.get('results', {}).get(scenario, {}).get(name, {}).get(mode, {}).get('median')
+                now = r[mode]['median']
+                if not base:
+                    print(f'{scenario:<10} {name:<10} {mode:<5} {"-":>9} {now:>9.3f} {"new":>8}')
+                    continue
+                delta = (now - base) / base * 100
+                flag = ' !' if delta > threshold and now - base > min_delta else ''
+                print(f'{scenario:<10} {name:<10} {mode:<5} {base:>9.3f} {now:>9.3f} {delta:>+7.1f}%{flag}')
+                if flag:
+                    regressions.append(f'{scenario}/{name}/{mode} {delta:+.1f}%')
+    return regressions
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='DevLog pipeline benchmark on synthetic git repositories')
+    ap.add_argument('--commits', default='10000,100000', help='시나리오별 커밋 수 (쉼표 구분)')
+    ap.add_argument('--files-per-commit', type=int, default=4)
+    ap.add_argument('--files', type=int, default=3000, help='저장소 파일 수 목표')
+    ap.add_argument('--binary-ratio', type=float, default=0.2, help='.uasset 변경 비율')
+    ap.add_argument('--rename-ratio', type=float, default=0.01)
+    ap.add_argument('--authors', type=int, default=8, help='작성자 수 (Zipf 분포)')
+    ap.add_argument('--days', type=int, default=365, help='이력 기간 (오늘까지)')
+    ap.add_argument('--seed', type=int, default=1)
+    ap.add_argument('--generators', default=','.join(GENERATORS), help='측정할 생성기 (쉼표 구분)')
+    ap.add_argument('--repeat', type=int, default=3)
+    ap.add_argument('--top', type=int, default=12, help='단계별 결과 개수')
+    ap.add_argument('--out', default=os.path.join(BENCH_DIR, 'results.json'))
+    ap.add_argument('--baseline', help='비교할 이전 결과 JSON')
+    ap.add_argument('--threshold', type=float, default=10.0, help='회귀 판정 기준 (%%)')
+    ap.add_argument('--min-delta', type=float, default=0.05, help='회귀 판정 최소 차이 (초, 짧은 실행의 잡음 제외)')
+    ap.add_argument('--fail-on-regression', action='store_true')
+    ap.add_argument('--regen', action='store_true', help='캐시된 합성 저장소 재생성')
+    args = ap.parse_args(argv)
+
+    names = [g for g in args.generators.split(',') if g]
+    unknown = set(names) - set(GENERATORS)
+    if unknown:
+        ap.error(f'unknown generators: {", ".join(sorted(unknown))}')
+    # 이력은 오늘 00:00 KST에 끝나고, 날짜 기반 생성기는 어제를 대상으로 실행
+    end = datetime.datetime.now(KST).date()
+    target = end - datetime.timedelta(days=1)
+    os.makedirs(BENCH_DIR, exist_ok=True)
+
+    results = {}
+    params = {}
+    for commits in [int(c) for c in args.commits.split(',') if c]:
+        p = {'commits': commits, 'files_per_commit': args.files_per_commit, 'files': args.files,
+             'binary_ratio': args.binary_ratio, 'rename_ratio': args.rename_ratio,
+             'authors': args.authors, 'days': args.days, 'seed': args.seed}
+        scenario = f'{commits}c'
+        params[scenario] = p
+        repo = repo_for(p, end, args.regen)
+        results[scenario] = {}
+        for name in names:
+            print(f'[bench] {scenario} {name} x{args.repeat}')
+            r = results[scenario][name] = bench_generator(repo, name, target, args.repeat, args.top)
+            print(f"[bench]   cold {r['cold']['median']:.3f}s  warm {r['warm']['median']:.3f}s")
+
+    report = {
+        'meta': {'date': target.isoformat(), 'python': platform.python_version(), 'platform': platform.platform(),
+                 'git': git(['--version'], ROOT).strip(), 'repeat': args.repeat},
+        'params': params,
+        'results': results,
+    }
+    os.makedirs(os.path.dirname(os.path.abspath(args.out)), exist_ok=True)
+    with open(args.out, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f'[bench] results -> {args.out}')
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            regressions = compare(results, json.load(f), args.threshold, args.min_delta)
+        if regressions:
+            print('[bench] regressions: ' + ', '.join(regressions))
+            if args.fail_on_regression:
+                return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# 진입점 임포트 시간 예산 검사: `python -X importtime`으로 각 스크립트 모듈의 누적 임포트 시간을 재고 예산 초과 시 실패
+#   python Tools/DevLogBench/import_budget.py
+#   python Tools/DevLogBench/import_budget.py --only gen_commit_msg,ai_gen_commit_msg --detail 8
+#   python Tools/DevLogBench/import_budget.py --scale 1.5   # CI/공유 러너 (.github/workflows/import-budget.yml)
+# - 측정값은 모듈 자체의 cumulative(µs, 하위 임포트 포함), 인터프리터 기동/site는 제외하고 별도 표시
+# - 첫 실행(.pyc 생성)은 버리고 --repeat회 중 최솟값 사용 (잡음 제거)
+# - 무거운 의존성(jinja2, openai, tiktoken, numpy, dotenv 등)은 실제로 쓰는 함수 안에서 임포트해야 예산 안에 들어옴
+import os, sys, json, argparse, subprocess
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+BENCH_DIR = os.path.join(ROOT, 'Saved', 'DevLogBench')
+SCRIPTS = os.path.join('.github', 'scripts')
+DEVLOG = os.path.join(SCRIPTS, 'devlog')
+
+# 이름 → (sys.path에 넣을 디렉토리, 모듈, 예산 ms)
+# 예산은 개발 PC 측정값의 약 2배: 측정 잡음에는 통과하고, openai(~900ms)처럼 무거운 의존성을
+# 모듈 최상단에서 임포트하면 실패 (CI는 --scale 1.5로 실행)
+# 커밋 훅 도구는 수십 ms 안에 떠야 하므로 가장 엄격하게 잡음 (~25ms, llm_client 임포트 시 ~55ms)
+ENTRY_POINTS = {
+    'gen_commit_msg': (os.path.join('Tools', 'CommitMessage'), 'gen_commit_msg', 50),
+    'ai_gen_commit_msg': (os.path.join('Tools', 'CommitMessage'), 'ai_gen_commit_msg', 50),
+    'devlog_cli': (SCRIPTS, 'devlog.__main__', 50),
+    'build_daily_log': (DEVLOG, 'build_daily_log', 140),
+    'generate_daily': (DEVLOG, 'generate_daily', 140),
+    'generate_weekly': (DEVLOG, 'generate_weekly', 140),
+    'generate_weekly_gpt': (DEVLOG, 'generate_weekly_gpt', 140),
+    'generate_weekly_feedback': (DEVLOG, 'generate_weekly_feedback', 140),
+    'generate_gpt_feedback': (DEVLOG, 'generate_gpt_feedback', 140),
+    'generate_monthly': (DEVLOG, 'generate_monthly', 140),
+    'update_devlog': (DEVLOG, 'update_devlog', 140),
+    'send_discord': (DEVLOG, 'send_discord', 140),
+    'generate_summary': (SCRIPTS, 'generate_summary', 100),
+    'send_meeting_notifications': (SCRIPTS, 'send_meeting_notifications', 180),
+    'generate_daily_devlog_bi': (os.path.join('Tools', 'DevLog'), 'generate_daily_devlog_bi', 100),
+}
+
+def parse_importtime(stderr):
+    # "import time: self [us] | cumulative | imported package" → [(depth, 모듈, self, cumulative)]
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        parts = line[len('import time:'):].split('|')
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue
+        name = parts[2][1:]
+        depth = (len(name) - len(name.lstrip())) // 2
+        rows.append((depth, name.strip(), int(parts[0]), int(parts[1])))
+    return rows
+
+def measure_once(path, module):
+    env = dict(os.environ)
+    # 측정 중 trace 기록/출력이 섞이지 않도록 비활성화
+    env.pop('DEVLOG_TRACE', None)
+    code = f'import sys; sys.path.insert(0, {os.path.join(ROOT, path)!r}); import {module}'
+    cp = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], cwd=ROOT, env=env,
+                        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    rows = parse_importtime(cp.stderr)
+    top = [r for r in rows if r[0] == 0 and r[1] == module]
+    if cp.returncode != 0 or not top:
+        tail = cp.stderr.strip().splitlines()[-1:] or ['no importtime output']
+        raise RuntimeError(f'{module}: import failed ({tail[0]})')
+    # 모듈의 직계 하위 임포트(depth 1) 중 무거운 것 (임포트 순서상 모듈 줄 바로 앞에 나열됨)
+    end = rows.index(top[0])
+    start = end
+    while start > 0 and rows[start - 1][0] > 0:
+        start -= 1
+    children = [(name, cum) for depth, name, _, cum in rows[start:end] if depth == 1]
+    interpreter = sum(cum for depth, name, _, cum in rows[:start] if depth == 0)
+    return top[0][3], interpreter, children
+
+def measure(path, module, repeat):
+    measure_once(path, module)  # .pyc 생성 등 첫 실행 비용 제외
+    best = None
+    for _ in range(max(1, repeat)):
+        sample = measure_once(path, module)
+        if best is None or sample[0] < best[0]:
+            best = sample
+    return best
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Check DevLog / commit hook entry points against an import-time budget')
+    ap.add_argument('--only', help='측정할 진입점 (쉼표 구분, 기본 전체)')
+    ap.add_argument('--repeat', type=int, default=5)
+    ap.add_argument('--scale', type=float, default=1.0, help='예산 배율 (느린 러너 보정, CI에서는 1.5 권장)')
+    ap.add_argument('--detail', type=int, default=3, help='진입점별로 표시할 무거운 하위 임포트 수')
+    ap.add_argument('--out', default=os.path.join(BENCH_DIR, 'import_budget.json'))
+    args = ap.parse_args(argv)
+
+    names = [n for n in (args.only or '').split(',') if n] or list(ENTRY_POINTS)
+    unknown = set(names) - set(ENTRY_POINTS)
+    if unknown:
+        ap.error(f'unknown entry points: {", ".join(sorted(unknown))}')
+
+    results = {}
+    over = []
+    print(f"{'entry point':<28}{'import ms':>10}{'budget':>8}  heaviest imports")
+    for name in names:
+        path, module, budget = ENTRY_POINTS[name]
+        budget *= args.scale
+        try:
+            cum, interpreter, children = measure(path, module, args.repeat)
+        except RuntimeError as e:
+            print(f'{name:<28}{"error":>10}{budget:>8.0f}  {e}')
+            results[name] = {'module': module, 'budget_ms': budget, 'error': str(e)}
+            over.append(name)
+            continue
+        ms = cum / 1000
+        heavy = sorted(children, key=lambda c: -c[1])[:args.detail]
+        mark = '' if ms <= budget else '  ❌ over budget'
+        print(f'{name:<28}{ms:>10.1f}{budget:>8.0f}  '
+              + ', '.join(f'{n} {c / 1000:.1f}' for n, c in heavy) + mark)
+        results[name] = {'module': module, 'import_ms': round(ms, 1), 'budget_ms': budget,
+                         'interpreter_ms': round(interpreter / 1000, 1),
+                         'heaviest': [{'module': n, 'ms': round(c / 1000, 1)} for n, c in heavy]}
+        if ms > budget:
+            over.append(name)
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.out)), exist_ok=True)
+    with open(args.out, 'w', encoding='utf-8') as f:
+        json.dump({'python': sys.version.split()[0], 'repeat': args.repeat, 'results': results},
+                  f, ensure_ascii=False, indent=2)
+    print(f'[import-budget] results -> {args.out}')
+
+    if over:
+        print('[import-budget] over budget: ' + ', '.join(over))
+        return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())